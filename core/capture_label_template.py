@@ -0,0 +1,40 @@
+"""
+Script to bootstrap UI label templates from a successful OCR hit and save them to assets/templates.
+Open the screen showing the label (e.g. the shop for "SELL") and run:
+    python -m core.capture_label_template SELL shop
+"""
+
+import sys
+import time
+from utils.general_utils import capture_region, find_text_locations, enable_logging
+from utils.template_utils import save_label_template
+
+
+def capture_label_template(label, region=None, delay=3):
+    """
+    OCRs the region once and saves the matched label as a template.
+    Args:
+        label (str): UI label to capture, e.g. "SELL".
+        region (str, optional): Game window region the label appears in.
+        delay (int): Seconds to wait so the game window can be brought to front.
+    Returns:
+        str or None: Path of the saved template, or None if OCR did not find the label.
+    """
+    time.sleep(delay)
+    img, origin = capture_region(region)
+    img = img.copy()
+    box = find_text_locations((label,), img=img, origin=origin)[label]
+    if not box:
+        print(f"[ERROR] OCR did not find '{label}' on screen.")
+        return None
+    path = save_label_template(label, img, box, origin)
+    print(f"[INFO] Template saved to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    enable_logging()
+    if len(sys.argv) < 2:
+        print("Usage: python -m core.capture_label_template LABEL [REGION]")
+        sys.exit(1)
+    capture_label_template(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
@@ -12,6 +12,10 @@ import core
 # ===========================
 LEAGUE_CLIENT_WINDOW_TITLE = "League of Legends"
 LEAGUE_GAME_WINDOW_TITLE = "League of Legends (TM) Client"
+WINDOW_POLL_INTERVAL = 0.25  # seconds between window lookups while waiting for a window
+GAME_LOOP_STOP_TIMEOUT = 5.0  # seconds to wait for the game loop thread to exit
+GAME_LOOP_MAX_RESTARTS = 3  # watchdog restarts of a crashing game loop per game
+GAME_LOOP_RESTART_BACKOFF = 5.0  # seconds before the first restart; doubles per crash
 
 SUPPORTED_MODES = {
     "arena": {
@@ -40,6 +44,20 @@ PLAYER_HEALTH_BAR_COLOR = (107, 217, 99) # Green
 ENEMY_HEALTH_BAR_COLOR = (101, 112, 200) # Red
 ALLY_HEALTH_BAR_COLOR = (242, 189, 110)  # Blue
 
+# Health bar classes detected in a single pass
+HEALTH_BAR_CLASSES = {
+    "enemy": ENEMY_HEALTH_BAR_COLOR,
+    "ally": ALLY_HEALTH_BAR_COLOR,
+    "player": PLAYER_HEALTH_BAR_COLOR,
+}
+
+# Health bar geometry (pixels)
+HEALTH_TICK_SEARCH_WIDTH = 100           # Max distance from bar pixel to a tick on the same row
+HEALTH_BAR_CHAMPION_OFFSET_Y = 160       # Champion body sits this far below its health bar
+HEALTH_BAR_FULL_WIDTH = 105              # Width of a full champion health bar at 1080p
+HEALTH_BAR_REFERENCE_HEIGHT = 1080       # Window height the health bar geometry was measured at
+HEALTH_TICK_MAX_WIDTH = 2                # Widest tick gap merged when measuring the filled run
+
 
 # ===========================
 # League APIs
@@ -50,6 +68,9 @@ DEFAULT_API_TIMEOUT = 60
 
 # LiveClientData
 LIVE_CLIENT_URL = "https://127.0.0.1:2999/liveclientdata"
+LIVE_CLIENT_TIMEOUT = (0.5, 1.0)      # (connect, read) seconds; the API is local
+LIVE_CLIENT_MAX_BACKOFF = 2.0         # Max seconds between polls while the game is loading
+LIVE_CLIENT_STOP_CHECK = 0.1          # Max seconds before the poller notices an external stop event
 
 # LCU
 LCU_MATCHMAKING_READY_CHECK = "/lol-matchmaking/v1/ready-check"
@@ -63,20 +84,39 @@ LCU_CHAMPIONS_MINIMAL = "/lol-champions/v1/inventories/{summoner_id}/champions-m
 GAMEFLOW_PHASES = {
     "NONE": "None",
     "LOBBY": "Lobby",
+    "MATCHMAKING": "Matchmaking",
     "READY_CHECK": "ReadyCheck",
     "CHAMP_SELECT": "ChampionSelect",
     "GAME_START": "GameStart",
     "IN_PROGRESS": "InProgress",
     "PRE_END_OF_GAME": "PreEndOfGame",
     "END_OF_GAME": "EndOfGame",
+    "WAITING_FOR_STATS": "WaitingForStats",
 }
+# Expected seconds per gameflow phase before the watchdog starts recovery
+GAMEFLOW_PHASE_BUDGETS = {
+    "None": 15,
+    "Lobby": 20,
+    "Matchmaking": 900,
+    "ReadyCheck": 15,
+    "ChampionSelect": 240,
+    "GameStart": 180,
+    "InProgress": 3600,
+    "PreEndOfGame": 60,
+    "EndOfGame": 30,
+    "WaitingForStats": 90,
+}
+GAMEFLOW_WATCHDOG_INTERVAL = 5  # seconds between watchdog checks
 CHAMP_SELECT_SUBPHASES = {
     "BAN_PICK": "BAN_PICK"
 }
+BRAVERY_CHAMPION_ID = -3  # Arena "Bravery" random pick
 
 # Data Dragon
 DATA_DRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
 DATA_DRAGON_DEFAULT_LOCALE = "en_US"
+DATA_DRAGON_CDN_URL = "https://ddragon.leagueoflegends.com/cdn"
+DATA_DRAGON_VERSION_TTL = 6 * 60 * 60  # seconds before the latest patch version is looked up again
 
 
 # ===========================
@@ -88,12 +128,34 @@ SCREEN_WIDTH = win32api.GetSystemMetrics(0)
 SCREEN_HEIGHT = win32api.GetSystemMetrics(1)
 SCREEN_CENTER = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
+# Named capture regions as (left, top, width, height) fractions of the game window
+SCREEN_REGIONS = {
+    "full": (0.0, 0.0, 1.0, 1.0),
+    "play_field": (0.0, 0.0, 1.0, 0.8),      # Everything above the bottom HUD
+    "shop": (0.1, 0.05, 0.8, 0.9),           # Shop panel incl. the SELL button
+    "exit_button": (0.2, 0.2, 0.6, 0.7),     # Death screen exit buttons
+}
+
 # ===========================
 # OCR Configuration
 # ===========================
 
 # Tesseract OCR executable path
 TESSERACT_PATH = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+TESSDATA_PATH = r'C:\Program Files\Tesseract-OCR\tessdata'
+
+# Tesseract page segmentation mode (11 = sparse text)
+OCR_PSM = 11
+
+# Asynchronous OCR worker processes and how long the shop waits for a result (seconds)
+OCR_WORKERS = 2
+SHOP_OCR_TIMEOUT = 3
+
+# Min padding (pixels) around a remembered text location when re-OCRing only that crop
+OCR_LAYOUT_MARGIN = 20
+
+# Minimum normalized correlation for a UI label template match to skip OCR
+LABEL_TEMPLATE_THRESHOLD = 0.8
 
 
 
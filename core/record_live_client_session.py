@@ -0,0 +1,61 @@
+"""
+Script to record a whole game of Live Client responses for offline replay and save it to the recordings folder.
+Start it before or during a game and stop it with Ctrl+C (it also stops on the GameEnd event):
+    python -m core.record_live_client_session [FILE]
+"""
+
+import os
+import sys
+import threading
+import time
+from utils.general_utils import enable_logging
+from utils.live_client_utils import LiveClientPoller, EventIngestor
+from utils.replay_utils import SessionRecorder
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "..", "recordings")
+
+
+def record_live_client_session(output_file=None, interval=0.2, player_list_interval=1.0, event_interval=1.0):
+    """
+    Records activeplayer, playerlist and eventdata responses until the game ends.
+    Args:
+        output_file (str, optional): File name inside the recordings folder; timestamped by default.
+        interval (float): activeplayer poll interval in seconds.
+        player_list_interval (float): playerlist poll interval in seconds.
+        event_interval (float): eventdata poll interval in seconds.
+    Returns:
+        str: Path of the recording.
+    """
+    if output_file is None:
+        output_file = time.strftime("session_%Y%m%d_%H%M%S.lcrec")
+    path = os.path.join(RECORDINGS_DIR, output_file)
+
+    stop_event = threading.Event()
+    poller = LiveClientPoller()
+    recorder = SessionRecorder(path)
+    recorder.attach(poller)
+    poller.subscribe("activeplayer", interval)
+    poller.subscribe("playerlist", player_list_interval)
+
+    def on_new_events(events):
+        if any(event.name == "GameEnd" for event in events):
+            stop_event.set()
+
+    EventIngestor(poller, interval=event_interval, callback=on_new_events)
+
+    print(f"[INFO] Recording to {path} (Ctrl+C to stop)")
+    poller.start(stop_event)
+    try:
+        while not stop_event.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        pass
+    poller.close()
+    recorder.close()
+    print(f"[INFO] Saved {recorder.records} responses to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    enable_logging()
+    record_live_client_session(sys.argv[1] if len(sys.argv) > 1 else None)
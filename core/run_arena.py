@@ -8,16 +8,25 @@ import keyboard
 import logging
 
 from core.constants import (
-    HEALTH_TICK_COLOR, ENEMY_HEALTH_BAR_COLOR, SCREEN_CENTER
+    HEALTH_TICK_COLOR, ENEMY_HEALTH_BAR_COLOR
 )
-from utils.config_utils import load_settings
-from utils.general_utils import click_on_cursor, click_percent, poll_live_client_data, find_text_location
+from utils.config_utils import watch_settings, get_config
+from utils.general_utils import (
+    click_on_cursor, click_percent, get_window_center
+)
+from utils.live_client_utils import (
+    LiveClientPoller, SnapshotPublisher, StateChangeBus, EventIngestor, drain_queue,
+    LEVEL_GAINED, DIED, RESPAWNED, GAME_ENDED
+)
+from utils.template_utils import find_label_locations, submit_label_ocr
+from utils.ocr_utils import get_ocr_service
 from utils.game_utils import (
     get_distance,
     move_random_offset,
     move_to_ally,
-    find_champion_location,
+    ChampionTracker,
     buy_recommended_items,
+    reset_shop_search,
     level_up_abilities,
     retreat_to_ally,
     sleep_random,
@@ -28,32 +37,79 @@ from utils.game_utils import (
 # Initialization
 # ===========================
 
-_keybinds, _general = load_settings()
-_latest_game_data = {'data': None}
+_keybinds, _general = {}, {}
+
+
+def _apply_settings(keybinds, general):
+    global _keybinds, _general
+    _keybinds, _general = keybinds, general
+
+
+watch_settings(_apply_settings)
+
+_state_changes = StateChangeBus()
+_live_client = None
+_snapshots = None
+_events = None
+
+
+def _on_new_events(events):
+    if any(event.name == "GameEnd" for event in events):
+        _state_changes.end_game("GameEnd event")
+
+
+def _bind_live_client(live_client):
+    """
+    Subscribes the snapshot publisher and event ingestor to a poller.
+    Args:
+        live_client (BaseLiveClientPoller): Threaded or asyncio poller.
+    """
+    global _live_client, _snapshots, _events
+    if _live_client is not None and _live_client is not live_client:
+        _live_client.unsubscribe("activeplayer")
+        _live_client.unsubscribe("playerlist")
+        _live_client.unsubscribe("eventdata")
+    _live_client = live_client
+    _snapshots = SnapshotPublisher(live_client, interval=0.2, callback=_state_changes.process)
+    _events = EventIngestor(live_client, interval=1.0, callback=_on_new_events)
+
+
+_state_queue = _state_changes.subscribe_queue((LEVEL_GAINED, DIED, RESPAWNED, GAME_ENDED))
+_enemy_tracker = ChampionTracker(ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR, region="play_field", prefer_low_hp=True)
+_pending_exit_ocr = None
+
+EXIT_LABELS = ("EXITNOW", "EXIT")
 
 
 # ===========================
 # Arena Phase Functions
 # ===========================
 
-def shop_phase():
+def shop_phase(first_poll=True):
     """
-    Handles the Arena shop phase which is detected upon level up
+    Handles the Arena shop phase which is detected upon level up.
+    Called once per game loop iteration until it returns True, so the loop
+    never waits on shop OCR.
+    Args:
+        first_poll (bool): Whether this is the first call for this level up.
+    Returns:
+        bool: True once the shop phase is done.
     """
-    # Click screen center in case of augment card
-    click_percent(SCREEN_CENTER[0], SCREEN_CENTER[1])
+    if first_poll:
+        # Click screen center in case of augment card
+        click_percent(*get_window_center())
+        time.sleep(0.5)  # Wait a moment to ensure shop is open
 
-    # Buy recommended items
-    buy_recommended_items()
-
-    # Level up abilities
-    level_up_abilities()
+    done = buy_recommended_items()
+    if first_poll:
+        level_up_abilities()  # While the shop OCR submitted above runs
+    return done
 
 
 def combat_phase():
     """
     Handles the combat phase:
-    - Finds enemy champion location and attacks w/ spells and items
+    - Finds enemy champion location (the lowest-HP one when picking a new target) and attacks w/ spells and items
     - If no enemy found, find and move toward ally
     """
 
@@ -62,13 +118,13 @@ def combat_phase():
     time.sleep(0.1)
     keyboard.release(center_camera_key)
 
-    enemy_location = find_champion_location(ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR)
+    enemy_location = _enemy_tracker.update()
     if enemy_location:
         # Move to enemy
         click_percent(enemy_location[0], enemy_location[1], 0, 0, "right")
     
         # When within combat distance
-        distance_to_enemy = get_distance(SCREEN_CENTER, enemy_location)
+        distance_to_enemy = get_distance(get_window_center(), enemy_location)
         if distance_to_enemy < 600:
             keyboard.send(_keybinds.get("spell_4"))
             keyboard.send(_keybinds.get("spell_1"))
@@ -84,66 +140,132 @@ def combat_phase():
             move_random_offset(*enemy_location, 15)
             sleep_random(0.1, 0.3)
             # Self preservation
-            if _latest_game_data['data']:
-                current_hp = _latest_game_data['data']["activePlayer"].get("championStats", {}).get("currentHealth")
-                max_hp = _latest_game_data['data']["activePlayer"].get("championStats", {}).get("maxHealth")
-                if current_hp is not None and max_hp:
-                    hp_percent = (current_hp / max_hp)
-                    if hp_percent < .3:
-                        retreat_to_ally()
-                        if(hp_percent == 0):
-                            return
+            snapshot = _snapshots.latest()
+            hp_percent = snapshot.hp_fraction if snapshot else None
+            if hp_percent is not None and hp_percent < .3:
+                retreat_to_ally()
+                if(hp_percent == 0):
+                    return
     else:
         # Move to ally
         move_to_ally(1)
         sleep_random(0, 0.3)
 
+def find_exit_button():
+    """
+    Looks for the death screen exit button without blocking the game loop.
+    Tries the label templates first; otherwise submits OCR to the worker pool
+    and picks up the result on a later iteration.
+    Returns:
+        tuple or None: (x, y, w, h) if found, else None.
+    """
+    global _pending_exit_ocr
+    exit_boxes = find_label_locations(EXIT_LABELS, region="exit_button", fallback_ocr=False)
+    exit_box = exit_boxes["EXITNOW"] or exit_boxes["EXIT"]
+    if exit_box:
+        return exit_box
+
+    if _pending_exit_ocr is not None and _pending_exit_ocr.done():
+        future, _pending_exit_ocr = _pending_exit_ocr, None
+        if not future.cancelled() and future.exception() is None:
+            exit_boxes = future.result()
+            exit_box = exit_boxes["EXITNOW"] or exit_boxes["EXIT"]
+            if exit_box:
+                return exit_box
+    if _pending_exit_ocr is None:
+        _pending_exit_ocr = submit_label_ocr("exit_button", EXIT_LABELS, region="exit_button")
+    return None
+
+
 # ===========================
 # Main Bot Loop
 # ===========================
 
-def run_game_loop(stop_event):
+def run_game_loop(stop_event, live_client=None):
     """
     Main loop for Arena bot:
-    - Waits for GameStart event before starting main loop
-    - Runs shop phase when the active player's level increases (phase change)
+    - Reacts to state changes derived from consecutive game snapshots
+    - Runs shop phase for every level gained (phase change)
+    - Looks for the exit button while dead
     - Otherwise runs combat phase
-    - Exits when monitor_game_end detects game end
+    - Exits when stop_event is set or the game ends
+    Args:
+        stop_event (threading.Event): Stops the loop when set.
+        live_client (AsyncLiveClientPoller, optional): Poller already running on the
+            lcu_driver event loop; a threaded LiveClientPoller is started if None.
     """
 
     # Game initialization
-    polling_thread = threading.Thread(target=poll_live_client_data, args=(_latest_game_data, stop_event), daemon=True)
-    polling_thread.start()
-    prev_level = 0
+    owns_poller = live_client is None
+    _bind_live_client(live_client or LiveClientPoller())
+    _live_client.clear()
+    _state_changes.reset()
+    _enemy_tracker.reset(clear_stats=True)
+    reset_shop_search()
+    get_ocr_service().warm_up()
+    drain_queue(_state_queue)
+    if owns_poller:
+        _live_client.start(stop_event)
+    is_dead = False
+    game_over = False
+    shops_left = 0
+    shop_polls = 0
     logging.info("Bot has started.")
 
     while not stop_event.is_set():
         logging.info("Running game loop...")
-        if _latest_game_data['data']:
-            # Shop phase
-            current_level = _latest_game_data['data']["activePlayer"].get("level")
-            if current_level is not None and current_level > prev_level:
-                time.sleep(3)
-                for _ in range(current_level - prev_level):
-                    shop_phase()
-                prev_level = current_level
-                
-            # Exit game
-            current_hp = _latest_game_data['data']["activePlayer"].get("championStats", {}).get("currentHealth")
-            if current_hp == 0:
+        get_config()  # Revalidates config.json so keybind edits apply mid-game
+        levels_gained = 0
+        for change in drain_queue(_state_queue):
+            if change.kind == LEVEL_GAINED:
+                levels_gained += change.value
+            elif change.kind == DIED:
                 logging.info("Player is dead (currentHealth == 0) .")
-                # OCR for "Exit" button and click it
-                exit_box = find_text_location("EXITNOW")
-                if not exit_box: 
-                    exit_box = find_text_location("EXIT")
-                if exit_box:
-                    x, y, w, h = exit_box
-                    click_percent(x, y)
-        else:
+                is_dead = True
+            elif change.kind == RESPAWNED:
+                is_dead = False
+            elif change.kind == GAME_ENDED:
+                logging.info(f"Game ended ({change.value}).")
+                game_over = True
+        if game_over:
+            break
+
+        if _snapshots.latest() is None:
             logging.warning("No game data available.")
 
+        # Shop phase, one per level gained, polled across iterations
+        if levels_gained:
+            if not shops_left:
+                time.sleep(3)
+            shops_left += levels_gained
+        if shops_left:
+            if shop_phase(first_poll=shop_polls == 0):
+                shops_left -= 1
+                shop_polls = 0
+            else:
+                shop_polls += 1
+
+        # Exit game
+        if is_dead:
+            # Find "Exit" button and click it
+            exit_box = find_exit_button()
+            if exit_box:
+                x, y, w, h = exit_box
+                click_percent(x, y)
+
+        if shops_left:
+            stop_event.wait(0.1)  # Shop OCR pending; no combat with the shop open
+            continue
         combat_phase()
 
+    if owns_poller:
+        _live_client.close()
+    logging.info(f"Live Client latency: {_live_client.stats()}")
+    logging.info(
+        f"Enemy tracker: {_enemy_tracker.hit_rate():.0%} of searches served by the predicted window "
+        f"{_enemy_tracker.stats}"
+    )
+
 # For testing purposes
 # python -m core.run_arena
 if __name__ == "__main__":
@@ -3,10 +3,10 @@
 import asyncio
 import logging
 import threading
-import random
+import multiprocessing
 import importlib
 from utils.config_utils import (
-    disable_insecure_request_warning, get_selected_game_mode, load_config
+    disable_insecure_request_warning, get_selected_game_mode
 )
 from core.constants import (
     LEAGUE_GAME_WINDOW_TITLE,
@@ -15,58 +15,93 @@ from core.constants import (
     LCU_CHAMP_SELECT_SESSION,
     LEAGUE_CLIENT_WINDOW_TITLE,
     GAMEFLOW_PHASES,
-    CHAMP_SELECT_SUBPHASES
+    GAMEFLOW_PHASE_BUDGETS,
+    GAMEFLOW_WATCHDOG_INTERVAL
 )
-from utils.general_utils import listen_for_exit_key, enable_logging, get_champions_map, wait_for_window
+from utils.general_utils import listen_for_exit_key, enable_logging, get_champions_map, wait_for_window_async
+from utils.game_loop_utils import GameLoopRunner, GameflowWatchdog
+from utils.live_client_utils import AsyncLiveClientPoller
+from utils.champ_select_utils import ChampSelectEngine, build_champ_select_plan
 from lcu_driver import Connector
 from core.menu import show_menu  
 
-connector = Connector()
-
 # State variables
 last_phase = None
-game_end_event = threading.Event()
 
-# Thread references
-game_loop_thread = None
+# Game loop thread and the task that starts it once the game window is up
+game_runner = GameLoopRunner()
+game_start_task = None
+
+# Bans and picks during champion select
+champ_select = ChampSelectEngine()
+
+# Live Client poller running on the connector's event loop during a game
+live_client = None
+
+# Phase budgets, stuck-state recovery and games-per-hour stats
+watchdog = GameflowWatchdog(GAMEFLOW_PHASE_BUDGETS)
+watchdog_task = None
 
 
 # ===========================
 # LCU Event Listeners
 # ===========================
 
-@connector.ready
+def create_connector():
+    """
+    Creates the lcu_driver connector and registers the event handlers below on it.
+    Called only from the main entry point: OCR worker processes re-import this
+    module as __mp_main__ and must not create a connector of their own.
+    Returns:
+        Connector: Connector ready to start().
+    """
+    connector = Connector()
+    connector.ready(connect)
+    connector.ws.register(LCU_GAMEFLOW_PHASE, event_types=('UPDATE',))(on_gameflow_phase)
+    connector.ws.register(LCU_CHAMP_SELECT_SESSION, event_types=('CREATE', 'UPDATE',))(on_champ_select_session)
+    connector.close(disconnect)
+    return connector
+
+
 async def connect(connection):
     """
     Handler for when the connector is ready and connected to the League Client.
     Waits for the client window, then triggers the initial gameflow phase logic.
     """
+    global watchdog_task
 
     # Wait for the client window
-    wait_for_window(LEAGUE_CLIENT_WINDOW_TITLE)
+    await wait_for_window_async(LEAGUE_CLIENT_WINDOW_TITLE)
     logging.info("Connected to League client.")
 
+    # Warm the Data Dragon cache so champ select never waits on the network
+    asyncio.get_running_loop().run_in_executor(None, get_champions_map)
+
     # Check current gameflow phase and run the handler logic
     try:
-        phase_resp = await connection.request('get', '/lol-gameflow/v1/gameflow-phase')
+        phase_resp = await connection.request('get', LCU_GAMEFLOW_PHASE)
         current_phase = await phase_resp.json()
         # Call the gameflow phase handler manually
-        await on_gameflow_phase(connection, type('Event', (object,), {'data': current_phase})())
+        await on_gameflow_phase(connection, phase_event(current_phase))
     except Exception as e:
         logging.error(f"Failed to check gameflow phase: {e}")
 
+    # Supervise the gameflow for stalls
+    if watchdog_task is None or watchdog_task.done():
+        watchdog_task = asyncio.create_task(supervise_gameflow(connection))
+
 
-@connector.ws.register(LCU_GAMEFLOW_PHASE, event_types=('UPDATE',))
 async def on_gameflow_phase(connection, event):
     """
     Handles changes in the overall gameflow phase (lobby, matchmaking, champ select, game start, etc.).
     Manages lobby creation, queueing, ready check, bot thread lifecycle, and play-again requests.
     """
-    global last_phase, game_loop_thread
+    global last_phase, game_start_task
     phase = event.data
     if phase == last_phase:
         return
     last_phase = phase
+    watchdog.enter(phase)
 
     # Create a lobby
     if phase == GAMEFLOW_PHASES["NONE"]:
@@ -95,107 +130,144 @@ async def on_gameflow_phase(connection, event):
         except Exception as e:
             logging.error(f"Failed to accept ready check: {e}")
 
-    # Log champion select phase
+    # Plan picks and bans once per champion select
     if phase == GAMEFLOW_PHASES["CHAMP_SELECT"]:
         logging.info("[EVENT] In champion select.")
+        champ_select.reset()
+        # Reading config.json and the Data Dragon cache must not block the event loop
+        plan = await asyncio.get_running_loop().run_in_executor(None, build_champ_select_plan)
+        champ_select.start(plan)
 
-    # Start bot loop thread on game start
+    # Start bot loop thread on game start (in the background so this handler returns at once)
     if phase == GAMEFLOW_PHASES["GAME_START"] or phase == GAMEFLOW_PHASES["IN_PROGRESS"]:
         logging.info("[EVENT] Game is in progress.")
-
-        # Wait for the game window
-        wait_for_window(LEAGUE_GAME_WINDOW_TITLE)
-
-        # Start the game loop thread unless already running
-        game_end_event.clear()
-        game_loop_thread = threading.Thread(target=run_game_loop, args=(game_end_event,), daemon=True)
-        game_loop_thread.start()
+        if game_start_task is None or game_start_task.done():
+            game_start_task = asyncio.create_task(start_game())
 
     # Clean up bot thread and playagain on end of game
     if phase == GAMEFLOW_PHASES["END_OF_GAME"] or phase == GAMEFLOW_PHASES["PRE_END_OF_GAME"]:
         logging.info("[EVENT] Game ended.")
-        game_end_event.set()
-        if game_loop_thread is not None:
-            game_loop_thread.join()
-            game_loop_thread = None
-        # Play again (recreate lobby)
-        try:
-            await connection.request('post', '/lol-lobby/v2/play-again')
-            logging.info("Sent play-again request.")
-        except Exception as e:
-            logging.error(f"Failed to send play-again request: {e}")
+        asyncio.create_task(end_game(connection))
 
-@connector.ws.register(LCU_CHAMP_SELECT_SESSION, event_types=('CREATE', 'UPDATE',))
 async def on_champ_select_session(connection, event):
     """
     Handles champ select session updates, including subphase changes.
-    Picks a champion during the BAN_PICK subphase.
+    Bursts of updates are coalesced by the champ select engine, which bans and
+    picks from the plan built when champ select started.
     """
-    session_data = event.data
-    timer = session_data.get('timer', {})
-    champ_phase = timer.get('phase')
-    actions = session_data.get('actions', [])
-    local_cell_id = session_data.get('localPlayerCellId')
-
-    # Only pick during BAN_PICK subphase
-    if champ_phase == CHAMP_SELECT_SUBPHASES["BAN_PICK"]:
-        config = load_config()
-        preferred_champion = config.get("General", {}).get("preferred_champion", "").strip()
-        champions_map = get_champions_map()
-        preferred_champ_id = champions_map.get(preferred_champion) if preferred_champion else None
-
-        for action_group in actions:
-            for action in action_group:
-                # Ban phase
-                if action.get('actorCellId') == local_cell_id and action.get('type') == 'ban' and action.get('isInProgress'):
-                    action_id = action.get('id')
-                    # Ban a random champion
-                    ban_champ_id = random.choice(list(champions_map.values()))
-                    await connection.request(
-                        'patch',
-                        f'/lol-champ-select/v1/session/actions/{action_id}',
-                        data={"championId": ban_champ_id, "completed": True}
-                    )
-                    await asyncio.sleep(0.5)
-                # Pick phase
-                if action.get('actorCellId') == local_cell_id and action.get('type') == 'pick' and action.get('isInProgress'):
-                    action_id = action.get('id')
-                    await asyncio.sleep(1)
-                    # Attempt to pick preferred champion first
-                    if preferred_champion != "":
-                        preferred_champ_id = champions_map.get(preferred_champion)
-                        await connection.request(
-                            'patch',
-                            f'/lol-champ-select/v1/session/actions/{action_id}',
-                            data={"championId": preferred_champ_id, "completed": True}
-                        )
-                        await asyncio.sleep(0.5)
-
-                    # Pick Bravery for arena
-                    await connection.request(
-                        'patch',
-                        f'/lol-champ-select/v1/session/actions/{action_id}',
-                        data={"championId": -3, "completed": True}
-                    )
-                    await asyncio.sleep(0.5)
-
-                    # Pick a random champion if preferred not set or failed
-                    valid_champ_ids = [cid for cid in champions_map.values() if cid != -1]
-                    champ_id = random.choice(valid_champ_ids)
-                    await connection.request(
-                        'patch',
-                        f'/lol-champ-select/v1/session/actions/{action_id}',
-                        data={"championId": champ_id, "completed": True}
-                    )
-                    return
-
-@connector.close
+    champ_select.update(connection, event.data)
+
 async def disconnect(_):
     """
     Handler for when the League Client is closed.
-    Logs the disconnect event.
+    Logs the disconnect event, then stops the game loop and Live Client polling
+    before the connector stops its event loop, so the poller's aiohttp session
+    is closed on the loop that owns it.
     """
     logging.info("[INFO] League Client has been closed.")
+    if watchdog_task is not None:
+        watchdog_task.cancel()
+    logging.info(f"Session stats: {watchdog.stats()}")
+    await end_game()
+
+
+# ===========================
+# Gameflow Watchdog
+# ===========================
+
+
+def phase_event(phase):
+    """
+    Returns:
+        An object shaped like an lcu_driver websocket event carrying a gameflow phase.
+    """
+    return type('Event', (object,), {'data': phase})()
+
+
+async def supervise_gameflow(connection):
+    """
+    Periodically re-reads the gameflow phase and recovers from stalls:
+    - Replays phase events that were missed
+    - Restarts the game loop if it crashed (or never started) during a game,
+      backing off and giving up after repeated crashes (see GameLoopRunner.restart_allowed)
+    - Applies escalating recovery when a phase overruns its budget
+    """
+    while True:
+        await asyncio.sleep(GAMEFLOW_WATCHDOG_INTERVAL)
+        try:
+            phase_resp = await connection.request('get', LCU_GAMEFLOW_PHASE)
+            phase = await phase_resp.json()
+        except Exception as e:
+            logging.error(f"Watchdog failed to read gameflow phase: {e}")
+            continue
+
+        if phase != last_phase:
+            logging.warning(f"Watchdog: missed gameflow phase change {last_phase} -> {phase}.")
+            await on_gameflow_phase(connection, phase_event(phase))
+            continue
+
+        # A loop that returned on GameEnd stays down while the phase catches up
+        in_game = phase in (GAMEFLOW_PHASES["GAME_START"], GAMEFLOW_PHASES["IN_PROGRESS"])
+        loop_died = not game_runner.is_running() and not game_runner.finished
+        if in_game and loop_died and (game_start_task is None or game_start_task.done()):
+            if game_runner.restart_allowed():
+                logging.warning("Watchdog: game loop is not running during a game; restarting it.")
+                await restart_game_loop()
+            continue
+
+        level = watchdog.check()
+        if level:
+            logging.warning(f"Watchdog: {phase} over budget for {watchdog.time_in_phase():.0f} s "
+                            f"(recovery level {level}).")
+            try:
+                await recover_phase(connection, phase, level)
+            except Exception as e:
+                logging.error(f"Watchdog recovery for {phase} failed: {e}")
+
+
+async def recover_phase(connection, phase, level):
+    """
+    Level 1 re-runs the phase handler (re-sends the lobby, queue, ready-check or
+    play-again request). Higher levels take stronger, phase-specific actions.
+    Args:
+        connection: lcu_driver connection.
+        phase (str): Gameflow phase that overran its budget.
+        level (int): Recovery level from the watchdog.
+    """
+    global last_phase
+    if level == 1:
+        last_phase = None  # Let the handler run again for the same phase
+        await on_gameflow_phase(connection, phase_event(phase))
+        return
+
+    if phase == GAMEFLOW_PHASES["MATCHMAKING"]:
+        # Re-queue
+        await connection.request('delete', '/lol-lobby/v2/lobby/matchmaking/search')
+        await connection.request('post', '/lol-lobby/v2/lobby/matchmaking/search')
+    elif phase == GAMEFLOW_PHASES["CHAMP_SELECT"]:
+        # Re-dispatch the current session in case an update was lost
+        session_resp = await connection.request('get', LCU_CHAMP_SELECT_SESSION)
+        champ_select.update(connection, await session_resp.json())
+    elif phase in (GAMEFLOW_PHASES["GAME_START"], GAMEFLOW_PHASES["IN_PROGRESS"]):
+        if game_runner.is_running() or game_runner.restart_allowed():
+            await restart_game_loop()
+    elif phase in (GAMEFLOW_PHASES["LOBBY"], GAMEFLOW_PHASES["PRE_END_OF_GAME"],
+                   GAMEFLOW_PHASES["END_OF_GAME"], GAMEFLOW_PHASES["WAITING_FOR_STATS"]):
+        # Leave the stale lobby or post-game screen by creating a fresh lobby
+        last_phase = None
+        await on_gameflow_phase(connection, phase_event(GAMEFLOW_PHASES["NONE"]))
+    else:
+        last_phase = None
+        await on_gameflow_phase(connection, phase_event(phase))
+
+
+async def restart_game_loop():
+    """
+    Stops the game loop thread (if any) and starts a new one for the current game.
+    """
+    global game_start_task
+    await game_runner.stop()
+    game_start_task = asyncio.create_task(start_game())
 
 
 # ===========================
@@ -203,10 +275,64 @@ async def disconnect(_):
 # ===========================
 
 
-def run_game_loop(stop_event):
+async def start_game():
+    """
+    Waits for the game window, starts Live Client polling on this event loop
+    and starts the game loop thread.
+    """
+    global live_client
+    if not await wait_for_window_async(LEAGUE_GAME_WINDOW_TITLE):
+        return
+
+    # Poll the Live Client API on this event loop instead of another thread
+    if live_client is None:
+        live_client = AsyncLiveClientPoller()
+        live_client.start()
+
+    # Start the game loop thread unless already running
+    game_runner.start(run_game_loop, live_client)
+
+
+async def end_game(connection=None):
+    """
+    Stops the game loop and Live Client polling without blocking the event loop,
+    then requests play-again if a connection is given.
+    """
+    global game_start_task
+    if game_start_task is not None and not game_start_task.done():
+        game_start_task.cancel()
+    game_start_task = None
+    await game_runner.stop()
+    game_runner.reset_crashes()
+    await stop_live_client()
+    if connection is None:
+        return
+    # Play again (recreate lobby)
+    try:
+        await connection.request('post', '/lol-lobby/v2/play-again')
+        logging.info("Sent play-again request.")
+    except Exception as e:
+        logging.error(f"Failed to send play-again request: {e}")
+    logging.info(f"Session stats: {watchdog.stats()}")
+
+
+async def stop_live_client():
+    """
+    Cancels the Live Client polling task, if one is running, and closes its session.
+    """
+    global live_client
+    if live_client is not None:
+        await live_client.stop()
+        live_client = None
+
+
+def run_game_loop(stop_event, live_client=None):
     """
     Runs the correct bot loop for the selected game mode.
     The loop should exit when stop_event is set (signaled by EndOfGame phase).
+    Args:
+        stop_event (threading.Event): Signals the end of the game.
+        live_client (AsyncLiveClientPoller, optional): Poller running on the connector loop.
     """
     selected_game_mode = get_selected_game_mode()
     mode_info = SUPPORTED_MODES.get(selected_game_mode)
@@ -217,7 +343,10 @@ def run_game_loop(stop_event):
         logging.error(f"Could not import module '{module_name}': {e}")
         return
     if hasattr(module, "run_game_loop"):
-        module.run_game_loop(stop_event)
+        if live_client is not None:
+            module.run_game_loop(stop_event, live_client)
+        else:
+            module.run_game_loop(stop_event)
     elif hasattr(module, "main"):
         module.main()
     else:
@@ -228,12 +357,12 @@ def run_script(testing=False):
     if testing:
         # test logic here
         logging.info("Running tests...")
-        game_end_event.clear()
-        run_game_loop(game_end_event)
+        game_runner.stop_event.clear()
+        run_game_loop(game_runner.stop_event)
 
     else:
         logging.info("Starting Script. Waiting for client...")
-        connector.start()
+        create_connector().start()
 
 
 # ===========================
@@ -246,6 +375,7 @@ if __name__ == "__main__":
     Main entry point for the League Bot Launcher.
     Handles menu navigation and starts the connector.
     """
+    multiprocessing.freeze_support()  # OCR worker processes in the frozen build
     disable_insecure_request_warning()
     enable_logging()
     threading.Thread(target=listen_for_exit_key, daemon=True).start()
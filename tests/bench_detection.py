@@ -0,0 +1,78 @@
+"""
+Latency benchmark for health bar detection on synthetic frames.
+Run with: python -m tests.bench_detection
+"""
+
+import time
+import numpy as np
+
+from core.constants import HEALTH_TICK_COLOR, ENEMY_HEALTH_BAR_COLOR
+from utils.game_utils import locate_health_bar, locate_health_bar_pyramid
+from tests.test_game_utils import make_frame, draw_health_bar, reference_find_champion_location
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440)]
+PYRAMID_SCALES = [1, 2, 4]
+
+
+def time_call(func, repeat):
+    """
+    Returns the median wall time of func() in milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def run_benchmark(repeat=20, include_reference=True):
+    for width, height in RESOLUTIONS:
+        empty = make_frame(width, height)
+        with_bar = empty.copy()
+        draw_health_bar(with_bar, width // 2, height // 2)
+        for label, img in (("no enemy", empty), ("enemy at center", with_bar)):
+            vectorized = time_call(
+                lambda: locate_health_bar(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR), repeat
+            )
+            line = f"{width}x{height} {label:>16}: vectorized {vectorized:8.2f} ms"
+            if include_reference:
+                reference = time_call(
+                    lambda: reference_find_champion_location(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR), 1
+                )
+                line += f" | per-pixel loop {reference:10.2f} ms | speedup {reference / vectorized:8.1f}x"
+            print(line)
+
+
+def run_pyramid_benchmark(repeat=20, frames=50, seed=0):
+    """
+    Compares the coarse-to-fine search at each scale against the full-resolution
+    search: median latency, and how often it returns the exact same pixel.
+    Bar heights are drawn from 1-6 px so thin bars expose the accuracy cost.
+    """
+    rng = np.random.default_rng(seed)
+    for width, height in RESOLUTIONS:
+        samples = []
+        for i in range(frames):
+            img = make_frame(width, height, seed=i)
+            for _ in range(rng.integers(0, 4)):
+                draw_health_bar(img, int(rng.integers(0, width - 120)), int(rng.integers(0, height - 8)),
+                                width=int(rng.integers(40, 110)), height=int(rng.integers(1, 7)))
+            samples.append((img, locate_health_bar(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR)))
+
+        for scale in PYRAMID_SCALES:
+            latency = float(np.median([
+                time_call(lambda: locate_health_bar_pyramid(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR,
+                                                            scale=scale), max(repeat // 10, 1))
+                for img, _ in samples
+            ]))
+            exact = sum(
+                locate_health_bar_pyramid(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR, scale=scale) == expected
+                for img, expected in samples
+            )
+            print(f"{width}x{height} scale 1/{scale}: {latency:8.2f} ms | exact match {exact}/{frames}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_pyramid_benchmark()
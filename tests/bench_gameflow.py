@@ -0,0 +1,127 @@
+"""
+End-to-end gameflow benchmark: drives main.py's LCU handlers against the mock LCU server and reports
+per-phase reaction latencies and total lobby-to-game time.
+Run with: python -m tests.bench_gameflow [GAMES]
+The game loop, window waits and Data Dragon lookups are replaced so only the gameflow handling is measured.
+"""
+
+import asyncio
+import json
+import sys
+from collections import namedtuple
+import aiohttp
+import numpy as np
+
+import main
+import utils.champ_select_utils as champ_select_utils
+from core.constants import LCU_GAMEFLOW_PHASE, LCU_CHAMP_SELECT_SESSION, LCU_CHAMPIONS_MINIMAL
+from tests.mock_lcu_server import MockLcuServer, load_lcu_data, WAMP_SUBSCRIBE, WAMP_EVENT, LCU_EVENT_TOPIC
+
+WebsocketEvent = namedtuple("WebsocketEvent", ["data", "type", "uri"])
+
+# uri -> (handler, event types), mirroring main.create_connector
+HANDLERS = {
+    LCU_GAMEFLOW_PHASE: (main.on_gameflow_phase, ("UPDATE",)),
+    LCU_CHAMP_SELECT_SESSION: (main.on_champ_select_session, ("CREATE", "UPDATE")),
+}
+
+
+class MockLcuConnection:
+    """
+    Minimal stand-in for lcu_driver's Connection: authenticated REST requests and
+    websocket events dispatched to the registered handlers as tasks.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self._session = None
+        self._ws = None
+        self._tasks = set()
+
+    async def open(self):
+        self._session = aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth("riot", self.server.password),
+            connector=aiohttp.TCPConnector(ssl=False),
+        )
+        self._ws = await self._session.ws_connect(self.server.base_url.replace("http", "ws", 1) + "/")
+        await self._ws.send_str(json.dumps([WAMP_SUBSCRIBE, LCU_EVENT_TOPIC]))
+
+    async def request(self, method, endpoint, **kwargs):
+        return await self._session.request(method.upper(), self.server.base_url + endpoint, json=kwargs.get("data"))
+
+    async def listen(self):
+        async for msg in self._ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+            opcode, _, payload = json.loads(msg.data)
+            handler, event_types = HANDLERS.get(payload["uri"], (None, ()))
+            if opcode != WAMP_EVENT or handler is None or payload["eventType"].upper() not in event_types:
+                continue
+            event = WebsocketEvent(payload["data"], payload["eventType"].upper(), payload["uri"])
+            task = asyncio.create_task(handler(self, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await self._ws.close()
+        await self._session.close()
+
+
+def load_champions_map():
+    data = load_lcu_data()
+    key = next(k for k in data if k.startswith(LCU_CHAMPIONS_MINIMAL.split("{")[0]))
+    return {champ["name"]: champ["id"] for champ in data[key] if champ["id"] > 0}
+
+
+def fake_game_loop(stop_event, live_client=None):
+    stop_event.wait()
+
+
+async def found_window(window_title, timeout=60):
+    return 1
+
+
+def patch_main(champions_map):
+    main.last_phase = None
+    main.wait_for_window_async = found_window
+    main.get_champions_map = lambda: champions_map
+    main.run_game_loop = fake_game_loop
+    champ_select_utils.get_champions_map = lambda: champions_map
+
+
+async def run_benchmark(games=3, timeout=60):
+    patch_main(load_champions_map())
+    server = await MockLcuServer(games=games).start()
+    connection = MockLcuConnection(server)
+    await connection.open()
+    listener = asyncio.create_task(connection.listen())
+    try:
+        await main.connect(connection)
+        await asyncio.wait_for(server.complete.wait(), timeout)
+    finally:
+        listener.cancel()
+        if main.watchdog_task is not None:
+            main.watchdog_task.cancel()
+        await main.end_game()
+        await connection.close()
+        await server.stop()
+
+    latencies = server.reaction_latencies()
+    print(f"Played {server.games_played} scripted games over {len(server.requests)} REST requests.")
+    for name, samples in latencies.items():
+        if name == "rejected_actions":
+            continue
+        if samples:
+            print(f"{name:>20}: median {np.median(samples):8.1f} ms | max {max(samples):8.1f} ms "
+                  f"over {len(samples)}")
+        else:
+            print(f"{name:>20}: no samples")
+    print(f"{'rejected actions':>20}: {latencies['rejected_actions']}")
+    print(f"{'champ select':>20}: {main.champ_select.stats}")
+    print(f"{'watchdog':>20}: {main.watchdog.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3))
@@ -0,0 +1,47 @@
+"""
+Poller throughput, latency and CPU cost against the mock Live Client server under several fault profiles.
+Run with: python -m tests.bench_live_client [SECONDS]
+"""
+
+import sys
+import time
+
+from tests.mock_live_client_server import MockLiveClientServer
+from utils.live_client_utils import LiveClientPoller
+
+# name -> MockLiveClientServer fault settings
+PROFILES = {
+    "ideal": {},
+    "realistic": {"latency": 0.005, "jitter": 0.003},
+    "slow": {"latency": 0.05, "jitter": 0.03},
+    "flaky": {"latency": 0.005, "error_rate": 0.2},
+    "stalling": {"latency": 0.005, "stall_rate": 0.05, "stall_time": 3.0},
+}
+SUBSCRIPTIONS = {"activeplayer": 0.2, "playerlist": 1.0, "eventdata": 1.0}
+
+
+def run_profile(settings, seconds):
+    with MockLiveClientServer(**settings) as server:
+        poller = LiveClientPoller(base_url=server.base_url)
+        received = []
+        for endpoint, interval in SUBSCRIPTIONS.items():
+            poller.subscribe(endpoint, interval, callback=lambda data, endpoint=endpoint: received.append(endpoint))
+        cpu_start, start = time.process_time(), time.perf_counter()
+        poller.start()
+        time.sleep(seconds)
+        poller.close()
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+    return received, poller.stats(), elapsed, cpu
+
+
+def run_benchmark(seconds=10):
+    for name, settings in PROFILES.items():
+        received, stats, elapsed, cpu = run_profile(settings, seconds)
+        print(f"{name:>10}: {len(received) / elapsed:6.1f} updates/s | CPU {cpu / elapsed:5.1%} "
+              f"(incl. server)")
+        for endpoint, summary in stats.items():
+            print(f"{'':>12}{endpoint:<14} {summary}")
+
+
+if __name__ == "__main__":
+    run_benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,55 @@
+"""
+Per-call latency benchmark of the OCR backends on the same recorded frames.
+Run with: python -m tests.bench_ocr [FRAMES_DIR]
+FRAMES_DIR holds screenshots (*.png); without it a few frames of the current screen are captured.
+"""
+
+import glob
+import os
+import sys
+import time
+import cv2
+import numpy as np
+
+from utils.general_utils import create_ocr_backend, get_screenshot, preprocess_for_ocr
+
+BACKENDS = ["pytesseract", "tesserocr"]
+
+
+def load_frames(frames_dir=None, count=5):
+    """
+    Returns:
+        list: Preprocessed frames ready for OCR.
+    """
+    if frames_dir:
+        frames = [cv2.imread(path) for path in sorted(glob.glob(os.path.join(frames_dir, "*.png")))]
+    else:
+        frames = [get_screenshot().copy() for _ in range(count)]
+    return [preprocess_for_ocr(frame) for frame in frames if frame is not None]
+
+
+def run_benchmark(frames, repeat=3):
+    for name in BACKENDS:
+        try:
+            backend = create_ocr_backend(name)
+        except Exception as e:
+            print(f"{name:>12}: unavailable ({e})")
+            continue
+        backend.image_to_data(frames[0])  # Warm-up (model load for persistent backends)
+        samples = []
+        for _ in range(repeat):
+            for frame in frames:
+                start = time.perf_counter()
+                backend.image_to_data(frame)
+                samples.append((time.perf_counter() - start) * 1000)
+        backend.close()
+        print(f"{name:>12}: median {np.median(samples):8.1f} ms | p95 {np.percentile(samples, 95):8.1f} ms "
+              f"over {len(samples)} calls")
+
+
+if __name__ == "__main__":
+    frames = load_frames(sys.argv[1] if len(sys.argv) > 1 else None)
+    if not frames:
+        print("No frames to benchmark.")
+        sys.exit(1)
+    run_benchmark(frames)
@@ -0,0 +1,49 @@
+"""
+Offline benchmark of the snapshot/state-change pipeline over a recorded game.
+Run with: python -m tests.bench_replay RECORDING [SPEED]
+RECORDING is written by core.record_live_client_session; SPEED 0 (default) replays without delays.
+"""
+
+import sys
+import time
+import numpy as np
+
+from utils.live_client_utils import SnapshotPublisher, StateChangeBus, EventIngestor
+from utils.replay_utils import ReplayPoller
+
+
+def run_benchmark(path, speed=0):
+    poller = ReplayPoller(path, speed=speed)
+    bus = StateChangeBus()
+    changes = []
+    bus.subscribe(changes.append)
+    samples = []
+
+    def process(snapshot):
+        start = time.perf_counter()
+        bus.process(snapshot)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    publisher = SnapshotPublisher(poller, callback=process)
+    events = EventIngestor(poller)
+
+    start = time.perf_counter()
+    poller.run()
+    elapsed = time.perf_counter() - start
+    poller.close()
+
+    print(f"Replayed {path} in {elapsed:.2f} s: {len(samples)} snapshots, {len(events.event_log)} events, "
+          f"{len(changes)} state changes")
+    if samples:
+        print(f"State diff: median {np.median(samples):.3f} ms | p95 {np.percentile(samples, 95):.3f} ms | "
+              f"{len(samples) / elapsed:.0f} snapshots/s")
+    latest = publisher.latest()
+    if latest is not None:
+        print(f"Final snapshot: level {latest.level}, gold {latest.gold}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m tests.bench_replay RECORDING [SPEED]")
+        sys.exit(1)
+    run_benchmark(sys.argv[1], float(sys.argv[2]) if len(sys.argv) > 2 else 0)
@@ -0,0 +1,364 @@
+"""
+Local stand-in for the League Client (LCU) API: REST endpoints, the WAMP websocket and a lockfile.
+Plays a scripted gameflow (lobby, queue, ready check, champ select with timed subphases, game, end of game)
+that advances when the bot sends the expected requests, and timestamps each reaction.
+Run with: python -m tests.mock_lcu_server [--port PORT] [--games N]
+"""
+
+import argparse
+import asyncio
+import base64
+import copy
+import json
+import os
+import secrets
+import tempfile
+import time
+from aiohttp import web, WSMsgType
+
+from core.constants import GAMEFLOW_PHASES, LCU_GAMEFLOW_PHASE, LCU_CHAMP_SELECT_SESSION
+
+LCU_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "lcu_data.json")
+
+# WAMP 1.0 opcodes used by the LCU websocket
+WAMP_SUBSCRIBE, WAMP_UNSUBSCRIBE, WAMP_EVENT = 5, 6, 8
+LCU_EVENT_TOPIC = "OnJsonApiEvent"
+
+LOCAL_CELL_ID = 2
+
+# Seconds the mock client takes for its own steps; the bot's reactions are measured in between
+DEFAULT_TIMINGS = {
+    "queue_time": 0.5,          # Matchmaking -> ReadyCheck
+    "accept_to_champ_select": 0.2,
+    "planning_time": 0.3,       # PLANNING -> BAN_PICK
+    "ban_time": 0.5,            # Ban turn -> pick turn (other players ban meanwhile)
+    "finalization_time": 0.3,   # Pick -> GameStart
+    "loading_time": 0.3,        # GameStart -> InProgress
+    "game_time": 1.0,           # InProgress -> PreEndOfGame
+    "end_time": 0.2,            # PreEndOfGame -> EndOfGame
+    "session_update_interval": 0.05,  # Champ select UPDATE flood while a turn is open
+}
+
+
+def load_lcu_data():
+    with open(LCU_DATA_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_lockfile(directory, port, password, protocol="https"):
+    """
+    Writes a lockfile in the League Client format (name:pid:port:password:protocol).
+    Returns:
+        str: Lockfile path.
+    """
+    path = os.path.join(directory, "lockfile")
+    with open(path, "w") as f:
+        f.write(f"LeagueClient:{os.getpid()}:{port}:{password}:{protocol}")
+    return path
+
+
+class MockLcuServer:
+    """
+    aiohttp server imitating the LCU. Each scripted step is timestamped in
+    `timeline`; reaction latencies are measured from the event the bot had to
+    react to (e.g. ReadyCheck phase) to the request it sent (ready-check accept).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, https=True, games=1, timings=None):
+        """
+        Args:
+            host (str): Bind address.
+            port (int): Bind port; 0 picks a free one.
+            https (bool): Serve TLS with a generated self-signed certificate, like the real client.
+            games (int): Games to play before the scenario is complete.
+            timings (dict, optional): Overrides for DEFAULT_TIMINGS.
+        """
+        self.host = host
+        self.port = port
+        self.https = https
+        self.games = games
+        self.timings = dict(DEFAULT_TIMINGS, **(timings or {}))
+        self.password = secrets.token_urlsafe(16)
+        self.data = load_lcu_data()
+
+        self.phase = GAMEFLOW_PHASES["NONE"]
+        self.session = None
+        self.timeline = []  # [(time.perf_counter(), event name, game number)]
+        self.requests = []  # [(method, path)]
+        self.games_played = 0
+        self.complete = asyncio.Event()
+
+        self._sockets = set()
+        self._tasks = set()
+        self._runner = None
+        self._tmp_dir = None
+        self.lockfile_path = None
+
+    # ===========================
+    # Lifecycle
+    # ===========================
+
+    async def start(self):
+        app = web.Application(middlewares=[self._auth_middleware])
+        app.router.add_get("/", self._websocket)
+        app.router.add_route("*", "/{path:.*}", self._rest)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        ssl_context = None
+        if self.https:
+            import ssl
+            from tests.mock_live_client_server import create_self_signed_cert
+
+            certfile, keyfile = create_self_signed_cert(self._tmp_dir.name)
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(certfile, keyfile)
+        site = web.TCPSite(self._runner, self.host, self.port, ssl_context=ssl_context)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self.lockfile_path = write_lockfile(self._tmp_dir.name, self.port, self.password,
+                                            "https" if self.https else "http")
+        return self
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+
+    @property
+    def base_url(self):
+        return f"{'https' if self.https else 'http'}://{self.host}:{self.port}"
+
+    @property
+    def auth_header(self):
+        return "Basic " + base64.b64encode(f"riot:{self.password}".encode()).decode()
+
+    # ===========================
+    # Transport
+    # ===========================
+
+    @web.middleware
+    async def _auth_middleware(self, request, handler):
+        if request.headers.get("Authorization") != self.auth_header:
+            return web.json_response({"httpStatus": 401, "message": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    async def _websocket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        try:
+            # Like the real client, subscribing does not replay the current state;
+            # the bot queries the gameflow phase itself on connect
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    async def _publish_to(self, ws, uri, data, event_type="Update"):
+        payload = {"data": data, "eventType": event_type, "uri": uri}
+        try:
+            await ws.send_str(json.dumps([WAMP_EVENT, LCU_EVENT_TOPIC, payload]))
+        except ConnectionError:
+            self._sockets.discard(ws)
+
+    async def publish(self, uri, data, event_type="Update"):
+        for ws in list(self._sockets):
+            await self._publish_to(ws, uri, data, event_type)
+
+    def _later(self, delay, coro_fn, *args):
+        async def run():
+            await asyncio.sleep(delay)
+            await coro_fn(*args)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def mark(self, name):
+        self.timeline.append((time.perf_counter(), name, self.games_played + 1))
+
+    # ===========================
+    # Scripted Gameflow
+    # ===========================
+
+    async def set_phase(self, phase):
+        self.phase = phase
+        self.mark(f"phase:{phase}")
+        await self.publish(LCU_GAMEFLOW_PHASE, phase)
+
+    async def _rest(self, request):
+        method, path = request.method, "/" + request.match_info["path"]
+        self.requests.append((method, path))
+        body = await request.json() if request.can_read_body else None
+
+        if method == "GET" and path == LCU_GAMEFLOW_PHASE:
+            if self.phase == GAMEFLOW_PHASES["NONE"]:
+                self.mark("phase:None")  # The bot reacts to the phase it queried on connect
+            return web.json_response(self.phase)
+        if method == "GET" and path == LCU_CHAMP_SELECT_SESSION:
+            if self.session is None:
+                return web.json_response({"httpStatus": 404, "message": "No active delegate"}, status=404)
+            return web.json_response(self.session)
+        if method == "POST" and path == "/lol-lobby/v2/lobby":
+            self.mark("request:create_lobby")
+            await self.set_phase(GAMEFLOW_PHASES["LOBBY"])
+            return web.json_response({"queueId": (body or {}).get("queueId")})
+        if method == "POST" and path == "/lol-lobby/v2/lobby/matchmaking/search":
+            self.mark("request:start_queue")
+            await self.set_phase("Matchmaking")
+            self._later(self.timings["queue_time"], self.set_phase, GAMEFLOW_PHASES["READY_CHECK"])
+            return web.Response(status=204)
+        if method == "POST" and path == "/lol-matchmaking/v1/ready-check/accept":
+            if self.phase != GAMEFLOW_PHASES["READY_CHECK"]:
+                return web.json_response({"httpStatus": 400, "message": "No ready check"}, status=400)
+            self.mark("request:accept_ready_check")
+            self._later(self.timings["accept_to_champ_select"], self._start_champ_select)
+            return web.Response(status=204)
+        if method == "PATCH" and path.startswith(LCU_CHAMP_SELECT_SESSION + "/actions/"):
+            return await self._patch_action(int(path.rsplit("/", 1)[1]), body or {})
+        if method == "POST" and path == "/lol-lobby/v2/play-again":
+            self.mark("request:play_again")
+            self.games_played += 1
+            if self.games_played >= self.games:
+                self.complete.set()
+            else:
+                await self.set_phase(GAMEFLOW_PHASES["LOBBY"])
+            return web.Response(status=204)
+        if method == "GET" and path in self.data:
+            return web.json_response(self.data[path])
+        return web.json_response({"httpStatus": 404, "message": f"Unknown endpoint {path}"}, status=404)
+
+    def _new_session(self):
+        session = copy.deepcopy(self.data[LCU_CHAMP_SELECT_SESSION])
+        session["localPlayerCellId"] = LOCAL_CELL_ID
+        session["actions"] = [
+            [{"id": 100 + cell, "actorCellId": cell, "championId": 0, "completed": False,
+              "isInProgress": False, "isAllyAction": True, "type": "ban"} for cell in range(4)],
+            [{"id": 200 + cell, "actorCellId": cell, "championId": 0, "completed": False,
+              "isInProgress": False, "isAllyAction": True, "type": "pick"} for cell in range(4)],
+        ]
+        session["timer"] = dict(session["timer"], phase="PLANNING")
+        return session
+
+    async def _start_champ_select(self):
+        self.session = self._new_session()
+        await self.set_phase(GAMEFLOW_PHASES["CHAMP_SELECT"])
+        await self.publish(LCU_CHAMP_SELECT_SESSION, self.session, "Create")
+        self._later(self.timings["planning_time"], self._open_turn, 0)
+
+    async def _open_turn(self, group):
+        """
+        Opens every action of a group (simultaneous bans, then picks) and floods
+        session updates until the local player has acted.
+        """
+        for action in self.session["actions"][group]:
+            action["isInProgress"] = True
+        self.session["timer"]["phase"] = "BAN_PICK"
+        self.mark(f"turn:{self.session['actions'][group][0]['type']}")
+        while self.session is not None and not self._local_action(group)["completed"]:
+            self.session["counter"] = self.session.get("counter", 0) + 1
+            await self.publish(LCU_CHAMP_SELECT_SESSION, self.session)
+            await asyncio.sleep(self.timings["session_update_interval"])
+
+    def _local_action(self, group):
+        return next(a for a in self.session["actions"][group] if a["actorCellId"] == LOCAL_CELL_ID)
+
+    async def _patch_action(self, action_id, body):
+        action = next((a for group in (self.session or {}).get("actions", []) for a in group
+                       if a["id"] == action_id), None)
+        if action is None or not action["isInProgress"] or action["completed"]:
+            self.mark("request:rejected_action")
+            return web.json_response({"httpStatus": 500, "message": "Invalid action"}, status=500)
+        if body.get("championId") in (None, 0, -1):
+            return web.json_response({"httpStatus": 500, "message": "Invalid champion"}, status=500)
+
+        action.update(championId=body["championId"], completed=bool(body.get("completed")), isInProgress=False)
+        self.mark(f"request:{action['type']}")
+        await self.publish(LCU_CHAMP_SELECT_SESSION, self.session)
+        if action["type"] == "ban":
+            # Other players finish banning, then the pick turn opens
+            for other in self.session["actions"][0]:
+                other.update(completed=True, isInProgress=False)
+            self._later(self.timings["ban_time"], self._open_turn, 1)
+        else:
+            self._later(self.timings["finalization_time"], self._start_game)
+        return web.Response(status=204)
+
+    async def _start_game(self):
+        self.session = None
+        await self.set_phase(GAMEFLOW_PHASES["GAME_START"])
+        await asyncio.sleep(self.timings["loading_time"])
+        await self.set_phase(GAMEFLOW_PHASES["IN_PROGRESS"])
+        await asyncio.sleep(self.timings["game_time"])
+        await self.set_phase(GAMEFLOW_PHASES["PRE_END_OF_GAME"])
+        await asyncio.sleep(self.timings["end_time"])
+        await self.set_phase(GAMEFLOW_PHASES["END_OF_GAME"])
+
+    # ===========================
+    # Report
+    # ===========================
+
+    # reaction name -> (event the bot reacts to, request it sends)
+    REACTIONS = {
+        "create_lobby": ("phase:None", "request:create_lobby"),
+        "start_queue": ("phase:Lobby", "request:start_queue"),
+        "accept_ready_check": ("phase:ReadyCheck", "request:accept_ready_check"),
+        "ban": ("turn:ban", "request:ban"),
+        "pick": ("turn:pick", "request:pick"),
+        "play_again": ("phase:EndOfGame", "request:play_again"),
+    }
+
+    def reaction_latencies(self):
+        """
+        Returns:
+            dict: reaction name -> [latency in ms per game], plus "lobby_to_game" (lobby
+                creation to GameStart) and "rejected_actions" (PATCHes the client refused).
+        """
+        latencies = {name: [] for name in self.REACTIONS}
+        latencies["lobby_to_game"] = []
+        for game in range(1, self.games_played + 2):
+            events = [(t, name) for t, name, g in self.timeline if g == game]
+            for reaction, (trigger, response) in self.REACTIONS.items():
+                for i, (t, name) in enumerate(events):
+                    if name != trigger:
+                        continue
+                    reply = next((t2 for t2, name2 in events[i + 1:] if name2 == response), None)
+                    if reply is not None:
+                        latencies[reaction].append((reply - t) * 1000)
+                    break
+            lobby = next((t for t, name in events if name in ("request:create_lobby", "phase:Lobby")), None)
+            started = next((t for t, name in events if name == "phase:GameStart"), None)
+            if lobby is not None and started is not None:
+                latencies["lobby_to_game"].append((started - lobby) * 1000)
+        latencies["rejected_actions"] = sum(1 for _, name, _ in self.timeline if name == "request:rejected_action")
+        return latencies
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the League Client API.")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--games", type=int, default=1)
+    args = parser.parse_args()
+
+    async def serve():
+        server = await MockLcuServer(port=args.port, games=args.games).start()
+        print(f"[INFO] Serving {server.base_url} (lockfile {server.lockfile_path}, password {server.password})")
+        await server.complete.wait()
+        print(json.dumps(server.reaction_latencies(), indent=2))
+        await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,278 @@
+"""
+Local stand-in for the Live Client API (https://127.0.0.1:2999/liveclientdata) with configurable faults.
+Serves docs/live_client_data.json, or a recording from core.record_live_client_session played back in real time.
+Run with: python -m tests.mock_live_client_server [--recording FILE] [--latency S] [--jitter S] [--error-rate P]
+"""
+
+import argparse
+import bisect
+import json
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+LIVE_CLIENT_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "live_client_data.json")
+BASE_PATH = "/liveclientdata"
+
+
+# ===========================
+# Game Data Sources
+# ===========================
+
+class StaticGameData:
+    """
+    Serves one allgamedata snapshot, e.g. docs/live_client_data.json.
+    """
+
+    def __init__(self, all_game_data=None):
+        if all_game_data is None:
+            with open(LIVE_CLIENT_DATA_PATH, "r", encoding="utf-8") as f:
+                all_game_data = json.load(f)
+        self.all_game_data = all_game_data
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: allgamedata at the current time.
+        """
+        return self.all_game_data
+
+
+class RecordedGameData(StaticGameData):
+    """
+    Serves a SessionRecorder file in real time (scaled by speed) from when the
+    source is created. Endpoints that were not recorded fall back to the static data.
+    """
+
+    def __init__(self, path, speed=1.0, all_game_data=None):
+        from utils.replay_utils import ReplayReader
+
+        super().__init__(all_game_data)
+        self.speed = speed
+        self._started = time.monotonic()
+        self._times = {}
+        self._values = {}
+        events = []
+        reader = ReplayReader(path)
+        for t, endpoint, data in reader.records():
+            if endpoint == "eventdata":
+                # Recorded eventdata holds only the new events of each poll
+                events = events + data.get("Events", [])
+                data = {"Events": events}
+            self._times.setdefault(endpoint, []).append(t)
+            self._values.setdefault(endpoint, []).append(data)
+        reader.close()
+
+    def _value_at(self, endpoint, t, default):
+        times = self._times.get(endpoint)
+        i = bisect.bisect_right(times, t) - 1 if times else -1
+        return self._values[endpoint][i] if i >= 0 else default
+
+    def snapshot(self):
+        t = (time.monotonic() - self._started) * self.speed
+        data = dict(self.all_game_data)
+        data["activePlayer"] = self._value_at("activeplayer", t, data["activePlayer"])
+        data["allPlayers"] = self._value_at("playerlist", t, data["allPlayers"])
+        data["events"] = self._value_at("eventdata", t, {"Events": []})
+        data["gameData"] = dict(data["gameData"], gameTime=t)
+        return data
+
+
+def _find_player(data, query):
+    riot_id = query.get("riotId", [None])[0]
+    for player in data["allPlayers"]:
+        if player.get("riotId") == riot_id:
+            return player
+    return None
+
+
+def _events_since(data, query):
+    first_id = int(query.get("eventID", [0])[0])
+    return {"Events": [e for e in data["events"]["Events"] if e.get("EventID", 0) >= first_id]}
+
+
+# endpoint -> (allgamedata, query) -> response body, None for 404
+ENDPOINTS = {
+    "allgamedata": lambda data, query: data,
+    "activeplayer": lambda data, query: data["activePlayer"],
+    "activeplayerabilities": lambda data, query: data["activePlayer"].get("abilities"),
+    "activeplayername": lambda data, query: data["activePlayer"].get("riotId"),
+    "activeplayerrunes": lambda data, query: data["activePlayer"].get("fullRunes"),
+    "eventdata": _events_since,
+    "gamestats": lambda data, query: data["gameData"],
+    "playerlist": lambda data, query: data["allPlayers"],
+    "playerscores": lambda data, query: (_find_player(data, query) or {}).get("scores"),
+    "playersummonerspells": lambda data, query: (_find_player(data, query) or {}).get("summonerSpells"),
+    "playeritems": lambda data, query: (_find_player(data, query) or {}).get("items"),
+    "playermainrunes": lambda data, query: (_find_player(data, query) or {}).get("runes"),
+}
+
+
+# ===========================
+# Server
+# ===========================
+
+class _LiveClientHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+    def do_GET(self):
+        server = self.server.mock
+        url = urlsplit(self.path)
+        endpoint = url.path[len(BASE_PATH) + 1:] if url.path.startswith(BASE_PATH + "/") else None
+        server.count_request(endpoint)
+
+        delay = server.latency + random.uniform(-server.jitter, server.jitter)
+        if random.random() < server.stall_rate:
+            delay += server.stall_time
+        if delay > 0:
+            time.sleep(delay)
+
+        if random.random() < server.error_rate:
+            self._send(503, {"errorCode": "SERVICE_UNAVAILABLE", "httpStatus": 503})
+            return
+        handler = ENDPOINTS.get(endpoint)
+        body = handler(server.source.snapshot(), parse_qs(url.query)) if handler else None
+        if body is None:
+            self._send(404, {"errorCode": "RESOURCE_NOT_FOUND", "httpStatus": 404})
+            return
+        self._send(200, body)
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client timed out during an injected stall
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_self_signed_cert(directory):
+    """
+    Generates a throwaway localhost certificate with the openssl CLI.
+    Returns:
+        tuple: (certfile, keyfile)
+    """
+    if shutil.which("openssl") is None:
+        raise RuntimeError("openssl is required to serve HTTPS; pass certfile/keyfile or use https=False.")
+    certfile, keyfile = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+         "-keyout", keyfile, "-out", certfile],
+        check=True, capture_output=True,
+    )
+    return certfile, keyfile
+
+
+class MockLiveClientServer:
+    """
+    Threaded HTTP(S) server that imitates the Live Client API with injected
+    latency, jitter, errors and stalls. The fault settings can be changed while
+    it runs.
+    """
+
+    def __init__(self, source=None, host="127.0.0.1", port=0, https=True, certfile=None, keyfile=None,
+                 latency=0.0, jitter=0.0, error_rate=0.0, stall_rate=0.0, stall_time=2.0):
+        """
+        Args:
+            source (StaticGameData, optional): Game data to serve; docs/live_client_data.json by default.
+            host (str): Bind address.
+            port (int): Bind port; 0 picks a free one (the real API uses 2999).
+            https (bool): Serve TLS with certfile/keyfile, or a generated self-signed cert.
+            latency (float): Added delay per request in seconds.
+            jitter (float): Uniform +/- variation of the delay in seconds.
+            error_rate (float): Fraction of requests answered with 503.
+            stall_rate (float): Fraction of requests delayed by stall_time (to trip client timeouts).
+            stall_time (float): Stall length in seconds.
+        """
+        self.source = source or StaticGameData()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_time = stall_time
+        self.requests = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._cert_dir = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _LiveClientHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self.https = https
+        if https:
+            if certfile is None:
+                self._cert_dir = tempfile.TemporaryDirectory()
+                certfile, keyfile = create_self_signed_cert(self._cert_dir.name)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self._httpd.socket = context.wrap_socket(self._httpd.socket, server_side=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"{'https' if self.https else 'http'}://{host}:{port}{BASE_PATH}"
+
+    def count_request(self, endpoint):
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
+            self._cert_dir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the Live Client API.")
+    parser.add_argument("--recording", help="Recording from core.record_live_client_session.")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--port", type=int, default=2999)
+    parser.add_argument("--http", action="store_true", help="Serve plain HTTP instead of HTTPS.")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall-time", type=float, default=2.0)
+    args = parser.parse_args()
+
+    source = RecordedGameData(args.recording, args.speed) if args.recording else StaticGameData()
+    server = MockLiveClientServer(
+        source, port=args.port, https=not args.http, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, stall_rate=args.stall_rate, stall_time=args.stall_time,
+    )
+    server.start()
+    print(f"[INFO] Serving {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+
+from utils import capture_utils
+from utils.capture_utils import ScreenCapture
+
+MONITOR = {"left": 0, "top": 0, "width": 8, "height": 6}
+
+
+class FakeShot:
+    def __init__(self, value):
+        self.width, self.height = MONITOR["width"], MONITOR["height"]
+        self.raw = np.full((self.height, self.width, 4), value, dtype=np.uint8).tobytes()
+
+
+class FakeMss:
+    """
+    mss handle whose n-th grab is a frame filled with n % 256.
+    """
+    monitors = [MONITOR, MONITOR]
+
+    def __init__(self):
+        self.grabs = 0
+
+    def grab(self, monitor):
+        self.grabs += 1
+        return FakeShot(self.grabs % 256)
+
+    def close(self):
+        pass
+
+
+def make_capture(monkeypatch, **kwargs):
+    monkeypatch.setattr(capture_utils.mss, "mss", FakeMss)
+    return ScreenCapture(**kwargs)
+
+
+def test_grab_reuses_pool_buffers_after_pool_size_grabs(monkeypatch):
+    capture = make_capture(monkeypatch, pool_size=3)
+    frames = [capture.grab() for _ in range(4)]
+    assert frames[0].shape == (6, 8, 3) and frames[0].flags["C_CONTIGUOUS"]
+    assert not any(np.shares_memory(a, b) for i, a in enumerate(frames[:3]) for b in frames[i + 1:3])
+    assert np.shares_memory(frames[0], frames[3])
+    assert (frames[0] == 4).all()  # Overwritten by the fourth grab
+
+    kept = capture.grab(copy=True)
+    assert not any(np.shares_memory(kept, frame) for frame in frames)
+    capture.close()
+
+
+def test_grabs_never_overwrite_ring_frames(monkeypatch):
+    # ring_size + 1 == pool_size: the sizes that used to share one pool
+    capture = make_capture(monkeypatch, pool_size=4, ring_size=3)
+    capture.start()
+    deadline = time.time() + 2
+    while len(capture.recent_frames()) < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    capture.stop()
+    ring = capture.recent_frames()
+    assert len(ring) == 3
+    values = [int(frame[0, 0, 0]) for _, _, frame in ring]
+
+    grabs = [capture.grab() for _ in range(capture.pool_size * 2)]
+    for _, _, frame in ring:
+        assert not any(np.shares_memory(frame, grabbed) for grabbed in grabs)
+    assert [int(frame[0, 0, 0]) for _, _, frame in ring] == values
+    capture.close()
+
+
+def test_latest_falls_back_to_grab_when_ring_is_stale(monkeypatch):
+    capture = make_capture(monkeypatch)
+    ring_frame = np.zeros((6, 8, 3), dtype=np.uint8)
+    capture._frames.append((7, time.time() - 1.0, ring_frame))
+
+    frame, _, seq = capture.latest()
+    assert seq == 7 and frame is ring_frame
+    frame, _, seq = capture.latest(max_age=5.0)
+    assert seq == 7
+
+    frame, timestamp, seq = capture.latest(max_age=0.5)
+    assert seq is None and frame is not ring_frame
+    assert time.time() - timestamp < 0.5
+    capture.close()
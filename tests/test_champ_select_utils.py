@@ -0,0 +1,93 @@
+import asyncio
+
+from utils.champ_select_utils import ChampSelectEngine, build_champ_select_plan
+from core.constants import BRAVERY_CHAMPION_ID
+
+CHAMPIONS_MAP = {"Ahri": 103, "Annie": 1, "Garen": 86, "Lux": 99}
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakeConnection:
+    def __init__(self, rejected=()):
+        self.requests = []
+        self.rejected = set(rejected)
+
+    async def request(self, method, endpoint, data=None):
+        self.requests.append((endpoint, data["championId"]))
+        await asyncio.sleep(0.01)
+        return FakeResponse(500 if data["championId"] in self.rejected else 204)
+
+
+def make_session(action_type="pick", action_id=7, completed=()):
+    actions = [[{"id": action_id, "actorCellId": 2, "type": action_type, "isInProgress": True}]]
+    actions.append([{"id": 100 + i, "actorCellId": 5, "type": "pick", "completed": True, "championId": cid}
+                    for i, cid in enumerate(completed)])
+    return {"timer": {"phase": "BAN_PICK"}, "localPlayerCellId": 2, "actions": actions}
+
+
+def test_plan_orders_preferred_then_bravery_then_fallbacks():
+    plan = build_champ_select_plan("Ahri", CHAMPIONS_MAP)
+    assert plan.preferred_champ_id == 103
+    assert plan.pick_ids[:2] == [103, BRAVERY_CHAMPION_ID]
+    assert sorted(plan.pick_ids[2:]) == [1, 86, 99]
+    assert 103 not in plan.ban_ids
+
+
+def test_burst_of_updates_handles_each_action_once():
+    async def run():
+        engine = ChampSelectEngine()
+        engine.start(build_champ_select_plan("Ahri", CHAMPIONS_MAP))
+        connection = FakeConnection(rejected={BRAVERY_CHAMPION_ID})
+        for _ in range(20):
+            worker = engine.update(connection, make_session(completed=(103,)))
+        await worker
+        return engine, connection
+
+    engine, connection = asyncio.run(run())
+    # Ahri is taken and Bravery is rejected, so the first fallback is picked
+    assert [champ_id for _, champ_id in connection.requests][:1] == [BRAVERY_CHAMPION_ID]
+    assert len(connection.requests) == 2
+    assert {endpoint for endpoint, _ in connection.requests} == {"/lol-champ-select/v1/session/actions/7"}
+    assert engine.stats["updates"] == 20 and engine.stats["passes"] == 1
+
+
+def test_sessions_wait_for_a_plan_built_elsewhere():
+    async def run():
+        engine = ChampSelectEngine()
+        engine.reset()
+        connection = FakeConnection()
+        worker = engine.update(connection, make_session(action_type="ban"))
+        await worker
+        assert connection.requests == []  # No plan yet; the session is kept
+
+        plan = await asyncio.get_running_loop().run_in_executor(
+            None, build_champ_select_plan, "Ahri", CHAMPIONS_MAP
+        )
+        engine.start(plan)
+        await engine._worker
+        return plan, connection
+
+    plan, connection = asyncio.run(run())
+    assert connection.requests == [("/lol-champ-select/v1/session/actions/7", plan.ban_ids[0])]
+
+
+def test_action_is_retried_after_every_candidate_was_rejected():
+    async def run():
+        engine = ChampSelectEngine(max_attempts=2)
+        plan = build_champ_select_plan("Ahri", CHAMPIONS_MAP)
+        engine.start(plan)
+        connection = FakeConnection(rejected=plan.pick_ids[:2])
+        await engine.update(connection, make_session())
+        assert len(connection.requests) == 2
+
+        connection.rejected.clear()
+        await engine.update(connection, make_session())
+        await engine.update(connection, make_session())  # Stale session after the PATCH succeeded
+        return plan, connection
+
+    plan, connection = asyncio.run(run())
+    assert [champ_id for _, champ_id in connection.requests] == plan.pick_ids[:2] + [plan.pick_ids[0]]
@@ -0,0 +1,46 @@
+import json
+import os
+
+from utils.config_utils import ConfigStore
+
+
+def write_config(path, config, mtime):
+    path.write_text(json.dumps(config))
+    os.utime(path, (mtime, mtime))
+
+
+def test_store_parses_once_and_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path, {"Keybinds": {"shop": "p"}}, 1_000_000)
+    store = ConfigStore(str(path), check_interval=0)
+    changes = []
+    store.subscribe(changes.append)
+
+    config = store.get()
+    assert store.get() is config  # Unchanged file is not parsed again
+    assert changes == []
+
+    write_config(path, {"Keybinds": {"shop": "o"}}, 1_000_001)
+    assert store.get()["Keybinds"]["shop"] == "o"
+    assert changes == [{"Keybinds": {"shop": "o"}}]
+
+    # A half-written edit keeps the last good config
+    path.write_text('{"Keybinds": ')
+    os.utime(path, (1_000_002, 1_000_002))
+    assert store.get()["Keybinds"]["shop"] == "o"
+
+
+def test_save_is_atomic_and_notifies(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path, {"General": {}}, 1_000_000)
+    store = ConfigStore(str(path), check_interval=60)
+    changes = []
+    store.subscribe(changes.append)
+
+    config = {"General": {"selected_game_mode": "arena"}}
+    store.save(config)
+    config["General"]["selected_game_mode"] = "aram"  # Caller's dict is not the cached one
+    assert store.get()["General"]["selected_game_mode"] == "arena"
+    assert json.loads(path.read_text()) == {"General": {"selected_game_mode": "arena"}}
+    assert not os.path.exists(f"{path}.tmp")
+    assert len(changes) == 1
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+from utils.game_loop_utils import GameLoopRunner, GameflowWatchdog
+
+
+def test_stop_waits_for_loop_without_blocking_event_loop():
+    def game_loop(stop_event):
+        while not stop_event.is_set():
+            time.sleep(0.01)
+        time.sleep(0.2)  # Cleanup after the stop signal
+
+    async def run():
+        runner = GameLoopRunner()
+        assert runner.start(game_loop)
+        assert not runner.start(game_loop)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        stopped = await runner.stop(timeout=2)
+        task.cancel()
+        return runner, stopped, ticks
+
+    runner, stopped, ticks = asyncio.run(run())
+    assert stopped and not runner.is_running()
+    assert ticks >= 5  # The loop kept running while the thread was joined
+
+
+def test_stop_times_out_and_isolates_stuck_loop():
+    release = threading.Event()
+    seen_events = []
+
+    def stuck_loop(stop_event):
+        seen_events.append(stop_event)
+        release.wait(5)
+
+    async def run():
+        runner = GameLoopRunner()
+        runner.start(stuck_loop)
+        stopped = await runner.stop(timeout=0.05)
+        runner.start(stuck_loop)
+        return runner, stopped
+
+    runner, stopped = asyncio.run(run())
+    release.set()
+    assert not stopped
+    # The stuck loop keeps its set event; the new game gets a fresh one
+    assert seen_events[0].is_set() and seen_events[1] is runner.stop_event and not runner.stop_event.is_set()
+
+
+def test_watchdog_escalates_overrun_phases_and_counts_games():
+    watchdog = GameflowWatchdog({"Lobby": 10, "EndOfGame": 5}, max_level=2)
+    watchdog.enter("Lobby", now=0)
+    assert watchdog.check(now=9) == 0
+    assert watchdog.check(now=10) == 1
+    assert watchdog.check(now=15) == 0  # Level 1 is reported once
+    assert watchdog.check(now=20) == 2
+    assert watchdog.check(now=30) == 1  # Out of levels: a stall, escalation starts over
+    assert watchdog.stalls == 1
+
+    watchdog.enter("Lobby", now=31)  # Repeated phase does not reset the timer
+    watchdog.enter("InProgress", now=32)
+    assert watchdog.check(now=5000) == 0  # No budget, not watched
+    watchdog.enter("EndOfGame", now=1832)
+
+    stats = watchdog.stats(now=1832)
+    assert stats["games_completed"] == 1
+    assert stats["phase_seconds"] == {"Lobby": 32, "InProgress": 1800, "EndOfGame": 0}
+    assert stats["recoveries"] == {"Lobby:1": 2, "Lobby:2": 1}
+
+
+def test_runner_tells_a_finished_loop_from_a_crashed_one():
+    def finished_loop(stop_event):
+        pass  # Returns on its own, like Arena's loop on GameEnd
+
+    def crashed_loop(stop_event):
+        raise RuntimeError("boom")
+
+    runner = GameLoopRunner()
+    assert not runner.finished
+    runner.start(finished_loop)
+    runner._thread.join(1)
+    assert not runner.is_running() and runner.finished
+
+    runner.start(crashed_loop)
+    runner._thread.join(1)
+    assert not runner.is_running() and not runner.finished
+
+
+def test_restarts_of_a_crashing_loop_back_off_and_stop():
+    def crashed_loop(stop_event):
+        raise RuntimeError("boom")
+
+    runner = GameLoopRunner(max_restarts=2, restart_backoff=10)
+    assert runner.restart_allowed()
+    runner.start(crashed_loop)
+    runner._thread.join(1)
+    crashed_at = runner._last_crash
+    assert not runner.restart_allowed(now=crashed_at + 9)
+    assert runner.restart_allowed(now=crashed_at + 10)
+
+    runner.start(crashed_loop)
+    runner._thread.join(1)
+    assert not runner.restart_allowed(now=runner._last_crash + 19)  # Backoff doubled
+    assert runner.restart_allowed(now=runner._last_crash + 20)
+
+    runner.start(crashed_loop)
+    runner._thread.join(1)
+    assert runner.crashes == 3 and not runner.restart_allowed(now=runner._last_crash + 3600)
+    runner.reset_crashes()
+    assert runner.restart_allowed()
@@ -0,0 +1,361 @@
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.constants import (
+    HEALTH_TICK_COLOR, ENEMY_HEALTH_BAR_COLOR, ALLY_HEALTH_BAR_COLOR, PLAYER_HEALTH_BAR_COLOR
+)
+from utils import game_utils
+from utils.game_utils import (
+    locate_health_bar, locate_health_bar_pyramid, find_champion_location, detect_health_bars,
+    find_champion_locations, ChampionTracker, measure_fill_width
+)
+
+
+def reference_find_champion_location(img, health_bar_bgr, health_tick_bgr, tolerance=2):
+    """
+    The original per-pixel implementation of find_champion_location, kept as the oracle.
+    """
+    import cv2
+    lower_health_bar = np.array([max(c - tolerance, 0) for c in health_bar_bgr], dtype=np.uint8)
+    upper_health_bar = np.array([min(c + tolerance, 255) for c in health_bar_bgr], dtype=np.uint8)
+    mask_health_bar = cv2.inRange(img, lower_health_bar, upper_health_bar)
+
+    lower_health_tick = np.array([max(c - tolerance, 0) for c in health_tick_bgr], dtype=np.uint8)
+    upper_health_tick = np.array([min(c + tolerance, 255) for c in health_tick_bgr], dtype=np.uint8)
+    mask_health_tick = cv2.inRange(img, lower_health_tick, upper_health_tick)
+
+    search_size_x = 100
+    height, width = mask_health_bar.shape
+
+    for y in range(height):
+        for x in range(width):
+            if mask_health_bar[y, x] > 0:
+                for dx in range(0, search_size_x + 1):
+                    nx = x + dx
+                    if nx < width and mask_health_tick[y, nx] > 0:
+                        return (x, y+160)
+    return None
+
+
+def make_frame(width=320, height=180, seed=0):
+    rng = np.random.default_rng(seed)
+    # Noise kept away from the black tick color and bar colors
+    return rng.integers(20, 90, size=(height, width, 3), dtype=np.uint8)
+
+
+def draw_health_bar(img, x, y, width=60, height=4, color=ENEMY_HEALTH_BAR_COLOR, ticks=(10, 20, 30)):
+    img[y:y + height, x:x + width] = color
+    for tick in ticks:
+        img[y:y + height - 1, x + tick] = HEALTH_TICK_COLOR
+
+
+def run_both(img, bar_color=ENEMY_HEALTH_BAR_COLOR, tolerance=2):
+    expected = reference_find_champion_location(img, bar_color, HEALTH_TICK_COLOR, tolerance)
+    location = locate_health_bar(img, bar_color, HEALTH_TICK_COLOR, tolerance)
+    actual = (location[0], location[1] + 160) if location else None
+    return expected, actual
+
+
+def test_empty_frame_matches():
+    expected, actual = run_both(make_frame())
+    assert expected is None
+    assert actual is None
+
+
+def test_single_bar_matches():
+    img = make_frame()
+    draw_health_bar(img, 40, 50)
+    expected, actual = run_both(img)
+    assert expected == actual == (40, 210)
+
+
+def test_first_bar_in_row_major_order_wins():
+    img = make_frame()
+    draw_health_bar(img, 200, 30)
+    draw_health_bar(img, 20, 90)
+    draw_health_bar(img, 100, 30)
+    expected, actual = run_both(img)
+    assert expected == actual == (100, 190)
+
+
+def test_bar_without_tick_is_ignored():
+    img = make_frame()
+    draw_health_bar(img, 40, 50, ticks=())
+    draw_health_bar(img, 150, 120)
+    expected, actual = run_both(img)
+    assert expected == actual == (150, 280)
+
+
+def test_tick_beyond_search_width_is_ignored():
+    img = make_frame()
+    img[60, 10:20] = ENEMY_HEALTH_BAR_COLOR
+    img[60, 125] = HEALTH_TICK_COLOR  # 105px from the last bar pixel on this row
+    expected, actual = run_both(img)
+    assert expected == actual is None
+
+
+def test_tick_at_right_edge_of_frame():
+    img = make_frame()
+    img[70, 300] = ENEMY_HEALTH_BAR_COLOR
+    img[70, 319] = HEALTH_TICK_COLOR
+    expected, actual = run_both(img)
+    assert expected == actual == (300, 230)
+
+
+def test_other_bar_colors_are_ignored():
+    img = make_frame()
+    draw_health_bar(img, 40, 50, color=ALLY_HEALTH_BAR_COLOR)
+    expected, actual = run_both(img)
+    assert expected == actual is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("tolerance", [0, 2, 10])
+def test_random_frames_match(seed, tolerance):
+    rng = np.random.default_rng(seed)
+    img = make_frame(seed=seed)
+    for _ in range(rng.integers(1, 6)):
+        x = int(rng.integers(0, 300))
+        y = int(rng.integers(0, 175))
+        width = int(rng.integers(5, 80))
+        ticks = tuple(int(t) for t in rng.integers(0, 130, size=rng.integers(0, 4)))
+        draw_health_bar(img, x, y, width=width, ticks=[t for t in ticks if x + t < 320])
+    # Sprinkle colors near the tolerance boundary
+    jitter = rng.integers(-12, 13, size=3)
+    img[int(rng.integers(0, 180)), int(rng.integers(0, 320))] = np.clip(
+        np.array(ENEMY_HEALTH_BAR_COLOR) + jitter, 0, 255
+    )
+    expected, actual = run_both(img, tolerance=tolerance)
+    assert expected == actual
+
+
+def test_find_champion_location_uses_screenshot(monkeypatch):
+    img = make_frame()
+    draw_health_bar(img, 40, 50)
+    monkeypatch.setattr(game_utils, "capture_region", lambda region=None: (img, (0, 0)))
+    assert find_champion_location(ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR) == (40, 210)
+
+
+def test_find_champion_location_offsets_region_origin(monkeypatch):
+    img = make_frame()
+    draw_health_bar(img, 40, 50)
+    monkeypatch.setattr(game_utils, "capture_region", lambda region=None: (img, (1920, 100)))
+    assert find_champion_location(ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR, region="play_field") == (1960, 310)
+
+
+def test_detect_health_bars_finds_every_class():
+    img = make_frame()
+    draw_health_bar(img, 40, 20, color=ENEMY_HEALTH_BAR_COLOR)
+    draw_health_bar(img, 200, 60, color=ALLY_HEALTH_BAR_COLOR)
+    draw_health_bar(img, 120, 100, color=PLAYER_HEALTH_BAR_COLOR)
+    draw_health_bar(img, 10, 140, color=ENEMY_HEALTH_BAR_COLOR)
+    bars = detect_health_bars(img)
+    assert [(bar.champion_class, bar.location) for bar in bars] == [
+        ("enemy", (40, 180)),
+        ("ally", (200, 220)),
+        ("player", (120, 260)),
+        ("enemy", (10, 300)),
+    ]
+    assert bars[0].box == (40, 20, 60, 4)
+
+
+def test_detect_health_bars_skips_bars_without_ticks():
+    img = make_frame()
+    draw_health_bar(img, 40, 20, color=ALLY_HEALTH_BAR_COLOR, ticks=())
+    assert detect_health_bars(img) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_detect_health_bars_agrees_with_single_class_search(seed):
+    rng = np.random.default_rng(seed)
+    img = make_frame(seed=seed)
+    for color in (ENEMY_HEALTH_BAR_COLOR, ALLY_HEALTH_BAR_COLOR, PLAYER_HEALTH_BAR_COLOR):
+        for _ in range(rng.integers(0, 3)):
+            draw_health_bar(img, int(rng.integers(0, 250)), int(rng.integers(0, 170)), color=color)
+    champions = find_champion_locations(img)
+    for name, color in (("enemy", ENEMY_HEALTH_BAR_COLOR), ("ally", ALLY_HEALTH_BAR_COLOR),
+                        ("player", PLAYER_HEALTH_BAR_COLOR)):
+        expected = reference_find_champion_location(img, color, HEALTH_TICK_COLOR)
+        actual = champions[name][0].location if champions[name] else None
+        assert expected == actual
+
+
+def fake_screen(monkeypatch, img):
+    """
+    Serves absolute-rect captures out of img, as if img were the whole screen.
+    """
+    height, width = img.shape[:2]
+    full = {"left": 0, "top": 0, "width": width, "height": height}
+    captured = []
+
+    def capture(region=None):
+        rect = full if region is None or isinstance(region, str) else region
+        captured.append(rect)
+        top, left = rect["top"], rect["left"]
+        return img[top:top + rect["height"], left:left + rect["width"]], (left, top)
+
+    monkeypatch.setattr(game_utils, "capture_region", capture)
+    monkeypatch.setattr(game_utils, "resolve_region", lambda region=None: full)
+    return captured
+
+
+def test_tracker_uses_predicted_window_after_first_hit(monkeypatch):
+    img = make_frame(640, 360)
+    draw_health_bar(img, 300, 100)
+    captured = fake_screen(monkeypatch, img)
+    tracker = ChampionTracker(ENEMY_HEALTH_BAR_COLOR, window_size=(200, 100))
+
+    assert tracker.update() == (300, 260)
+    assert tracker.update() == (300, 260)
+    assert tracker.stats["full_scans"] == 1
+    assert tracker.stats["window_hits"] == 1
+    assert captured[-1]["width"] == 200
+    assert tracker.confidence > 0.5
+
+
+def test_tracker_falls_back_to_full_scan_and_drops_lost_target(monkeypatch):
+    img = make_frame(640, 360)
+    draw_health_bar(img, 300, 100)
+    fake_screen(monkeypatch, img)
+    tracker = ChampionTracker(ENEMY_HEALTH_BAR_COLOR, window_size=(200, 100), max_misses=1)
+    tracker.update()
+
+    img[:] = make_frame(640, 360)
+    draw_health_bar(img, 20, 300)
+    assert tracker.update() == (20, 460)
+    assert tracker.stats["window_misses"] == 1
+
+    img[:] = make_frame(640, 360)
+    assert tracker.update() is None
+    assert tracker.position is None
+    assert tracker.confidence == 0.0
+
+
+@pytest.mark.parametrize("scale", [2, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_pyramid_search_matches_full_resolution(scale, seed):
+    rng = np.random.default_rng(seed)
+    img = make_frame(seed=seed)
+    for _ in range(rng.integers(0, 4)):
+        draw_health_bar(img, int(rng.integers(0, 250)), int(rng.integers(0, 170)), height=scale + 2)
+    assert locate_health_bar_pyramid(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR, scale=scale) == \
+        locate_health_bar(img, ENEMY_HEALTH_BAR_COLOR, HEALTH_TICK_COLOR)
+
+
+def test_measure_fill_width_bridges_ticks():
+    row = np.zeros(105, dtype=np.uint8)
+    row[:60] = 255
+    row[[10, 20, 30]] = 0
+    row[70:75] = 255  # Separate blob past a real gap
+    assert measure_fill_width(row) == 60
+    assert measure_fill_width(np.zeros(105, dtype=np.uint8)) == 0
+
+
+def test_detect_health_bars_estimates_fill_ratio():
+    img = make_frame()
+    draw_health_bar(img, 40, 20, width=84, color=ENEMY_HEALTH_BAR_COLOR)
+    draw_health_bar(img, 150, 100, width=21, color=ALLY_HEALTH_BAR_COLOR, ticks=(5,))
+    enemy, ally = detect_health_bars(img, bar_width=105)
+    assert enemy.fill_ratio == pytest.approx(0.8)
+    assert ally.fill_ratio == pytest.approx(0.2)
+
+
+
+
+def test_tracker_can_acquire_the_lowest_hp_enemy(monkeypatch):
+    img = make_frame(640, 360)
+    draw_health_bar(img, 300, 100, width=84)
+    draw_health_bar(img, 40, 200, width=21, ticks=(5,))
+    fake_screen(monkeypatch, img)
+    monkeypatch.setattr(game_utils, "get_health_bar_width", lambda: 105)
+
+    assert ChampionTracker(ENEMY_HEALTH_BAR_COLOR).update() == (300, 260)
+    tracker = ChampionTracker(ENEMY_HEALTH_BAR_COLOR, window_size=(200, 100), prefer_low_hp=True)
+    assert tracker.update() == (40, 360)
+    assert tracker.update() == (40, 360)  # Followed in the predicted window
+    assert tracker.stats["window_hits"] == 1
+
+def test_find_champion_locations_scales_bar_width_from_given_frame(monkeypatch):
+    monkeypatch.setattr(game_utils, "get_window_rect", lambda: pytest.fail("img was given"))
+    img = make_frame(640, 540)  # Half of the 1080p reference, so a full bar is 52 px wide
+    draw_health_bar(img, 40, 20, width=26)
+    enemy, = find_champion_locations(img)["enemy"]
+    assert enemy.fill_ratio == pytest.approx(0.5)
+
+def test_tracker_reset_for_new_game_clears_track_and_stats(monkeypatch):
+    img = make_frame(640, 360)
+    draw_health_bar(img, 300, 100)
+    fake_screen(monkeypatch, img)
+    tracker = ChampionTracker(ENEMY_HEALTH_BAR_COLOR, window_size=(200, 100))
+    tracker.update()
+    tracker.update()
+
+    tracker.reset()  # Dropping a lost track keeps the counters
+    assert tracker.position is None and tracker.stats["window_hits"] == 1
+    tracker.update()
+    tracker.reset(clear_stats=True)
+    assert tracker.position is None and tracker.confidence == 0.0
+    assert tracker.stats == {"window_hits": 0, "window_misses": 0, "full_scans": 0, "full_hits": 0}
+
+
+class FakeOcrService:
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, query_key, target_texts, region=None):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def shop(monkeypatch):
+    service = FakeOcrService()
+    keys, clicks = [], []
+    monkeypatch.setattr(game_utils, "find_label_location", lambda *args, **kwargs: None)
+    monkeypatch.setattr(game_utils, "submit_label_ocr", service.submit)
+    monkeypatch.setattr(game_utils, "keyboard", SimpleNamespace(send=keys.append))
+    monkeypatch.setattr(game_utils, "click_percent", lambda *args: clicks.append(args))
+    monkeypatch.setattr(game_utils, "_keybinds", {"shop": "p"})
+    game_utils.reset_shop_search()
+    yield service, keys, clicks
+    game_utils.reset_shop_search()
+
+
+def test_buy_recommended_items_polls_shop_ocr_without_waiting(shop):
+    service, keys, clicks = shop
+    assert game_utils.buy_recommended_items(now=0) is False
+    assert game_utils.buy_recommended_items(now=1) is False
+    assert len(service.futures) == 1  # Still in flight; not resubmitted
+
+    service.futures[0].set_result({"SELL": (500, 800, 40, 12)})
+    assert game_utils.buy_recommended_items(now=2) is True
+    assert clicks[0] == (500, 800, 0, -60, "left") and len(clicks) == 4
+    assert keys == ["p"]  # Closes the shop
+
+
+def test_buy_recommended_items_opens_shop_then_gives_up(shop):
+    service, keys, clicks = shop
+    assert game_utils.buy_recommended_items(now=0) is False
+    service.futures[0].set_result({"SELL": None})
+    assert game_utils.buy_recommended_items(now=0.5) is False
+    assert keys == ["p"]  # Opened the shop
+
+    assert game_utils.buy_recommended_items(now=0.7) is False  # Shop still opening
+    assert game_utils.buy_recommended_items(now=1.0) is False
+    assert len(service.futures) == 3  # Resubmitted, and again after the shop opened
+    assert service.futures[1].cancelled()  # Frame from before the shop opened
+    assert game_utils.buy_recommended_items(now=1.0 + game_utils.SHOP_OCR_TIMEOUT) is True
+    assert keys == ["p"] and clicks == []
+
+
+def test_buy_recommended_items_never_toggles_shop_without_ocr_result(shop):
+    service, keys, clicks = shop
+    assert game_utils.buy_recommended_items(now=0) is False
+    assert game_utils.buy_recommended_items(now=game_utils.SHOP_OCR_TIMEOUT - 0.1) is False
+    assert game_utils.buy_recommended_items(now=game_utils.SHOP_OCR_TIMEOUT + 1) is True
+    assert keys == [] and clicks == []  # Shop may already be open; left alone
+    assert service.futures[0].cancelled()
@@ -0,0 +1,270 @@
+import json
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+import utils.general_utils as general_utils
+
+CHAMPION_DATA = {"data": {"Ahri": {"name": "Ahri", "key": "103"}, "Annie": {"name": "Annie", "key": "1"}}}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def data_dragon(tmp_path, monkeypatch):
+    requests_made = []
+
+    def fake_get(url, timeout=None):
+        requests_made.append(url)
+        if url == general_utils.DATA_DRAGON_VERSIONS_URL:
+            return FakeResponse(["15.2.1", "15.1.1"])
+        return FakeResponse(CHAMPION_DATA)
+
+    monkeypatch.setattr(general_utils, "DATA_DRAGON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(general_utils.requests, "get", fake_get)
+    monkeypatch.setattr(general_utils, "_data_dragon_data", {})
+    monkeypatch.setattr(general_utils, "_data_dragon_version", None)
+    monkeypatch.setattr(general_utils, "_champions_maps", {})
+    return tmp_path, requests_made
+
+
+def test_champions_map_is_fetched_once_per_version(data_dragon):
+    cache_dir, requests_made = data_dragon
+    assert general_utils.get_champions_map() == {"Ahri": 103, "Annie": 1}
+    assert general_utils.get_champions_map() is general_utils.get_champions_map()
+    assert len(requests_made) == 2  # versions.json + champion.json
+    assert (cache_dir / "15.2.1" / "en_US" / "champion.json").exists()
+    assert json.loads((cache_dir / "version.json").read_text())["version"] == "15.2.1"
+
+
+def test_data_dragon_works_offline_from_disk(data_dragon, monkeypatch):
+    general_utils.get_champions_map()
+    monkeypatch.setattr(general_utils, "_data_dragon_data", {})
+    monkeypatch.setattr(general_utils, "_champions_maps", {})
+    monkeypatch.setattr(general_utils, "_data_dragon_version", None)
+
+    def offline(url, timeout=None):
+        raise general_utils.requests.ConnectionError("offline")
+
+    monkeypatch.setattr(general_utils.requests, "get", offline)
+    # The version lookup has expired, but the stale version and its data are still served
+    assert general_utils.get_data_dragon_version(max_age=0) == "15.2.1"
+    assert general_utils.get_champions_map() == {"Ahri": 103, "Annie": 1}
+    assert general_utils.fetch_data_dragon_data("champion", version="99.1.1") == CHAMPION_DATA
+
+
+def test_data_dragon_version_lookup_does_not_hold_the_lock(data_dragon, monkeypatch):
+    in_request, release = threading.Event(), threading.Event()
+
+    def slow_get(url, timeout=None):
+        in_request.set()
+        release.wait(5)
+        return FakeResponse(["15.3.1"])
+
+    monkeypatch.setattr(general_utils.requests, "get", slow_get)
+    lookup = threading.Thread(target=general_utils.get_data_dragon_version)
+    lookup.start()
+    assert in_request.wait(5)
+    assert general_utils._data_dragon_lock.acquire(timeout=1)  # Free while the request is in flight
+    general_utils._data_dragon_lock.release()
+    release.set()
+    lookup.join(5)
+    assert general_utils.get_data_dragon_version() == "15.3.1"
+
+
+# PSM 11 image_to_data output: "Exit Now" and "SELL ... Sell", each line 1 of its own block
+OCR_DATA = {
+    "text": ["", "Exit", "Now", " ", "SELL", "Gold", "Sell"],
+    "left": [0, 10, 50, 0, 10, 60, 120],
+    "top": [0, 20, 22, 0, 80, 80, 81],
+    "width": [200, 35, 40, 0, 40, 30, 38],
+    "height": [100, 12, 10, 0, 14, 14, 12],
+    "block_num": [0, 1, 1, 2, 2, 2, 2],
+    "par_num": [0, 1, 1, 0, 1, 1, 1],
+    "line_num": [0, 1, 1, 0, 1, 1, 1],
+}
+
+
+class FakeOcrBackend:
+    def __init__(self, data=OCR_DATA):
+        self.data = data
+        self.calls = 0
+
+    def image_to_data(self, img):
+        self.calls += 1
+        return self.data
+
+
+def test_ocr_data_to_lines_groups_words_and_offsets_boxes():
+    lines = general_utils.ocr_data_to_lines(OCR_DATA, origin=(100, 200))
+    assert lines == {
+        (1, 1, 1): [{"text": "Exit", "box": (110, 220, 35, 12)}, {"text": "Now", "box": (150, 222, 40, 10)}],
+        (2, 1, 1): [{"text": "SELL", "box": (110, 280, 40, 14)}, {"text": "Gold", "box": (160, 280, 30, 14)},
+            {"text": "Sell", "box": (220, 281, 38, 12)}],
+    }
+
+
+def test_word_index_is_case_insensitive_with_phrases_and_duplicates():
+    index = general_utils.build_word_index(general_utils.ocr_data_to_lines(OCR_DATA))
+    assert index["exit"] == [(10, 20, 35, 12)]
+    assert index["sell"] == [(10, 80, 40, 14), (120, 81, 38, 12)]  # Reading order
+    assert index["exit now"] == [(10, 20, 80, 12)]
+    assert index["sell gold sell"] == [(10, 80, 148, 14)]
+    assert "now sell" not in index  # Phrases do not span lines, even with equal line_num
+    assert "exit now" not in general_utils.build_word_index(general_utils.ocr_data_to_lines(OCR_DATA), 1)
+
+
+
+class FakeResultIterator:
+    """
+    Walks (block, paragraph, line, text) words the way a tesserocr result iterator does.
+    """
+    LEVELS = {"BLOCK": 1, "PARA": 2, "TEXTLINE": 3}  # Depth of the word tuple each level compares
+
+    def __init__(self, words):
+        self.words = words
+        self.i = 0
+
+    def IsAtBeginningOf(self, level):
+        return self.i == 0 or self.words[self.i][:level] != self.words[self.i - 1][:level]
+
+    def GetUTF8Text(self, level):
+        return self.words[self.i][3]
+
+    def BoundingBox(self, level):
+        return (10 * self.i, 0, 10 * self.i + 8, 12)
+
+    def Confidence(self, level):
+        return 90.0
+
+    def Next(self, level):
+        self.i += 1
+        return self.i < len(self.words)
+
+
+def test_tesserocr_backend_numbers_lines_within_blocks_and_paragraphs(monkeypatch):
+    words = [(1, 1, 1, "Exit"), (1, 1, 1, "Now"), (1, 2, 1, "Gold"), (1, 2, 2, "Shop"), (2, 1, 1, "SELL")]
+    api = type("FakeApi", (), {
+        "SetImageBytes": lambda self, *args: None,
+        "Recognize": lambda self: None,
+        "GetIterator": lambda self: FakeResultIterator(words),
+    })
+    monkeypatch.setattr(general_utils, "tesserocr", type("FakeTesserocr", (), {
+        "PyTessBaseAPI": lambda **kwargs: api(),
+        "RIL": type("RIL", (), {"WORD": 4, **FakeResultIterator.LEVELS}),
+    }))
+    data = general_utils.TesserocrBackend().image_to_data(np.zeros((12, 60), dtype=np.uint8))
+    assert list(zip(data["block_num"], data["par_num"], data["line_num"])) == [
+        (1, 1, 1), (1, 1, 1), (1, 2, 1), (1, 2, 2), (2, 1, 1)
+    ]
+    assert list(general_utils.ocr_data_to_lines(data)) == [(1, 1, 1), (1, 2, 1), (1, 2, 2), (2, 1, 1)]
+
+def test_find_text_locations_answers_every_target_from_one_pass(monkeypatch):
+    backend = FakeOcrBackend()
+    monkeypatch.setattr(general_utils, "get_ocr_backend", lambda: backend)
+    img = np.zeros((120, 200, 3), dtype=np.uint8)
+    matches = general_utils.find_text_locations(
+        ("EXIT NOW", "exit", "Sell", "Shop"), img=img, origin=(5, 5), use_layout_cache=False
+    )
+    assert backend.calls == 1
+    assert matches == {
+        "EXIT NOW": (15, 25, 80, 12),
+        "exit": (15, 25, 35, 12),
+        "Sell": (15, 85, 40, 14),  # First of the duplicates
+        "Shop": None,
+    }
+
+
+class BlockOcrBackend:
+    """
+    Reads every white block in the image as the word mapped to its width.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self.shapes = []
+
+    def image_to_data(self, img):
+        self.shapes.append(img.shape[:2])
+        keys = ("text", "left", "top", "width", "height", "block_num", "par_num", "line_num")
+        data = {key: [] for key in keys}
+        count, _, stats, _ = cv2.connectedComponentsWithStats(img)
+        for block_num, (x, y, w, h, _) in enumerate(stats[1:count], start=1):
+            for key, value in zip(keys, (self.words.get(int(w), "?"), x, y, w, h, block_num, 1, 1)):
+                data[key].append(int(value) if key != "text" else value)
+        return data
+
+
+@pytest.fixture
+def layout_cache(tmp_path, monkeypatch):
+    backend = BlockOcrBackend({40: "SELL", 30: "EXIT"})
+    window = {"rect": (0, 0, 320, 240)}
+    cache_path = tmp_path / "ocr_layout_cache.json"
+    monkeypatch.setattr(general_utils, "OCR_LAYOUT_CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(general_utils, "_ocr_layout", None)
+    monkeypatch.setattr(general_utils, "_ocr_layout_stats", {"hits": 0, "misses": 0})
+    monkeypatch.setattr(general_utils, "get_window_rect", lambda title=None: window["rect"])
+    monkeypatch.setattr(general_utils, "get_ocr_backend", lambda: backend)
+    return backend, window, cache_path
+
+
+def block_frame(blocks, size=(240, 320)):
+    img = np.zeros(size + (3,), dtype=np.uint8)
+    for x, y, w, h in blocks:
+        img[y:y + h, x:x + w] = 255
+    return img
+
+
+def test_layout_cache_miss_then_hit_on_a_small_crop(layout_cache):
+    backend, _, cache_path = layout_cache
+    img = block_frame([(200, 150, 40, 12)])
+
+    assert general_utils.find_text_locations(("SELL",), img=img) == {"SELL": (200, 150, 40, 12)}
+    assert backend.shapes == [(240, 320)]
+    assert json.loads(cache_path.read_text()) == {"320x240": {"SELL": [200, 150, 40, 12]}}
+
+    assert general_utils.find_text_locations(("SELL",), img=img) == {"SELL": (200, 150, 40, 12)}
+    crop_height, crop_width = backend.shapes[-1]
+    assert len(backend.shapes) == 2 and crop_height < 240 and crop_width < 320
+    assert general_utils.get_ocr_layout_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_layout_cache_is_replaced_when_the_label_moves(layout_cache):
+    backend, _, cache_path = layout_cache
+    general_utils.find_text_locations(("SELL",), img=block_frame([(200, 150, 40, 12)]))
+
+    moved = block_frame([(20, 30, 40, 12)])
+    assert general_utils.find_text_locations(("SELL",), img=moved) == {"SELL": (20, 30, 40, 12)}
+    assert backend.shapes[-1] == (240, 320)  # Empty crop, escalated to the full frame
+    assert json.loads(cache_path.read_text()) == {"320x240": {"SELL": [20, 30, 40, 12]}}
+
+    general_utils.find_text_locations(("SELL",), img=moved)
+    assert general_utils.get_ocr_layout_stats()["hits"] == 1
+
+
+def test_layout_cache_is_keyed_by_resolution_and_survives_reload(layout_cache, monkeypatch):
+    backend, window, cache_path = layout_cache
+    img = block_frame([(200, 150, 40, 12), (60, 100, 30, 10)])
+    general_utils.find_text_locations(("SELL", "EXIT"), img=img)
+
+    window["rect"] = (0, 0, 640, 480)
+    general_utils.find_text_locations(("SELL",), img=img)
+    assert general_utils.get_ocr_layout_stats() == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+
+    window["rect"] = (0, 0, 320, 240)
+    monkeypatch.setattr(general_utils, "_ocr_layout", None)  # Reload from disk
+    matches = general_utils.find_text_locations(("SELL", "EXIT"), img=img, use_layout_cache=True)
+    assert matches == {"SELL": (200, 150, 40, 12), "EXIT": (60, 100, 30, 10)}
+    assert general_utils.get_ocr_layout_stats()["hits"] == 2
+    assert set(json.loads(cache_path.read_text())) == {"320x240", "640x480"}
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import os
+import threading
+from types import SimpleNamespace
+
+from utils.live_client_utils import (
+    AsyncLiveClientPoller, LiveClientPoller, EventLog, EventIngestor, GameSnapshot, SnapshotPublisher, StateChangeBus, drain_queue,
+    LEVEL_GAINED, DIED, RESPAWNED, HP_CROSSED_BELOW, HP_CROSSED_ABOVE, GOLD_CHANGED, GAME_ENDED
+)
+
+LIVE_CLIENT_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "live_client_data.json")
+
+
+RAW_EVENTS = [
+    {"EventID": 0, "EventName": "GameStart", "EventTime": 0.02},
+    {"EventID": 1, "EventName": "ChampionKill", "EventTime": 77.5, "KillerName": "A", "VictimName": "B"},
+    {"EventID": 2, "EventName": "FirstBlood", "EventTime": 77.5, "Recipient": "A"},
+    {"EventID": 3, "EventName": "ChampionKill", "EventTime": 81.4, "KillerName": "C", "VictimName": "A"},
+]
+
+
+class FakePoller:
+    def __init__(self):
+        self.subscriptions = {}
+
+    def subscribe(self, endpoint, interval=0.2, callback=None, path=None):
+        self.subscriptions[endpoint] = (callback, path)
+
+
+def test_event_log_skips_seen_events_and_indexes_by_type():
+    log = EventLog()
+    assert len(log.ingest(RAW_EVENTS[:2])) == 2
+    new_events = log.ingest(RAW_EVENTS)
+    assert [event.event_id for event in new_events] == [2, 3]
+    assert log.last_event_id == 3
+
+    kills = log.since(78.0, "ChampionKill")
+    assert [(event.event_id, event.data["KillerName"]) for event in kills] == [(3, "C")]
+    assert len(log.since(0.0, "ChampionKill")) == 2
+    assert log.latest("FirstBlood").data == {"Recipient": "A"}
+    assert log.since(100.0) == []
+
+
+def test_event_ingestor_requests_only_new_events():
+    poller = FakePoller()
+    received = []
+    ingestor = EventIngestor(poller, callback=received.extend)
+    on_events, path = poller.subscriptions["eventdata"]
+    assert path() == "eventdata?eventID=0"
+
+    on_events({"Events": RAW_EVENTS[:3]})
+    assert path() == "eventdata?eventID=3"
+    on_events({"Events": RAW_EVENTS[3:]})
+    assert [event.event_id for event in received] == [0, 1, 2, 3]
+
+    # A new game restarts EventIDs at 0
+    on_events({"Events": RAW_EVENTS[:1]})
+    assert len(ingestor.event_log) == 1
+
+
+def load_live_client_data():
+    with open(LIVE_CLIENT_DATA_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_snapshot_from_allgamedata_keeps_only_used_fields():
+    data = load_live_client_data()
+    snapshot = GameSnapshot.from_allgamedata(data, seq=7)
+    active = data["activePlayer"]
+    assert snapshot.seq == 7
+    assert snapshot.level == active["level"]
+    assert snapshot.current_hp == active["championStats"]["currentHealth"]
+    assert snapshot.gold == active["currentGold"]
+    assert snapshot.ability_levels == tuple(active["abilities"][k]["abilityLevel"] for k in "QWER")
+    assert len(snapshot.players) == len(data["allPlayers"])
+    assert snapshot.players[0].champion == data["allPlayers"][0]["championName"]
+    assert not hasattr(snapshot, "__dict__")
+
+
+def test_snapshot_publisher_publishes_numbered_snapshots():
+    data = load_live_client_data()
+    poller = FakePoller()
+    publisher = SnapshotPublisher(poller)
+    on_active_player, _ = poller.subscriptions["activeplayer"]
+    on_player_list, _ = poller.subscriptions["playerlist"]
+    assert publisher.latest() is None
+
+    on_player_list(data["allPlayers"])
+    on_active_player(data["activePlayer"])
+    first = publisher.latest()
+    on_active_player(data["activePlayer"])
+    second = publisher.latest()
+    assert (first.seq, second.seq) == (1, 2)
+    assert second is not first
+    assert len(second.players) == len(data["allPlayers"])
+    assert publisher.latest(max_age=-1) is None
+
+
+def make_snapshot(seq, level=1, hp=100.0, max_hp=100.0, gold=500.0):
+    return GameSnapshot(seq, 0.0, level, hp, max_hp, gold, (0, 0, 0, 0), "Me#EUW", ())
+
+
+def test_state_change_bus_emits_typed_changes():
+    bus = StateChangeBus(hp_thresholds=(0.3,))
+    changes = bus.subscribe_queue()
+    levels = []
+    bus.subscribe(levels.append, kinds=(LEVEL_GAINED,))
+
+    bus.process(make_snapshot(1, level=3))
+    bus.process(make_snapshot(2, level=3, hp=20.0, gold=650.0))
+    bus.process(make_snapshot(3, level=4, hp=0.0, gold=650.0))
+    bus.process(make_snapshot(4, level=4, hp=100.0, gold=650.0))
+    bus.end_game("test")
+    bus.end_game("test")
+
+    assert [(c.kind, c.value) for c in drain_queue(changes)] == [
+        (LEVEL_GAINED, 3),
+        (HP_CROSSED_BELOW, 0.3),
+        (GOLD_CHANGED, 150.0),
+        (LEVEL_GAINED, 1),
+        (DIED, None),
+        (RESPAWNED, None),
+        (HP_CROSSED_ABOVE, 0.3),
+        (GAME_ENDED, "test"),
+    ]
+    assert [c.value for c in levels] == [3, 1]
+
+
+def test_state_change_bus_ignores_stale_snapshots():
+    bus = StateChangeBus()
+    bus.process(make_snapshot(2, level=2))
+    assert bus.process(make_snapshot(1, level=5)) == []
+
+
+def test_async_poller_backs_off_and_dispatches_on_loop():
+    poller = AsyncLiveClientPoller()
+    responses = {"activeplayer": [None, {"level": 1}], "playerlist": [[]]}
+
+    async def fake_fetch(endpoint, path=None):
+        return responses[endpoint].pop(0)
+
+    poller.fetch = fake_fetch
+    received = []
+    poller.subscribe("activeplayer", interval=0.2, callback=received.append)
+    poller.subscribe("playerlist", interval=0.5)
+
+    asyncio.run(poller.poll_once(now=0.0))
+    assert poller.get("activeplayer") is None
+    assert poller.get("playerlist") == []
+    assert poller._subscriptions["activeplayer"]["backoff"] == 0.2
+
+    asyncio.run(poller.poll_once(now=poller._subscriptions["activeplayer"]["next_due"]))
+    assert received == [{"level": 1}]
+    assert poller._subscriptions["activeplayer"]["backoff"] == 0.0
+
+
+def test_async_poller_stop_survives_a_crashed_task_and_closes_the_session():
+    async def run():
+        poller = AsyncLiveClientPoller()
+        session = poller._get_session()  # e.g. opened by a direct fetch() outside run()
+
+        async def crash(endpoint, path=None):
+            raise RuntimeError("boom")
+
+        poller.fetch = crash
+        poller.subscribe("activeplayer")
+        task = poller.start()
+        await asyncio.sleep(0.05)
+        await poller.stop()
+        return task, session, poller
+
+    task, session, poller = asyncio.run(run())
+    assert task.done() and session.closed
+    assert poller._session is None and poller._task is None
+
+
+def test_threaded_poller_notices_external_stop_event_between_slow_polls():
+    session = SimpleNamespace(get=lambda url, timeout=None: SimpleNamespace(status_code=200, content=b"{}"))
+    poller = LiveClientPoller(session=session)
+    poller.subscribe("allgamedata", 30)
+    stop_event = threading.Event()
+    poller.start(stop_event)
+    stop_event.set()
+    poller._thread.join(0.5)
+    assert not poller._thread.is_alive()
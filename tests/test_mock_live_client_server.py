@@ -0,0 +1,44 @@
+import json
+import ssl
+import urllib.error
+import urllib.request
+
+import pytest
+
+from tests.mock_live_client_server import MockLiveClientServer, StaticGameData
+
+
+def get_json(url):
+    context = ssl._create_unverified_context()
+    with urllib.request.urlopen(url, timeout=2, context=context) as res:
+        return json.loads(res.read())
+
+
+def test_serves_live_client_endpoints_from_docs():
+    source = StaticGameData()
+    riot_id = source.all_game_data["allPlayers"][0]["riotId"]
+    with MockLiveClientServer(source) as server:
+        assert get_json(f"{server.base_url}/activeplayer")["level"] == source.all_game_data["activePlayer"]["level"]
+        assert len(get_json(f"{server.base_url}/playerlist")) == len(source.all_game_data["allPlayers"])
+        assert get_json(f"{server.base_url}/gamestats")["gameMode"] == "CHERRY"
+
+        events = get_json(f"{server.base_url}/eventdata?eventID=1")["Events"]
+        assert all(event["EventID"] >= 1 for event in events)
+        assert get_json(f"{server.base_url}/playeritems?riotId={urllib.request.quote(riot_id)}") is not None
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get_json(f"{server.base_url}/unknown")
+        assert error.value.code == 404
+        assert server.requests["activeplayer"] == 1
+
+
+def test_injects_errors_and_latency():
+    with MockLiveClientServer(https=False, error_rate=1.0) as server:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get_json(f"{server.base_url}/activeplayer")
+        assert error.value.code == 503
+
+        server.error_rate = 0.0
+        server.stall_rate, server.stall_time = 1.0, 0.5
+        with pytest.raises(OSError):
+            urllib.request.urlopen(f"{server.base_url}/activeplayer", timeout=0.1)
@@ -0,0 +1,117 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from utils import ocr_utils
+from utils.ocr_utils import OcrService
+
+FRAME = np.zeros((20, 40, 3), dtype=np.uint8)
+OCR_DATA = {"text": ["SELL"], "left": [4], "top": [2], "width": [20], "height": [8],
+            "block_num": [1], "par_num": [1], "line_num": [1]}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """
+    OcrService on a one-thread pool whose worker waits for release before answering.
+    Returns:
+        tuple: (service, release event, list of worker calls)
+    """
+    release = threading.Event()
+    calls = []
+
+    def fake_worker(img_thresh, target_texts=(), crops=()):
+        calls.append(img_thresh.shape)
+        release.wait(5)
+        return {}, OCR_DATA
+
+    monkeypatch.setattr(ocr_utils, "_ocr_worker", fake_worker)
+    monkeypatch.setattr(ocr_utils, "remember_text_location", lambda text, box: None)
+    monkeypatch.setattr(ocr_utils, "get_cached_text_crop", lambda text, img, origin: None)
+    monkeypatch.setattr(ocr_utils, "ProcessPoolExecutor", ThreadPoolExecutor)
+    service = OcrService(max_workers=1)
+    yield service, release, calls
+    release.set()
+    service.shutdown(wait=True)
+
+
+def test_newer_submit_supersedes_older_future(service):
+    service, release, calls = service
+    older = service.submit("shop", ("SELL",), img=FRAME, origin=(100, 50))
+    newer = service.submit("shop", ("SELL",), img=FRAME, origin=(100, 50))
+    assert older.cancelled()
+    assert service.pending("shop") is newer
+
+    release.set()
+    assert newer.result(timeout=5) == {"SELL": (104, 52, 20, 8)}
+    assert service.pending("shop") is None
+
+
+def test_queries_with_different_keys_do_not_supersede(service):
+    service, release, calls = service
+    seen = []
+    shop = service.submit("shop", ("SELL",), img=FRAME)
+    exit_button = service.submit("exit_button", ("EXIT",), img=FRAME, callback=seen.append)
+    release.set()
+    assert shop.result(timeout=5) == {"SELL": (4, 2, 20, 8)}
+    assert exit_button.result(timeout=5) == {"EXIT": None}
+    assert seen == [{"EXIT": None}]
+    assert len(calls) == 2
+
+
+def test_shutdown_cancels_pending_requests(service):
+    service, release, calls = service
+    running = service.submit("shop", ("SELL",), img=FRAME)
+    queued = service.submit("exit_button", ("EXIT",), img=FRAME)
+    service.shutdown()
+    assert running.cancelled() and queued.cancelled()
+    assert service.pending("shop") is None and service.pending("exit_button") is None
+
+
+def test_warm_up_loads_the_worker_backend(monkeypatch):
+    created = []
+    monkeypatch.setattr(ocr_utils, "_worker_backend", None)
+    monkeypatch.setattr(ocr_utils, "create_ocr_backend", lambda: created.append(1) or object())
+    monkeypatch.setattr(ocr_utils, "ProcessPoolExecutor", ThreadPoolExecutor)
+    service = OcrService(max_workers=2)
+    for future in service.warm_up():
+        future.result(timeout=5)
+    assert created and ocr_utils._worker_backend is not None
+    service.shutdown(wait=True)
+
+
+class ShapeOcrBackend:
+    """
+    Reads SELL at (2, 1) in every image and records the shapes it was given.
+    """
+    def __init__(self):
+        self.shapes = []
+
+    def image_to_data(self, img_thresh):
+        self.shapes.append(img_thresh.shape)
+        return {"text": ["SELL"], "left": [2], "top": [1], "width": [20], "height": [8],
+                "block_num": [1], "par_num": [1], "line_num": [1]}
+
+
+def test_submit_reads_the_cached_crop_before_the_full_region(monkeypatch):
+    backend = ShapeOcrBackend()
+    remembered = []
+    monkeypatch.setattr(ocr_utils, "_worker_backend", backend)
+    monkeypatch.setattr(ocr_utils, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(ocr_utils, "remember_text_location", lambda text, box: remembered.append(text))
+    monkeypatch.setattr(ocr_utils, "get_cached_text_crop", lambda text, img, origin: (
+        (img[5:15, 10:30], (origin[0] + 10, origin[1] + 5)) if text == "SELL" else None
+    ))
+    service = OcrService(max_workers=1)
+
+    shop = service.submit("shop", ("SELL",), img=FRAME, origin=(100, 50))
+    assert shop.result(timeout=5) == {"SELL": (112, 56, 20, 8)}
+    assert backend.shapes == [(10, 20)]  # Crop hit; full region skipped
+
+    both = service.submit("both", ("SELL", "EXIT"), img=FRAME, origin=(100, 50))
+    assert both.result(timeout=5) == {"SELL": (112, 56, 20, 8), "EXIT": None}
+    assert backend.shapes[1:] == [(10, 20), (20, 40)]  # EXIT has no cached crop
+    assert remembered == []
+    service.shutdown(wait=True)
@@ -0,0 +1,66 @@
+import json
+import os
+
+from utils.live_client_utils import SnapshotPublisher, StateChangeBus, EventIngestor, LEVEL_GAINED, GAME_ENDED
+from utils.replay_utils import (
+    SessionRecorder, ReplayReader, ReplayPoller, CODEC_JSON, REPLAY_INDEX_INTERVAL
+)
+
+LIVE_CLIENT_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "live_client_data.json")
+
+
+def write_recording(path, seconds=5.0, step=0.25):
+    with open(LIVE_CLIENT_DATA_PATH, "r", encoding="utf-8") as f:
+        active_player = json.load(f)["activePlayer"]
+    recorder = SessionRecorder(str(path), codec=CODEC_JSON, compress=False)
+    t = 0.0
+    while t <= seconds:
+        active_player = dict(active_player, level=1 + int(t // 2))
+        recorder.record("activeplayer", active_player, t)
+        t += step
+    recorder.record("eventdata", {"Events": [{"EventID": 0, "EventName": "GameEnd", "EventTime": t}]}, t)
+    recorder.close()
+    return recorder.records
+
+
+def test_recording_round_trips_and_seeks(tmp_path):
+    path = tmp_path / "session.lcrec"
+    count = write_recording(path)
+
+    reader = ReplayReader(str(path))
+    records = list(reader.records())
+    assert len(records) == count
+    assert records[0][1] == "activeplayer" and records[-1][1] == "eventdata"
+    assert os.path.getsize(f"{path}.idx") > 0
+
+    tail = list(reader.records(start=3.0))
+    assert tail[0][0] == 3.0
+    assert len(tail) == len([r for r in records if r[0] >= 3.0])
+    assert list(reader.records(start=1.0, end=1.5))[-1][0] == 1.5
+    assert reader.duration() >= 5.0 - REPLAY_INDEX_INTERVAL
+    reader.close()
+
+
+def test_replay_poller_drives_snapshot_pipeline(tmp_path):
+    path = tmp_path / "session.lcrec"
+    write_recording(path)
+
+    poller = ReplayPoller(str(path), speed=0)
+    bus = StateChangeBus()
+    changes = bus.subscribe_queue((LEVEL_GAINED, GAME_ENDED))
+    SnapshotPublisher(poller, callback=bus.process)
+
+    def on_new_events(events):
+        if any(event.name == "GameEnd" for event in events):
+            bus.end_game("GameEnd event")
+
+    EventIngestor(poller, callback=on_new_events)
+    poller.run()
+
+    received = []
+    while not changes.empty():
+        received.append(changes.get())
+    assert sum(change.value for change in received if change.kind == LEVEL_GAINED) == 3
+    assert received[-1].kind == GAME_ENDED
+    assert poller.finished.is_set()
+    poller.close()
@@ -0,0 +1,120 @@
+import cv2
+import numpy as np
+import pytest
+
+from utils import template_utils
+from utils.template_utils import find_label_location, find_label_locations, save_label_template
+
+WINDOW_HEIGHT = 240
+
+
+def make_frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 60, size=(WINDOW_HEIGHT, 320, 3), dtype=np.uint8)
+
+
+def draw_label(img, text, x, y):
+    """
+    Draws text with its top-left corner at (x, y).
+    Returns:
+        tuple: (x, y, w, h) of the text.
+    """
+    (w, h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)
+    cv2.putText(img, text, (x, y + h), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (230, 230, 230), 2)
+    return x, y, w, h + baseline
+
+
+@pytest.fixture
+def screen(tmp_path, monkeypatch):
+    """
+    Serves a mutable frame as the captured region at screen origin (1000, 500).
+    Returns:
+        tuple: (frame holder dict, list of OCR fallback calls)
+    """
+    holder = {"img": make_frame(), "ocr_boxes": {}}
+    ocr_calls = []
+
+    def fake_find_text_locations(target_texts, img=None, origin=(0, 0)):
+        ocr_calls.append(list(target_texts))
+        return {text: holder["ocr_boxes"].get(text) for text in target_texts}
+
+    monkeypatch.setattr(template_utils, "TEMPLATES_DIR", str(tmp_path))
+    monkeypatch.setattr(template_utils, "_templates", {})
+    monkeypatch.setattr(template_utils, "_scaled_templates", {})
+    monkeypatch.setattr(template_utils, "capture_region", lambda region=None: (holder["img"], (1000, 500)))
+    monkeypatch.setattr(template_utils, "get_window_rect", lambda title=None: (0, 0, 320, WINDOW_HEIGHT))
+    monkeypatch.setattr(template_utils, "find_text_locations", fake_find_text_locations)
+    return holder, ocr_calls
+
+
+def test_saved_template_matches_label_elsewhere_without_ocr(screen, tmp_path):
+    holder, ocr_calls = screen
+    img = make_frame(seed=1)
+    x, y, w, h = draw_label(img, "SELL", 40, 30)
+    path = save_label_template("SELL", img, (x + 1000, y + 500, w, h), origin=(1000, 500))
+    assert path == str(tmp_path / f"SELL_{WINDOW_HEIGHT}.png")
+
+    holder["img"] = make_frame(seed=2)
+    draw_label(holder["img"], "SELL", 180, 150)
+    mx, my, mw, mh = find_label_location("SELL")
+    # The template keeps 2px of padding around the box
+    assert (mx, my) == (1000 + 180 - 2, 500 + 150 - 2)
+    assert (mw, mh) == (w + 4, h + 4)
+    assert ocr_calls == []
+
+
+def test_ocr_fallback_only_for_unmatched_labels(screen):
+    holder, ocr_calls = screen
+    x, y, w, h = draw_label(holder["img"], "SELL", 40, 30)
+    save_label_template("SELL", holder["img"], (x, y, w, h))
+
+    matches = find_label_locations(("SELL", "EXIT"))
+    assert matches["SELL"] is not None
+    assert matches["EXIT"] is None
+    assert ocr_calls == [["EXIT"]]
+
+    matches = find_label_locations(("SELL", "EXIT"), fallback_ocr=False)
+    assert matches["SELL"] is not None and matches["EXIT"] is None
+    assert ocr_calls == [["EXIT"]]
+
+
+def test_label_absent_from_frame_is_not_matched(screen):
+    holder, ocr_calls = screen
+    x, y, w, h = draw_label(holder["img"], "SELL", 40, 30)
+    save_label_template("SELL", holder["img"], (x, y, w, h))
+
+    holder["img"] = make_frame(seed=3)
+    assert find_label_location("SELL", fallback_ocr=False) is None
+    assert ocr_calls == []
+
+
+def test_first_ocr_hit_bootstraps_a_template(screen, tmp_path):
+    holder, ocr_calls = screen
+    x, y, w, h = draw_label(holder["img"], "EXIT", 60, 90)
+    holder["ocr_boxes"]["EXIT"] = (x + 1000, y + 500, w, h)
+
+    assert find_label_location("EXIT") == (x + 1000, y + 500, w, h)
+    assert (tmp_path / f"EXIT_{WINDOW_HEIGHT}.png").exists()
+
+    holder["img"] = make_frame(seed=4)
+    draw_label(holder["img"], "EXIT", 200, 20)
+    mx, my, _, _ = find_label_location("EXIT")
+    assert (mx, my) == (1000 + 200 - 2, 500 + 20 - 2)
+    assert ocr_calls == [["EXIT"]]  # Served by the saved template
+
+
+def test_async_label_ocr_saves_templates_from_its_own_frame(screen, monkeypatch, tmp_path):
+    holder, _ = screen
+    x, y, w, h = draw_label(holder["img"], "SELL", 40, 30)
+    submitted = []
+
+    class FakeOcrService:
+        def submit(self, query_key, labels, img=None, origin=(0, 0), callback=None):
+            submitted.append(img)
+            callback({"SELL": (x + origin[0], y + origin[1], w, h)})
+
+    monkeypatch.setattr(template_utils, "get_ocr_service", FakeOcrService)
+    template_utils.submit_label_ocr("shop", ("SELL",), region="shop")
+    assert submitted[0] is not holder["img"]  # Copied off the pooled capture buffer
+    assert (tmp_path / f"SELL_{WINDOW_HEIGHT}.png").exists()
+    assert find_label_location("SELL", fallback_ocr=False) is not None
@@ -0,0 +1,198 @@
+import threading
+import time
+import logging
+from collections import deque
+import mss
+import numpy as np
+import cv2
+
+
+# ===========================
+# Screen Capture Engine
+# ===========================
+
+class ScreenCapture:
+    """
+    Long-lived screen capture object.
+    Keeps one mss handle per thread (mss handles must not cross threads) and a
+    pool of preallocated BGR buffers per frame shape, so a capture costs one
+    grab plus one BGRA -> BGR conversion straight into a reused, contiguous buffer.
+
+    Frames returned by grab() are views into the pool and are overwritten after
+    pool_size further grabs of the same shape; pass copy=True to keep one longer.
+    The background ring draws from its own pool, so grabs never overwrite it.
+    """
+
+    def __init__(self, monitor_index=1, pool_size=4, ring_size=3):
+        """
+        Args:
+            monitor_index (int): mss monitor to capture; 1 is the primary monitor, 0 all monitors.
+            pool_size (int): Number of reusable buffers per frame shape for synchronous grabs.
+            ring_size (int): Number of frames kept by the background capture thread.
+        """
+        self.monitor_index = monitor_index
+        self.pool_size = pool_size
+        self.ring_size = ring_size
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+        self._pools = {}
+
+        self._frames = deque(maxlen=ring_size)
+        self._frame_seq = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    # ----- handles and buffers -----
+
+    def _sct(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._lock:
+                self._handles.append(sct)
+        return sct
+
+    def _next_buffer(self, pool_name, shape, pool_size):
+        with self._lock:
+            pool = self._pools.get((pool_name, shape))
+            if pool is None:
+                pool = {"buffers": [np.empty(shape, dtype=np.uint8) for _ in range(pool_size)], "index": 0}
+                self._pools[(pool_name, shape)] = pool
+            buffer = pool["buffers"][pool["index"]]
+            pool["index"] = (pool["index"] + 1) % pool_size
+            return buffer
+
+    @property
+    def monitor(self):
+        """
+        Returns:
+            dict: The mss monitor rectangle captured by default.
+        """
+        return self._sct().monitors[self.monitor_index]
+
+    def grab(self, monitor=None, copy=False, _pool="grab"):
+        """
+        Captures a frame into a pooled buffer.
+        Args:
+            monitor (dict, optional): mss rectangle {'left', 'top', 'width', 'height'}. Defaults to the full monitor.
+            copy (bool): Return a private copy instead of a pooled buffer.
+        Returns:
+            np.ndarray: Contiguous BGR frame.
+        """
+        sct = self._sct()
+        if monitor is None:
+            monitor = sct.monitors[self.monitor_index]
+        shot = sct.grab(monitor)
+        height, width = shot.height, shot.width
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(height, width, 4)
+        if _pool == "ring":
+            frame = self._next_buffer(_pool, (height, width, 3), self.ring_size + 1)
+        else:
+            frame = self._next_buffer(_pool, (height, width, 3), self.pool_size)
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=frame)
+        return frame.copy() if copy else frame
+
+    # ----- background capture -----
+
+    def start(self, interval=0.0):
+        """
+        Starts a background thread that keeps the latest frames in a ring buffer.
+        Args:
+            interval (float): Minimum seconds between captures; 0 captures as fast as possible.
+        """
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._capture_loop, args=(interval,), daemon=True)
+        self._thread.start()
+        logging.info("Background screen capture started.")
+
+    def stop(self, timeout=1.0):
+        """
+        Stops the background capture thread.
+        Args:
+            timeout (float): Seconds to wait for the thread to exit.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _capture_loop(self, interval):
+        # The ring pool holds one more buffer than the ring publishes so the
+        # slot being written is never the one a reader just received.
+        while not self._stop_event.is_set():
+            start = time.perf_counter()
+            try:
+                frame = self.grab(_pool="ring")
+            except Exception as e:
+                logging.error(f"Background screen capture failed: {e}")
+                self._stop_event.wait(0.5)
+                continue
+            self._frame_seq += 1
+            self._frames.append((self._frame_seq, time.time(), frame))
+            remaining = interval - (time.perf_counter() - start)
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+
+    def latest(self, max_age=None, copy=False):
+        """
+        Returns the freshest frame from the background ring buffer.
+        Falls back to a synchronous grab if the thread is not running or the
+        newest frame is older than max_age.
+        Args:
+            max_age (float, optional): Max acceptable frame age in seconds.
+            copy (bool): Return a private copy instead of a ring buffer slot.
+        Returns:
+            tuple: (frame, timestamp, seq); seq is None for synchronous grabs.
+        """
+        if self._frames:
+            seq, timestamp, frame = self._frames[-1]
+            if max_age is None or time.time() - timestamp <= max_age:
+                return (frame.copy() if copy else frame), timestamp, seq
+        return self.grab(copy=copy), time.time(), None
+
+    def recent_frames(self):
+        """
+        Returns:
+            list: Snapshot of the ring buffer as [(seq, timestamp, frame), ...], oldest first.
+        """
+        return list(self._frames)
+
+    def close(self):
+        """
+        Stops background capture and releases every mss handle.
+        """
+        self.stop()
+        with self._lock:
+            handles, self._handles = self._handles, []
+            self._pools.clear()
+        for sct in handles:
+            try:
+                sct.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+_screen_capture = None
+_screen_capture_lock = threading.Lock()
+
+
+def get_screen_capture():
+    """
+    Returns the process-wide ScreenCapture instance, creating it on first use.
+    Returns:
+        ScreenCapture: Shared capture engine.
+    """
+    global _screen_capture
+    if _screen_capture is None:
+        with _screen_capture_lock:
+            if _screen_capture is None:
+                _screen_capture = ScreenCapture()
+    return _screen_capture
@@ -0,0 +1,166 @@
+import asyncio
+import random
+import logging
+from collections import namedtuple
+from core.constants import CHAMP_SELECT_SUBPHASES, BRAVERY_CHAMPION_ID
+from utils.config_utils import get_config
+from utils.general_utils import get_champions_map
+
+# pick_ids: preferred champion (if set), Bravery, then a shuffled fallback list
+ChampSelectPlan = namedtuple("ChampSelectPlan", ["preferred_champ_id", "pick_ids", "ban_ids"])
+
+
+# ===========================
+# Pick/Ban Plan
+# ===========================
+
+def build_champ_select_plan(preferred_champion=None, champions_map=None):
+    """
+    Builds the pick/ban order once per champ select.
+    Args:
+        preferred_champion (str, optional): Champion name; read from config.json if None.
+        champions_map (dict, optional): {champion_name: champion_id}; from the Data Dragon cache if None.
+    Returns:
+        ChampSelectPlan: Preferred champion ID (or None), pick order and ban order.
+    """
+    if preferred_champion is None:
+        preferred_champion = get_config().get("General", {}).get("preferred_champion", "").strip()
+    if champions_map is None:
+        champions_map = get_champions_map()
+
+    preferred_champ_id = champions_map.get(preferred_champion) if preferred_champion else None
+    valid_champ_ids = [cid for cid in champions_map.values() if cid not in (-1, preferred_champ_id)]
+    fallback_ids = random.sample(valid_champ_ids, len(valid_champ_ids))
+
+    pick_ids = ([preferred_champ_id] if preferred_champ_id else []) + [BRAVERY_CHAMPION_ID] + fallback_ids
+    ban_ids = random.sample(valid_champ_ids, len(valid_champ_ids))
+    return ChampSelectPlan(preferred_champ_id, pick_ids, ban_ids)
+
+
+def get_unavailable_champion_ids(session_data):
+    """
+    Returns:
+        set: Champion IDs already banned or picked by anyone in the session.
+    """
+    unavailable = set()
+    for action_group in session_data.get("actions", []):
+        for action in action_group:
+            if action.get("completed") and action.get("championId"):
+                unavailable.add(action["championId"])
+    for ban_list in session_data.get("bans", {}).values():
+        if isinstance(ban_list, list):
+            unavailable.update(ban_list)
+    return unavailable
+
+
+# ===========================
+# Champ Select Engine
+# ===========================
+
+class ChampSelectEngine:
+    """
+    Handles champ select session updates for the local player.
+    Session events arrive many times per second. Only the newest session is
+    kept, and one worker task processes it, so a burst of updates costs at most
+    one pass. An action ID is recorded once a PATCH for it succeeds, so stale
+    sessions queued meanwhile do not repeat it; if every candidate is rejected,
+    the next update retries it. Sessions that arrive between reset() and start()
+    wait for the plan.
+    """
+
+    def __init__(self, max_attempts=5):
+        """
+        Args:
+            max_attempts (int): Candidates tried per action before giving up.
+        """
+        self.max_attempts = max_attempts
+        self._connection = None
+        self._worker = None
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets the previous champ select. Updates are held until start() sets a plan.
+        """
+        self.plan = None
+        self._handled_actions = set()
+        self._latest_session = None
+        self.stats = {"updates": 0, "passes": 0, "requests": 0}
+
+    def start(self, plan=None):
+        """
+        Sets the plan for the current champ select and processes any session
+        that arrived while it was being built. Call reset() first when the plan
+        is built elsewhere, e.g. in an executor.
+        Args:
+            plan (ChampSelectPlan, optional): Precomputed plan; built from config if None.
+        """
+        if self.plan is not None:
+            self.reset()
+        self.plan = plan or build_champ_select_plan()
+        logging.info(f"Champ select plan: preferred champion ID {self.plan.preferred_champ_id}.")
+        if self._latest_session is not None and (self._worker is None or self._worker.done()):
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    def update(self, connection, session_data):
+        """
+        Records the newest session and makes sure the worker will process it.
+        Must be called from the event loop.
+        Args:
+            connection: lcu_driver connection used for the PATCH requests.
+            session_data (dict): /lol-champ-select/v1/session payload.
+        Returns:
+            asyncio.Task: The worker task handling the session.
+        """
+        self.stats["updates"] += 1
+        self._connection = connection
+        self._latest_session = session_data
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self._worker
+
+    async def _run(self):
+        while self._latest_session is not None and self.plan is not None:
+            session_data, self._latest_session = self._latest_session, None
+            self.stats["passes"] += 1
+            try:
+                await self._handle_session(self._connection, session_data)
+            except Exception as e:
+                logging.error(f"Champ select update failed: {e}")
+
+    async def _handle_session(self, connection, session_data):
+        if session_data.get("timer", {}).get("phase") != CHAMP_SELECT_SUBPHASES["BAN_PICK"]:
+            return
+        local_cell_id = session_data.get("localPlayerCellId")
+
+        for action_group in session_data.get("actions", []):
+            for action in action_group:
+                action_id = action.get("id")
+                if (action.get("actorCellId") != local_cell_id or not action.get("isInProgress")
+                        or action_id in self._handled_actions):
+                    continue
+                if action.get("type") not in ("ban", "pick"):
+                    continue
+                unavailable = get_unavailable_champion_ids(session_data)
+                candidates = self.plan.ban_ids if action["type"] == "ban" else self.plan.pick_ids
+                champ_id = await self._complete_action(connection, action_id, action["type"], candidates, unavailable)
+                if champ_id is not None:
+                    self._handled_actions.add(action_id)
+
+    async def _complete_action(self, connection, action_id, action_type, candidates, unavailable):
+        """
+        Tries available candidates in plan order until the client accepts one.
+        """
+        available = [champ_id for champ_id in candidates if champ_id not in unavailable]
+        for champ_id in available[:self.max_attempts]:
+            self.stats["requests"] += 1
+            res = await connection.request(
+                'patch',
+                f'/lol-champ-select/v1/session/actions/{action_id}',
+                data={"championId": champ_id, "completed": True}
+            )
+            if res is not None and 200 <= res.status < 300:
+                logging.info(f"Champ select: {action_type} {champ_id} (action {action_id}).")
+                return champ_id
+        logging.error(f"Champ select: no candidate accepted for {action_type} action {action_id}.")
+        return None
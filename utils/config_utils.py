@@ -1,24 +1,142 @@
+import copy
 import json
+import logging
 import os
+import threading
+import time
 import urllib3
 
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "config")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
 DEFAULT_CONFIG_PATH = os.path.join(CONFIG_DIR, "config_default.json")
+OCR_LAYOUT_CACHE_PATH = os.path.join(CONFIG_DIR, "ocr_layout_cache.json")
+DATA_DRAGON_CACHE_DIR = os.path.join(CONFIG_DIR, "data_dragon_cache")
+
+CONFIG_CHECK_INTERVAL = 0.5  # seconds between mtime checks of a cached config file
+
+
+class ConfigStore:
+    """
+    Parsed config file cached in memory. Reads revalidate with os.stat at most
+    every check_interval seconds and re-parse only when the file's mtime or size
+    changed; listeners are notified on every change. Saves are atomic
+    (temp file + os.replace), so readers never see a half-written file.
+    """
+
+    def __init__(self, path, check_interval=CONFIG_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self._config = None
+        self._stat_key = None
+        self._checked_at = 0.0
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    def _read_stat_key(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, force=False):
+        """
+        Returns the cached config, re-parsing it if the file changed on disk.
+        The dict is shared; copy it before modifying (see load_config).
+        Args:
+            force (bool): Check the file now instead of waiting for check_interval.
+        Returns:
+            dict: Parsed config.
+        """
+        now = time.monotonic()
+        if self._config is not None and not force and now - self._checked_at < self.check_interval:
+            return self._config
+        with self._lock:
+            self._checked_at = now
+            try:
+                stat_key = self._read_stat_key()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Missing config at {self.path}")
+            if stat_key == self._stat_key and self._config is not None:
+                return self._config
+            try:
+                with open(self.path, "r") as f:
+                    config = json.load(f)
+            except ValueError as e:
+                if self._config is None:
+                    raise
+                logging.warning(f"Ignoring invalid config at {self.path}: {e}")
+                return self._config
+            self._stat_key = stat_key
+            changed = self._config is not None
+            self._config = config
+        if changed:
+            self._notify(config)
+        return config
+
+    def save(self, config):
+        """
+        Writes the config atomically and updates the cache.
+        Args:
+            config (dict): Config to save.
+        """
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(config, f, indent=4)
+            os.replace(tmp_path, self.path)
+            self._config = copy.deepcopy(config)
+            self._stat_key = self._read_stat_key()
+            self._checked_at = time.monotonic()
+            config = self._config
+        self._notify(config)
+
+    def subscribe(self, callback):
+        """
+        Registers a listener for config changes.
+        Args:
+            callback (callable): Called with the new config dict after each change.
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, config):
+        for callback in list(self._listeners):
+            try:
+                callback(config)
+            except Exception as e:
+                logging.error(f"Config listener failed: {e}")
+
+
+_config_stores = {}
+_config_stores_lock = threading.Lock()
+
+
+def get_config_store(path=CONFIG_PATH):
+    """
+    Returns:
+        ConfigStore: The shared store for a config file.
+    """
+    path = os.path.abspath(path)
+    with _config_stores_lock:
+        if path not in _config_stores:
+            _config_stores[path] = ConfigStore(path)
+        return _config_stores[path]
+
+def get_config(path=CONFIG_PATH):
+    """Returns the cached config; treat it as read-only."""
+    return get_config_store(path).get()
 
 def load_config(path=CONFIG_PATH):
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Missing config at {path}")
-    with open(path, "r") as f:
-        return json.load(f)
+    """Returns a private copy of the config that may be modified and saved."""
+    return copy.deepcopy(get_config_store(path).get())
 
 def load_default_config():
     return load_config(DEFAULT_CONFIG_PATH)
 
 def save_config(config, path=CONFIG_PATH):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(config, f, indent=4)
+    get_config_store(path).save(config)
 
 def get_config_paths():
     return CONFIG_PATH, DEFAULT_CONFIG_PATH
@@ -28,11 +146,18 @@ def disable_insecure_request_warning():
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def load_settings():
-    config = load_config()
+    config = get_config()
     return config.get("Keybinds", {}), config.get("General", {})
 
+def watch_settings(callback):
+    """
+    Calls callback(keybinds, general) now and again whenever config.json changes.
+    """
+    callback(*load_settings())
+    get_config_store().subscribe(lambda config: callback(config.get("Keybinds", {}), config.get("General", {})))
+
 def get_selected_game_mode():
-    config = load_config()
+    config = get_config()
     return config.get("General", {}).get("selected_game_mode").lower()
 
 def set_selected_game_mode(mode):
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+import time
+import logging
+from core.constants import GAME_LOOP_STOP_TIMEOUT, GAME_LOOP_MAX_RESTARTS, GAME_LOOP_RESTART_BACKOFF
+
+
+# ===========================
+# Game Loop Thread Lifecycle
+# ===========================
+
+class GameLoopRunner:
+    """
+    Owns the game loop thread for the asyncio gameflow handlers.
+    The bot loop blocks (input, screen capture, OCR), so it runs on its own
+    thread. stop() signals it through stop_event and waits for it in an
+    executor with a timeout, so the event loop keeps answering ready checks
+    and websocket events while a game shuts down. finished tells a loop that
+    returned on its own (e.g. on GameEnd) apart from one that crashed, and
+    crashes in a row are counted so restarts can back off.
+    """
+
+    def __init__(self, stop_event=None, max_restarts=GAME_LOOP_MAX_RESTARTS,
+                 restart_backoff=GAME_LOOP_RESTART_BACKOFF):
+        """
+        Args:
+            stop_event (threading.Event, optional): Event the loop watches; created if None.
+            max_restarts (int): Crashes in a row after which restart_allowed() stays False.
+            restart_backoff (float): Seconds after the first crash before a restart; doubles per crash.
+        """
+        self.stop_event = stop_event or threading.Event()
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self.finished = False  # The last loop returned instead of raising
+        self.crashes = 0  # Crashes in a row since the last reset_crashes() or finished loop
+        self._last_crash = None
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, target, *args):
+        """
+        Starts target(stop_event, *args) on a daemon thread unless a loop is already running.
+        Args:
+            target (callable): Game loop entry point.
+        Returns:
+            bool: True if a new thread was started.
+        """
+        if self.is_running():
+            logging.warning("Game loop is already running.")
+            return False
+        self.stop_event.clear()
+        self.finished = False
+        self._thread = threading.Thread(target=self._run, args=(target, self.stop_event, args), daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self, target, stop_event, args):
+        try:
+            target(stop_event, *args)
+        except Exception:
+            logging.exception("Game loop crashed.")
+            self.crashes += 1
+            self._last_crash = time.monotonic()
+            if self.crashes > self.max_restarts:
+                logging.error(f"Game loop crashed {self.crashes} times in a row; not restarting it this game.")
+            return
+        if threading.current_thread() is self._thread:  # Not a loop abandoned by stop()
+            self.finished = True
+            self.crashes = 0
+
+    def restart_allowed(self, now=None):
+        """
+        Caps and backs off restarts of a loop that keeps crashing: after the n-th
+        crash in a row a restart waits restart_backoff * 2 ** (n - 1) seconds, and
+        after max_restarts crashes the loop stays down until reset_crashes().
+        Args:
+            now (float, optional): time.monotonic() timestamp.
+        Returns:
+            bool: True if the loop may be (re)started now.
+        """
+        if self.crashes == 0:
+            return True
+        if self.crashes > self.max_restarts:
+            return False
+        now = now if now is not None else time.monotonic()
+        return now - self._last_crash >= self.restart_backoff * 2 ** (self.crashes - 1)
+
+    def reset_crashes(self):
+        """
+        Forgets earlier crashes, e.g. when a game ends.
+        """
+        self.crashes = 0
+        self._last_crash = None
+
+    async def stop(self, timeout=GAME_LOOP_STOP_TIMEOUT):
+        """
+        Signals the game loop to stop and waits for it without blocking the event loop.
+        Args:
+            timeout (float): Seconds to wait for the thread to exit.
+        Returns:
+            bool: True if the thread exited (or none was running).
+        """
+        self.stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+        await asyncio.get_running_loop().run_in_executor(None, thread.join, timeout)
+        if thread.is_alive():
+            # Daemon thread: it exits with the process if it never notices stop_event.
+            # Its event stays set; the next game gets a fresh one.
+            logging.warning(f"Game loop did not stop within {timeout} s; leaving it to finish in the background.")
+            self.stop_event = threading.Event()
+            return False
+        return True
+
+
+# ===========================
+# Gameflow Watchdog
+# ===========================
+
+class GameflowWatchdog:
+    """
+    Tracks time spent in each gameflow phase against a budget and reports
+    escalating recovery levels for phases that overrun it. Level n is reported
+    once the phase has run n budgets long; the caller decides what each level
+    does. Also keeps per-session throughput stats.
+    """
+
+    def __init__(self, budgets, max_level=3, completed_phase="EndOfGame"):
+        """
+        Args:
+            budgets (dict): phase -> expected seconds in that phase; phases without one are not watched.
+            max_level (int): Highest recovery level before escalation starts over.
+            completed_phase (str): Entering this phase counts as a completed game.
+        """
+        self.budgets = budgets
+        self.max_level = max_level
+        self.completed_phase = completed_phase
+        self.phase = None
+        self.level = 0
+        self._entered = None
+        self._escalation_start = None
+        self._started = time.monotonic()
+        self.games_completed = 0
+        self.phase_time = {}  # phase -> total seconds
+        self.phase_visits = {}  # phase -> times entered
+        self.recoveries = {}  # (phase, level) -> count
+        self.stalls = 0
+
+    def enter(self, phase, now=None):
+        """
+        Records a phase change. Re-entering the current phase is ignored.
+        Args:
+            phase (str): Gameflow phase.
+            now (float, optional): time.monotonic() timestamp.
+        """
+        if phase == self.phase:
+            return
+        now = now if now is not None else time.monotonic()
+        self._close_phase(now)
+        self.phase = phase
+        self.level = 0
+        self._entered = self._escalation_start = now
+        self.phase_visits[phase] = self.phase_visits.get(phase, 0) + 1
+        if phase == self.completed_phase:
+            self.games_completed += 1
+            logging.info(f"Game {self.games_completed} completed ({self.games_per_hour(now):.1f} games/hour).")
+
+    def _close_phase(self, now):
+        if self.phase is not None:
+            self.phase_time[self.phase] = self.phase_time.get(self.phase, 0.0) + now - self._entered
+
+    def time_in_phase(self, now=None):
+        if self._entered is None:
+            return 0.0
+        return (now if now is not None else time.monotonic()) - self._entered
+
+    def check(self, now=None):
+        """
+        Returns:
+            int: Recovery level due now for the current phase, or 0 if it is within budget
+                or this level was already reported.
+        """
+        budget = self.budgets.get(self.phase)
+        if budget is None:
+            return 0
+        now = now if now is not None else time.monotonic()
+        due = int((now - self._escalation_start) // budget)
+        if due <= self.level:
+            return 0
+        if due > self.max_level:
+            # Out of recovery actions: count a stall and start the escalation over
+            self.stalls += 1
+            self._escalation_start = now - budget
+            due = 1
+        self.level = due
+        self.recoveries[(self.phase, due)] = self.recoveries.get((self.phase, due), 0) + 1
+        return due
+
+    def games_per_hour(self, now=None):
+        hours = ((now if now is not None else time.monotonic()) - self._started) / 3600
+        return self.games_completed / hours if hours > 0 else 0.0
+
+    def stats(self, now=None):
+        """
+        Returns:
+            dict: Session throughput, time and visits per phase, recoveries and stalls.
+        """
+        now = now if now is not None else time.monotonic()
+        phase_time = dict(self.phase_time)
+        if self.phase is not None:
+            phase_time[self.phase] = phase_time.get(self.phase, 0.0) + now - self._entered
+        return {
+            "session_minutes": round((now - self._started) / 60, 1),
+            "games_completed": self.games_completed,
+            "games_per_hour": round(self.games_per_hour(now), 2),
+            "phase_seconds": {phase: round(t, 1) for phase, t in phase_time.items()},
+            "phase_visits": dict(self.phase_visits),
+            "recoveries": {f"{phase}:{level}": n for (phase, level), n in self.recoveries.items()},
+            "stalls": self.stalls,
+        }
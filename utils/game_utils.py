@@ -1,60 +1,501 @@
 import keyboard
 import time
+import functools
+from collections import namedtuple
 import numpy as np
 import cv2
 import logging
-from core.constants import SCREEN_CENTER
+from core.constants import (
+    HEALTH_TICK_COLOR, HEALTH_BAR_CLASSES,
+    HEALTH_TICK_SEARCH_WIDTH, HEALTH_BAR_CHAMPION_OFFSET_Y,
+    HEALTH_BAR_FULL_WIDTH, HEALTH_BAR_REFERENCE_HEIGHT, HEALTH_TICK_MAX_WIDTH, SHOP_OCR_TIMEOUT
+)
 import random
-from utils.config_utils import load_settings
-from utils.general_utils import click_percent, find_text_location, get_screenshot
+from utils.config_utils import watch_settings
+from utils.template_utils import find_label_location, submit_label_ocr
+from utils.general_utils import (
+    click_percent, capture_region, resolve_region, get_window_center, get_window_rect
+)
 
 
 # ===========================
 # Game Data Retrieval
 # ===========================
 
-# Find the location of a champion by searching for health bar and tick colors
-def find_champion_location(health_bar_bgr, health_tick_bgr, tolerance=2):
+def _color_bounds(bgr, tolerance):
     """
-    Finds the champion location by searching for health bar and tick colors in the screenshot.
+    Builds the inclusive lower/upper BGR bounds used by cv2.inRange.
+    Args:
+        bgr (tuple): BGR color.
+        tolerance (int): Color tolerance.
+    Returns:
+        tuple: (lower, upper) uint8 arrays.
+    """
+    lower = np.array([max(c - tolerance, 0) for c in bgr], dtype=np.uint8)
+    upper = np.array([min(c + tolerance, 255) for c in bgr], dtype=np.uint8)
+    return lower, upper
+
+
+def locate_health_bar(img, health_bar_bgr, health_tick_bgr, tolerance=2, search_size_x=HEALTH_TICK_SEARCH_WIDTH):
+    """
+    Finds the first health bar pixel (row-major order) that has a health tick
+    pixel on the same row within search_size_x pixels to its right.
+    The tick mask is dilated to the left with a 1 x (search_size_x + 1) kernel,
+    so the whole search is a handful of vectorized OpenCV passes.
     Args:
+        img (np.ndarray): BGR image.
         health_bar_bgr (tuple): BGR color of health bar.
         health_tick_bgr (tuple): BGR color of health tick.
         tolerance (int): Color tolerance.
+        search_size_x (int): Max horizontal distance from bar pixel to tick pixel.
     Returns:
-        tuple or None: (x, y) location if found, else None.
+        tuple or None: (x, y) of the health bar pixel if found, else None.
+    """
+    mask_health_bar = cv2.inRange(img, *_color_bounds(health_bar_bgr, tolerance))
+    if not cv2.countNonZero(mask_health_bar):
+        return None
+    mask_health_tick = cv2.inRange(img, *_color_bounds(health_tick_bgr, tolerance))
+
+    # dst(x) = max(src[x .. x + search_size_x]) with the anchor at the kernel's left edge
+    kernel = np.ones((1, search_size_x + 1), dtype=np.uint8)
+    tick_ahead = cv2.dilate(mask_health_tick, kernel, anchor=(0, 0))
+    hits = cv2.bitwise_and(mask_health_bar, tick_ahead)
+
+    index = int(np.argmax(hits))
+    if not hits.flat[index]:
+        return None
+    y, x = divmod(index, hits.shape[1])
+    return x, y
+
+
+def locate_health_bar_pyramid(img, health_bar_bgr, health_tick_bgr, tolerance=2,
+                              search_size_x=HEALTH_TICK_SEARCH_WIDTH, scale=2):
     """
-    img = get_screenshot()
+    Coarse-to-fine version of locate_health_bar.
+    Finds candidate bar rows and columns on a 1/scale nearest-neighbour
+    subsample of the frame, then runs the full-resolution search only on those
+    bands to recover pixel-exact coordinates. Bars thinner than scale pixels
+    can be missed; thicker ones give the same result as the full search.
+    Args:
+        img (np.ndarray): BGR image.
+        health_bar_bgr (tuple): BGR color of health bar.
+        health_tick_bgr (tuple): BGR color of health tick.
+        tolerance (int): Color tolerance.
+        search_size_x (int): Max horizontal distance from bar pixel to tick pixel.
+        scale (int): Downscale factor of the coarse pass, e.g. 2 or 4.
+    Returns:
+        tuple or None: (x, y) of the health bar pixel if found, else None.
+    """
+    if scale <= 1:
+        return locate_health_bar(img, health_bar_bgr, health_tick_bgr, tolerance, search_size_x)
+    height, width = img.shape[:2]
+    coarse = cv2.inRange(img[::scale, ::scale], *_color_bounds(health_bar_bgr, tolerance))
+    coarse_rows = np.flatnonzero(coarse.any(axis=1))
+    if coarse_rows.size == 0:
+        return None
+
+    # Merge the full-resolution rows around each coarse hit into disjoint bands
+    bands = []
+    for row in coarse_rows:
+        y0, y1 = max(row * scale - (scale - 1), 0), min(row * scale + scale, height)
+        if bands and y0 <= bands[-1][1]:
+            bands[-1][1] = y1
+            bands[-1][2].append(row)
+        else:
+            bands.append([y0, y1, [row]])
+
+    for y0, y1, rows in bands:
+        coarse_cols = np.flatnonzero(coarse[rows].any(axis=0))
+        x0 = max(coarse_cols[0] * scale - (scale - 1), 0)
+        x1 = min(coarse_cols[-1] * scale + scale + search_size_x, width)
+        hit = locate_health_bar(img[y0:y1, x0:x1], health_bar_bgr, health_tick_bgr, tolerance, search_size_x)
+        if hit:
+            return hit[0] + x0, hit[1] + y0
+    return None
+
+
+# A detected health bar: class name, champion (x, y), bar box (x, y, w, h) and estimated HP fraction
+HealthBar = namedtuple("HealthBar", ["champion_class", "location", "box", "fill_ratio"], defaults=(None,))
+
+_TICK_BIT = 1
+
+
+@functools.lru_cache(maxsize=8)
+def _build_color_lut(class_colors, tick_bgr, tolerance):
+    """
+    Builds a per-channel lookup table that classifies every pixel value at once.
+    Bit 0 marks the health tick color, bit i + 1 marks class_colors[i].
+    A pixel belongs to a class when the bit is set in all three channels.
+    Args:
+        class_colors (tuple): ((name, bgr), ...) pairs.
+        tick_bgr (tuple): BGR color of health tick.
+        tolerance (int): Color tolerance.
+    Returns:
+        np.ndarray: (1, 256, 3) uint8 table for cv2.LUT.
+    """
+    if len(class_colors) > 7:
+        raise ValueError("At most 7 health bar classes fit in an 8-bit lookup table.")
+    lut = np.zeros((1, 256, 3), dtype=np.uint8)
+    values = np.arange(256)
+    colors = [tick_bgr] + [bgr for _, bgr in class_colors]
+    for bit, bgr in enumerate(colors):
+        lower, upper = _color_bounds(bgr, tolerance)
+        for channel in range(3):
+            in_range = (values >= lower[channel]) & (values <= upper[channel])
+            lut[0, in_range, channel] |= 1 << bit
+    return lut
+
+
+def classify_pixels(img, class_colors, tick_bgr=HEALTH_TICK_COLOR, tolerance=2):
+    """
+    Labels every pixel of the frame with a class bitmask in one LUT pass.
+    Args:
+        img (np.ndarray): BGR image.
+        class_colors (tuple): ((name, bgr), ...) pairs.
+        tick_bgr (tuple): BGR color of health tick.
+        tolerance (int): Color tolerance.
+    Returns:
+        np.ndarray: uint8 label image; bit 0 is the tick, bit i + 1 is class_colors[i].
+    """
+    lut = _build_color_lut(class_colors, tuple(tick_bgr), tolerance)
+    blue, green, red = cv2.split(cv2.LUT(img, lut))
+    cv2.bitwise_and(blue, green, dst=blue)
+    cv2.bitwise_and(blue, red, dst=blue)
+    return blue
+
+
+def measure_fill_width(mask_row, max_gap=HEALTH_TICK_MAX_WIDTH):
+    """
+    Run-length scan of one bar row: length of the filled run starting at index 0,
+    bridging gaps of up to max_gap pixels (the ticks drawn over the fill).
+    Args:
+        mask_row (np.ndarray): 1-D bar mask starting at the bar's left edge.
+        max_gap (int): Widest gap that still counts as part of the fill.
+    Returns:
+        int: Filled width in pixels.
+    """
+    filled = np.flatnonzero(mask_row)
+    if filled.size == 0 or filled[0] > max_gap:
+        return 0
+    breaks = np.flatnonzero(np.diff(filled) > max_gap + 1)
+    return int(filled[breaks[0]] if breaks.size else filled[-1]) + 1
+
+
+def get_health_bar_width(window_height=None):
+    """
+    Returns the full health bar width scaled to the game window height.
+    Args:
+        window_height (int, optional): Window height in pixels; defaults to the game window.
+    Returns:
+        int: Full bar width in pixels.
+    """
+    if window_height is None:
+        rect = get_window_rect()
+        if rect is None:
+            return HEALTH_BAR_FULL_WIDTH
+        window_height = rect[3]
+    return max(int(round(HEALTH_BAR_FULL_WIDTH * window_height / HEALTH_BAR_REFERENCE_HEIGHT)), 1)
+
+
+def detect_health_bars(img, classes=HEALTH_BAR_CLASSES, tick_bgr=HEALTH_TICK_COLOR, tolerance=2,
+                       search_size_x=HEALTH_TICK_SEARCH_WIDTH, bar_width=HEALTH_BAR_FULL_WIDTH):
+    """
+    Detects every enemy, ally and player health bar in a single frame.
+    A bar is a connected region of its class color with a health tick within
+    search_size_x pixels to the right of one of its pixels on the same row.
+    Each bar's HP fraction is its filled run along the middle row, from the
+    same class mask, divided by bar_width.
+    Args:
+        img (np.ndarray): BGR image.
+        classes (dict): {class_name: bgr} health bar colors.
+        tick_bgr (tuple): BGR color of health tick.
+        tolerance (int): Color tolerance.
+        search_size_x (int): Max horizontal distance from bar pixel to tick pixel.
+        bar_width (int): Width of a full health bar in pixels (see get_health_bar_width).
+    Returns:
+        list[HealthBar]: Detections in row-major order of their anchor pixel.
+    """
+    class_colors = tuple((name, tuple(bgr)) for name, bgr in classes.items())
+    labels = classify_pixels(img, class_colors, tick_bgr, tolerance)
+
+    # Label bits are 1, 2, 4, ...; compare to 0 so every mask is 0/255 before combining
+    mask_health_tick = cv2.compare(cv2.bitwise_and(labels, _TICK_BIT), 0, cv2.CMP_NE)
+    if not cv2.countNonZero(mask_health_tick):
+        return []
+    kernel = np.ones((1, search_size_x + 1), dtype=np.uint8)
+    tick_ahead = cv2.dilate(mask_health_tick, kernel, anchor=(0, 0))
+
+    width = labels.shape[1]
+    detections = []
+    for bit, (name, _) in enumerate(class_colors, start=1):
+        mask_health_bar = cv2.compare(cv2.bitwise_and(labels, 1 << bit), 0, cv2.CMP_NE)
+        hits = cv2.bitwise_and(mask_health_bar, tick_ahead)
+        hit_indices = np.flatnonzero(hits)
+        if hit_indices.size == 0:
+            continue
+        _, components, stats, _ = cv2.connectedComponentsWithStats(mask_health_bar, connectivity=8)
+        # First hit pixel of each component, in row-major order
+        hit_components, first = np.unique(components.ravel()[hit_indices], return_index=True)
+        for component, index in zip(hit_components, hit_indices[first]):
+            y, x = divmod(int(index), width)
+            box = tuple(int(v) for v in stats[component, :4])
+            bx, by, _, bh = box
+            filled = measure_fill_width(mask_health_bar[by + bh // 2, bx:bx + bar_width])
+            detections.append(HealthBar(
+                name, (x, y + HEALTH_BAR_CHAMPION_OFFSET_Y), box, min(filled / bar_width, 1.0)
+            ))
 
-    lower_health_bar = np.array([max(c - tolerance, 0) for c in health_bar_bgr], dtype=np.uint8)
-    upper_health_bar = np.array([min(c + tolerance, 255) for c in health_bar_bgr], dtype=np.uint8)
-    mask_health_bar = cv2.inRange(img, lower_health_bar, upper_health_bar)
+    detections.sort(key=lambda bar: (bar.location[1], bar.location[0]))
+    return detections
 
-    lower_health_tick = np.array([max(c - tolerance, 0) for c in health_tick_bgr], dtype=np.uint8)
-    upper_health_tick = np.array([min(c + tolerance, 255) for c in health_tick_bgr], dtype=np.uint8)
-    mask_health_tick = cv2.inRange(img, lower_health_tick, upper_health_tick)
 
-    search_size_x = 100
-    height, width = mask_health_bar.shape
+def _offset_health_bar(bar, origin):
+    ox, oy = origin
+    x, y = bar.location
+    bx, by, bw, bh = bar.box
+    return bar._replace(location=(x + ox, y + oy), box=(bx + ox, by + oy, bw, bh))
 
-    for y in range(height):
-        for x in range(width):
-            if mask_health_bar[y, x] > 0:
-                for dx in range(0, search_size_x + 1):
-                    nx = x + dx
-                    if nx < width and mask_health_tick[y, nx] > 0:
-                        champion_location = (x, y+160)
-                        return champion_location
+
+def find_champion_locations(img=None, tolerance=2, region=None):
+    """
+    Detects all champions on screen from a single screenshot.
+    Args:
+        img (np.ndarray, optional): Full game window BGR frame to scan; its height scales
+            the bar width. If None, captures region.
+        tolerance (int): Color tolerance.
+        region (str or tuple, optional): Game window region to capture (see resolve_region).
+            Ignored when img is given; locations are then relative to img.
+    Returns:
+        dict: {class_name: [HealthBar, ...]} for every class in HEALTH_BAR_CLASSES.
+    """
+    origin = (0, 0)
+    if img is None:
+        img, origin = capture_region(region)
+        bar_width = get_health_bar_width()
+    else:
+        bar_width = get_health_bar_width(img.shape[0])
+    champions = {name: [] for name in HEALTH_BAR_CLASSES}
+    for bar in detect_health_bars(img, tolerance=tolerance, bar_width=bar_width):
+        if origin != (0, 0):
+            bar = _offset_health_bar(bar, origin)
+        champions[bar.champion_class].append(bar)
+    return champions
+
+
+# Find the location of a champion by searching for health bar and tick colors
+def find_champion_location(health_bar_bgr, health_tick_bgr, tolerance=2, region=None, scale=1):
+    """
+    Finds the champion location by searching for health bar and tick colors in the screenshot.
+    Args:
+        health_bar_bgr (tuple): BGR color of health bar.
+        health_tick_bgr (tuple): BGR color of health tick.
+        tolerance (int): Color tolerance.
+        region (str or tuple, optional): Game window region to search (see resolve_region).
+        scale (int): 1 for the full-resolution search, 2 or 4 for the coarse-to-fine search.
+    Returns:
+        tuple or None: (x, y) screen location if found, else None.
+    """
+    img, (origin_x, origin_y) = capture_region(region)
+    bar_location = locate_health_bar_pyramid(img, health_bar_bgr, health_tick_bgr, tolerance, scale=scale)
+    if bar_location:
+        x, y = bar_location
+        return (x + origin_x, y + origin_y + HEALTH_BAR_CHAMPION_OFFSET_Y)
 
     logging.debug("Health bar color not detected on screen or no valid champion location found.")
     return None
 
 
+# ===========================
+# Target Tracking
+# ===========================
+
+class ChampionTracker:
+    """
+    Tracks one champion's health bar across ticks with a constant-velocity
+    (alpha-beta) filter. Each update first searches a small window around the
+    predicted bar position and only falls back to a full-region scan on a miss.
+    A full scan acquires the first bar found, or with prefer_low_hp the bar with
+    the lowest fill_ratio.
+    """
+
+    def __init__(self, health_bar_bgr, health_tick_bgr=HEALTH_TICK_COLOR, tolerance=2, region="play_field",
+                 window_size=(400, 240), max_misses=2, alpha=0.85, beta=0.3, half_life=0.5, scale=1,
+                 prefer_low_hp=False):
+        """
+        Args:
+            health_bar_bgr (tuple): BGR color of the tracked health bar.
+            health_tick_bgr (tuple): BGR color of health tick.
+            tolerance (int): Color tolerance.
+            region (str or tuple): Region used for full scans (see resolve_region).
+            window_size (tuple): (width, height) of the predicted search window in pixels.
+            max_misses (int): Consecutive misses before the track is dropped.
+            alpha (float): Position correction gain.
+            beta (float): Velocity correction gain.
+            half_life (float): Seconds after which confidence halves without a detection.
+            scale (int): Coarse-to-fine factor for full scans; 1 searches at full resolution.
+            prefer_low_hp (bool): Acquire the lowest-HP bar on full scans instead of the first one.
+                Full scans then classify the whole region and ignore scale.
+        """
+        self.health_bar_bgr = health_bar_bgr
+        self.health_tick_bgr = health_tick_bgr
+        self.tolerance = tolerance
+        self.region = region
+        self.window_size = window_size
+        self.max_misses = max_misses
+        self.alpha = alpha
+        self.beta = beta
+        self.half_life = half_life
+        self.scale = scale
+        self.prefer_low_hp = prefer_low_hp
+        self.reset(clear_stats=True)
+
+    def reset(self, clear_stats=False):
+        """
+        Drops the current track.
+        Args:
+            clear_stats (bool): Also zero the search counters, e.g. at the start of a game.
+        """
+        self.position = None      # Filtered bar position (x, y), absolute screen pixels
+        self.velocity = (0.0, 0.0)  # Pixels per second
+        self.last_seen = None
+        self.misses = 0
+        if clear_stats:
+            self.stats = {"window_hits": 0, "window_misses": 0, "full_scans": 0, "full_hits": 0}
+
+    @property
+    def age(self):
+        """
+        Returns:
+            float or None: Seconds since the last detection, or None without a track.
+        """
+        if self.last_seen is None:
+            return None
+        return time.perf_counter() - self.last_seen
+
+    @property
+    def confidence(self):
+        """
+        Returns:
+            float: 1.0 right after a detection, halving every half_life seconds; 0.0 without a track.
+        """
+        age = self.age
+        if age is None:
+            return 0.0
+        return 0.5 ** (age / self.half_life)
+
+    def predict(self, now=None):
+        """
+        Args:
+            now (float, optional): time.perf_counter() timestamp.
+        Returns:
+            tuple or None: Predicted bar position (x, y), or None without a track.
+        """
+        if self.position is None:
+            return None
+        dt = (now or time.perf_counter()) - self.last_seen
+        return (self.position[0] + self.velocity[0] * dt, self.position[1] + self.velocity[1] * dt)
+
+    def _search_window(self, predicted):
+        bounds = resolve_region(self.region)
+        width, height = self.window_size
+        left = max(int(predicted[0] - width // 2), bounds["left"])
+        top = max(int(predicted[1] - height // 2), bounds["top"])
+        right = min(left + width, bounds["left"] + bounds["width"])
+        bottom = min(top + height, bounds["top"] + bounds["height"])
+        if right <= left or bottom <= top:
+            return None
+        return {"left": left, "top": top, "width": right - left, "height": bottom - top}
+
+    def _search(self, region, scale=1):
+        img, (origin_x, origin_y) = capture_region(region)
+        bar_location = locate_health_bar_pyramid(
+            img, self.health_bar_bgr, self.health_tick_bgr, self.tolerance, scale=scale
+        )
+        if bar_location is None:
+            return None
+        return bar_location[0] + origin_x, bar_location[1] + origin_y
+
+    def _search_lowest_hp(self, region):
+        img, (origin_x, origin_y) = capture_region(region)
+        bars = detect_health_bars(img, {"target": self.health_bar_bgr}, self.health_tick_bgr, self.tolerance,
+                                  bar_width=get_health_bar_width())
+        if not bars:
+            return None
+        x, y = min(bars, key=lambda bar: bar.fill_ratio).location  # Ties keep row-major order
+        return x + origin_x, y - HEALTH_BAR_CHAMPION_OFFSET_Y + origin_y
+
+    def _correct(self, measured, now):
+        if self.position is None:
+            self.position = measured
+            self.velocity = (0.0, 0.0)
+        else:
+            dt = max(now - self.last_seen, 1e-3)
+            predicted = self.predict(now)
+            rx, ry = measured[0] - predicted[0], measured[1] - predicted[1]
+            self.position = (predicted[0] + self.alpha * rx, predicted[1] + self.alpha * ry)
+            self.velocity = (self.velocity[0] + self.beta * rx / dt, self.velocity[1] + self.beta * ry / dt)
+        self.last_seen = now
+        self.misses = 0
+
+    def update(self):
+        """
+        Captures and locates the tracked champion, cheap path first.
+        Returns:
+            tuple or None: (x, y) champion screen location if found, else None.
+        """
+        now = time.perf_counter()
+        measured = None
+        predicted = self.predict(now)
+        if predicted is not None:
+            window = self._search_window(predicted)
+            measured = self._search(window) if window else None
+            if measured:
+                self.stats["window_hits"] += 1
+            else:
+                self.stats["window_misses"] += 1
+
+        if measured is None:
+            self.stats["full_scans"] += 1
+            if self.prefer_low_hp:
+                measured = self._search_lowest_hp(self.region)
+            else:
+                measured = self._search(self.region, self.scale)
+            if measured:
+                self.stats["full_hits"] += 1
+                # A full-scan hit may be a different champion; restart the track there
+                self.position = None
+
+        if measured is None:
+            self.misses += 1
+            if self.misses >= self.max_misses:
+                self.reset()
+            return None
+
+        self._correct(measured, now)
+        return (measured[0], measured[1] + HEALTH_BAR_CHAMPION_OFFSET_Y)
+
+    def hit_rate(self):
+        """
+        Returns:
+            float: Fraction of updates served by the predicted window.
+        """
+        updates = self.stats["window_hits"] + self.stats["full_scans"]
+        return self.stats["window_hits"] / updates if updates else 0.0
+
+
 # ===========================
 # Game Control Utilities
 # ===========================
 
-_keybinds, _general = load_settings()
+_keybinds, _general = {}, {}
+
+
+def _apply_settings(keybinds, general):
+    global _keybinds, _general
+    _keybinds, _general = keybinds, general
+
+
+watch_settings(_apply_settings)  # Keybinds reload live when config.json changes
 
 def sleep_random(min_seconds, max_seconds):
     """
@@ -90,21 +531,86 @@ def level_up_abilities(order=("R", "Q", "W", "E")):
             keyboard.send(f"{hold_key}+{spell_keys[key]}")
             time.sleep(0.1)
 
-def buy_recommended_items():
+_pending_shop_ocr = None
+_shop_search = {"started": None, "opened": False, "ocr_misses": 0}
+
+
+def find_shop_location():
+    """
+    Looks for the shop's SELL label without blocking the game loop.
+    Tries the label template first; otherwise submits OCR to the worker pool
+    and picks up the result on a later call.
+    Returns:
+        tuple or None: (x, y, w, h) if found, else None.
+    """
+    global _pending_shop_ocr
+    shop_location = find_label_location("SELL", region="shop", fallback_ocr=False)
+    if shop_location:
+        return shop_location
+
+    if _pending_shop_ocr is not None and _pending_shop_ocr.done():
+        future, _pending_shop_ocr = _pending_shop_ocr, None
+        if not future.cancelled() and future.exception() is None:
+            shop_location = future.result()["SELL"]
+            if shop_location:
+                return shop_location
+            _shop_search["ocr_misses"] += 1
+    if _pending_shop_ocr is None:
+        _pending_shop_ocr = submit_label_ocr("shop", ("SELL",), region="shop")
+    return None
+
+
+def reset_shop_search():
+    """
+    Forgets any shop lookup in progress, e.g. at the start of a game.
+    """
+    global _pending_shop_ocr
+    if _pending_shop_ocr is not None:
+        _pending_shop_ocr.cancel()  # Its frame predates the shop being toggled
+        _pending_shop_ocr = None
+    _shop_search.update(started=None, opened=False, ocr_misses=0)
+
+
+def buy_recommended_items(now=None):
     """
     Finds the shop location and performs recommended item purchases.
-    Opens the shop if not already open.
+    Opens the shop if not already open. Never waits on OCR: call it once per
+    game loop iteration until it returns True.
+    The shop is opened only once OCR reports no SELL label; a lookup still in
+    flight says nothing about the shop, so it is waited on, and the purchase is
+    skipped without touching the shop key if no result comes within
+    SHOP_OCR_TIMEOUT seconds. Once opened, the purchase is given up after the
+    same wait.
+    Args:
+        now (float, optional): time.monotonic() timestamp.
+    Returns:
+        bool: True once items were bought or the shop could not be found,
+            False while the shop lookup is still pending.
     """
-    time.sleep(0.5)  # Wait a moment to ensure shop is open
-    shop_location = find_text_location("SELL")
+    now = time.monotonic() if now is None else now
+    if _shop_search["started"] is None:
+        _shop_search["started"] = now
+    elif _shop_search["opened"] and now - _shop_search["started"] < 0.5:
+        return False  # Wait a moment to ensure shop is open
+
+    shop_location = find_shop_location()
     if not shop_location:
+        if not _shop_search["ocr_misses"]:
+            if now - _shop_search["started"] < SHOP_OCR_TIMEOUT:
+                return False
+            logging.warning("Shop OCR returned no result in time; skipping this purchase.")
+            reset_shop_search()
+            return True
+        if _shop_search["opened"]:
+            logging.warning("Shop location could not be found after opening shop.")
+            reset_shop_search()
+            return True
         # Open shop if not already open
+        reset_shop_search()
         keyboard.send(_keybinds.get("shop"))
-        time.sleep(0.5)
-        shop_location = find_text_location("SELL")
-        if not shop_location:
-            logging.warning("Shop location could not be found after opening shop.")
-            return
+        _shop_search.update(started=now, opened=True)
+        return False
+    reset_shop_search()
 
     x, y = shop_location[:2]
 
@@ -116,6 +622,7 @@ def buy_recommended_items():
 
     # Close shop
     keyboard.send(_keybinds.get("shop"))
+    return True
 
 def move_to_ally(ally_number=1):
     """
@@ -135,7 +642,8 @@ def move_to_ally(ally_number=1):
     # Move randomly near ally
     offset_x = random.randint(-15, 15)  # percent offset
     offset_y = random.randint(-15, 15)  # percent offset
-    click_percent(SCREEN_CENTER[0], SCREEN_CENTER[1], offset_x, offset_y, "right")
+    center_x, center_y = get_window_center()
+    click_percent(center_x, center_y, offset_x, offset_y, "right")
 
 
 def retreat_to_ally():
@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import json
 import os
 import requests
 import win32gui
@@ -6,86 +8,174 @@ import win32api
 import win32con
 import time
 import keyboard
-import mss
 import numpy as np
 import cv2
 import logging
 from core.constants import (
-    DEFAULT_API_TIMEOUT, LIVE_CLIENT_URL, TESSERACT_PATH,
-    DATA_DRAGON_VERSIONS_URL, DATA_DRAGON_DEFAULT_LOCALE
+    TESSERACT_PATH, TESSDATA_PATH, OCR_PSM,
+    DATA_DRAGON_VERSIONS_URL, DATA_DRAGON_DEFAULT_LOCALE, DATA_DRAGON_CDN_URL, DATA_DRAGON_VERSION_TTL,
+    LEAGUE_GAME_WINDOW_TITLE, SCREEN_REGIONS, OCR_LAYOUT_MARGIN, WINDOW_POLL_INTERVAL
 )
+from utils.config_utils import OCR_LAYOUT_CACHE_PATH, DATA_DRAGON_CACHE_DIR
+from utils.capture_utils import get_screen_capture
+import threading
 import pytesseract
 from PIL import Image
 
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 # ===========================
-# API Utilities
+# Data Dragon Cache
 # ===========================
 
+# Static data is immutable per (version, locale, endpoint), so it is cached in
+# memory and on disk indefinitely; only the latest version lookup expires.
+_data_dragon_lock = threading.Lock()
+_data_dragon_data = {}  # (version, locale, endpoint) -> dict
+_data_dragon_version = None  # (version, time.time() it was looked up)
+_champions_maps = {}  # (version, locale) -> {champion_name: champion_id}
+
+
+def _write_json_atomic(path, data, indent=None):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not write {path}: {e}")
 
-def fetch_live_client_data():
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _data_dragon_path(version, locale, endpoint):
+    return os.path.join(DATA_DRAGON_CACHE_DIR, version, locale, f"{endpoint}.json")
+
+
+def _cached_data_dragon_versions(locale, endpoint):
     """
-    Retrieves all game data from the live client API.
     Returns:
-        dict or None: Game data if successful, else None.
+        list: Versions with endpoint data on disk, newest first.
     """
     try:
-        res = requests.get(f"{LIVE_CLIENT_URL}/allgamedata", timeout=DEFAULT_API_TIMEOUT, verify=False)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            print("[ERROR] Game data request succeeded, but no data available.")
-            return None
-    except Exception as e:
-        print(f"[ERROR] Game data request failed.")
-        return None
+        versions = [
+            version for version in os.listdir(DATA_DRAGON_CACHE_DIR)
+            if os.path.exists(_data_dragon_path(version, locale, endpoint))
+        ]
+    except OSError:
+        return []
+    return sorted(versions, key=lambda v: [int(p) if p.isdigit() else 0 for p in v.split(".")], reverse=True)
 
 
-def poll_live_client_data(latest_game_data_container, stop_event, poll_time=0.2):
+def get_data_dragon_version(max_age=DATA_DRAGON_VERSION_TTL):
     """
-    Continuously polls live client data and updates the provided container.
-    Exits when stop_event is set.
+    Returns the latest Data Dragon patch version, looked up at most once per max_age.
+    Falls back to the last known version when offline.
     Args:
-        latest_game_data_container (dict): Container to store latest data.
-        stop_event (threading.Event): Event to signal polling should stop.
-        poll_time (int): Poll interval in seconds.
+        max_age (float): Seconds a looked-up version stays valid.
+    Returns:
+        str or None: Patch version, e.g. "15.14.1", or None if never looked up.
     """
-    while not stop_event.is_set():
-        latest_game_data_container['data'] = fetch_live_client_data()
-        time.sleep(poll_time)
+    global _data_dragon_version
+    version_path = os.path.join(DATA_DRAGON_CACHE_DIR, "version.json")
+    with _data_dragon_lock:
+        if _data_dragon_version is None:
+            cached = _read_json(version_path)
+            if cached:
+                _data_dragon_version = (cached["version"], cached["fetched_at"])
+        known = _data_dragon_version
+    if known and time.time() - known[1] < max_age:
+        return known[0]
+
+    # The request runs without the lock, so other callers never queue behind the network
+    try:
+        version = requests.get(DATA_DRAGON_VERSIONS_URL, timeout=5).json()[0]
+    except Exception as e:
+        stale = known[0] if known else None
+        logging.warning(f"Failed to look up the Data Dragon version ({e}); using cached version {stale}.")
+        return stale
+    looked_up = (version, time.time())
+    with _data_dragon_lock:
+        _data_dragon_version = looked_up
+        _write_json_atomic(version_path, {"version": version, "fetched_at": looked_up[1]})
+    return version
+
+
+def _load_data_dragon_data(endpoint, version, locale):
+    key = (version, locale, endpoint)
+    data = _data_dragon_data.get(key)
+    if data is not None:
+        return data
+
+    path = _data_dragon_path(version, locale, endpoint)
+    data = _read_json(path)
+    if data is None:
+        url = f"{DATA_DRAGON_CDN_URL}/{version}/data/{locale}/{endpoint}.json"
+        resp = requests.get(url, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+        _write_json_atomic(path, data)
+    _data_dragon_data[key] = data
+    return data
 
 
 def fetch_data_dragon_data(endpoint, version=None, locale=DATA_DRAGON_DEFAULT_LOCALE):
     """
-    Fetches static data from Riot Data Dragon.
+    Fetches static data from Riot Data Dragon through the memory and disk cache.
     Args:
         endpoint (str): The endpoint, e.g. "champion".
-        version (str, optional): Patch version. If None, fetches latest.
+        version (str, optional): Patch version. If None, uses the latest (see get_data_dragon_version).
         locale (str): Language code, default from constants.
     Returns:
         dict: The JSON data from Data Dragon, or {} on failure.
     """
-    try:
-        if not version:
-            versions = requests.get(DATA_DRAGON_VERSIONS_URL, timeout=5).json()
-            version = versions[0]
-        url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/{endpoint}.json"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        logging.error(f"Failed to fetch Data Dragon data for endpoint '{endpoint}': {e}")
-        return {}
+    return _fetch_data_dragon_data(endpoint, version, locale)[1]
 
-def get_champions_map():
+
+def _fetch_data_dragon_data(endpoint, version, locale):
+    """
+    Returns:
+        tuple: (version actually served or None, data or {}).
     """
-    Fetches champion data from Riot Data Dragon and returns a {name: id} mapping.
+    version = version or get_data_dragon_version()
+    if version:
+        try:
+            return version, _load_data_dragon_data(endpoint, version, locale)
+        except Exception as e:
+            logging.error(f"Failed to fetch Data Dragon data for endpoint '{endpoint}' ({version}): {e}")
+
+    # Offline: serve the newest version cached on disk
+    for cached_version in _cached_data_dragon_versions(locale, endpoint):
+        if cached_version != version:
+            logging.warning(f"Using cached Data Dragon '{endpoint}' data from {cached_version}.")
+            return cached_version, _load_data_dragon_data(endpoint, cached_version, locale)
+    return None, {}
+
+
+def get_champions_map(locale=DATA_DRAGON_DEFAULT_LOCALE):
+    """
+    Returns a {name: id} mapping of champions from the cached Data Dragon data.
+    Args:
+        locale (str): Language code of the champion names.
     Returns:
         dict: {champion_name: champion_id}
     """
-    data = fetch_data_dragon_data("champion")
-    champions_map = {}
-    for champ in data.get("data", {}).values():
-        champions_map[champ["name"]] = int(champ["key"])
+    version, data = _fetch_data_dragon_data("champion", None, locale)
+    champions_map = _champions_maps.get((version, locale))
+    if champions_map is None:
+        champions_map = {champ["name"]: int(champ["key"]) for champ in data.get("data", {}).values()}
+        if version:
+            _champions_maps[(version, locale)] = champions_map
     return champions_map
 
 
@@ -159,19 +249,276 @@ def listen_for_exit_key():
 # Screen Data
 # ===========================
 
-def get_screenshot():
+def resolve_region(region=None, window_title=LEAGUE_GAME_WINDOW_TITLE):
+    """
+    Resolves a region against the current game window rectangle.
+    Args:
+        region (str, tuple or dict, optional): A SCREEN_REGIONS name, an explicit
+            (x, y, w, h) in pixels relative to the window's client area, or an
+            mss rectangle dict already in absolute screen pixels.
+            None captures the whole primary monitor.
+        window_title (str): Window the region is relative to.
+    Returns:
+        dict: mss rectangle {'left', 'top', 'width', 'height'} in absolute screen pixels.
+    """
+    if region is None:
+        return dict(get_screen_capture().monitor)
+    if isinstance(region, dict):
+        return region
+    window_rect = get_window_rect(window_title)
+    if window_rect is None:
+        monitor = get_screen_capture().monitor
+        window_rect = (monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+    win_left, win_top, win_width, win_height = window_rect
+
+    if isinstance(region, str):
+        if region not in SCREEN_REGIONS:
+            raise ValueError(f"Unknown screen region '{region}'.")
+        fx, fy, fw, fh = SCREEN_REGIONS[region]
+        x, y = int(win_width * fx), int(win_height * fy)
+        w, h = int(win_width * fw), int(win_height * fh)
+    else:
+        x, y, w, h = (int(v) for v in region)
+
+    # Clip to the window so grabs never leave the game's client area
+    x, y = max(x, 0), max(y, 0)
+    w, h = min(w, win_width - x), min(h, win_height - y)
+    if w <= 0 or h <= 0:
+        raise ValueError(f"Screen region {region} is outside the window.")
+    return {"left": win_left + x, "top": win_top + y, "width": w, "height": h}
+
+
+def capture_region(region=None, window_title=LEAGUE_GAME_WINDOW_TITLE):
+    """
+    Captures only the given region of the game window.
+    Args:
+        region (str or tuple, optional): See resolve_region.
+        window_title (str): Window the region is relative to.
+    Returns:
+        tuple: (frame, (left, top)) where (left, top) is the frame's absolute screen origin.
+    """
+    rect = resolve_region(region, window_title)
+    frame = get_screen_capture().grab(monitor=rect)
+    return frame, (rect["left"], rect["top"])
+
+
+def get_screenshot(max_age=None, region=None):
     """
     Captures a screenshot of the primary monitor.
+    Uses the shared capture engine, so no mss handle or frame buffer is created per call.
+    The returned frame is a pooled buffer; copy it if it must outlive a few captures.
+    Args:
+        max_age (float, optional): If background capture is running, accept its latest
+            frame when it is at most this many seconds old instead of grabbing a new one.
+        region (str or tuple, optional): Capture only this game window region (see resolve_region).
     Returns:
         np.ndarray: Screenshot image (BGR).
     """
-    with mss.mss() as sct:
-        monitor = sct.monitors[1]  # Full screen; use sct.monitors[0] for all
-        img = np.array(sct.grab(monitor))
-        # Remove alpha channel if present
-        if img.shape[2] == 4:
-            img = img[:, :, :3]
-        return img
+    if region is not None:
+        return capture_region(region)[0]
+    capture = get_screen_capture()
+    if max_age is not None:
+        frame, _, _ = capture.latest(max_age=max_age)
+        return frame
+    return capture.grab()
+
+
+def start_background_capture(interval=0.0):
+    """
+    Starts the shared capture engine's background thread so get_screenshot(max_age=...)
+    and get_latest_frame() can read the freshest frame without blocking on a capture.
+    Args:
+        interval (float): Minimum seconds between captures.
+    """
+    get_screen_capture().start(interval)
+
+
+def stop_background_capture():
+    """
+    Stops the shared capture engine's background thread.
+    """
+    get_screen_capture().stop()
+
+
+def get_latest_frame(max_age=None):
+    """
+    Returns the freshest captured frame with its capture timestamp.
+    Args:
+        max_age (float, optional): Max acceptable frame age in seconds before grabbing synchronously.
+    Returns:
+        tuple: (frame, timestamp)
+    """
+    frame, timestamp, _ = get_screen_capture().latest(max_age=max_age)
+    return frame, timestamp
+
+
+# ===========================
+# OCR Backends
+# ===========================
+
+class OcrBackend:
+    """
+    Interface for OCR engines. Backends take preprocessed single-channel
+    ndarrays and return pytesseract-style image_to_data dicts.
+    """
+    name = "base"
+
+    def image_to_data(self, img):
+        """
+        Args:
+            img (np.ndarray): Preprocessed grayscale/binary image.
+        Returns:
+            dict: Lists keyed by 'text', 'left', 'top', 'width', 'height', 'block_num',
+                'par_num', 'line_num', 'conf'; line_num counts within a paragraph and
+                par_num within a block, as in Tesseract's TSV output.
+        """
+        raise NotImplementedError
+
+    def image_to_string(self, img):
+        """
+        Args:
+            img (np.ndarray): Preprocessed grayscale/binary image.
+        Returns:
+            str: Recognized text.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PytesseractBackend(OcrBackend):
+    """
+    Spawns tesseract.exe per call through pytesseract. Always available; used as fallback.
+    """
+    name = "pytesseract"
+
+    def __init__(self, psm=OCR_PSM):
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+        self.config = f"--psm {psm}"
+
+    def image_to_data(self, img):
+        return pytesseract.image_to_data(
+            Image.fromarray(img), config=self.config, output_type=pytesseract.Output.DICT
+        )
+
+    def image_to_string(self, img):
+        return pytesseract.image_to_string(Image.fromarray(img), config=self.config)
+
+
+class TesserocrBackend(OcrBackend):
+    """
+    Keeps one in-process Tesseract API handle alive, so the language model is
+    loaded once and frames are passed as raw buffers with no temp files.
+    The handle is not thread-safe, so calls are serialized.
+    """
+    name = "tesserocr"
+
+    def __init__(self, psm=OCR_PSM, lang="eng"):
+        if tesserocr is None:
+            raise RuntimeError("tesserocr is not installed.")
+        self._api = tesserocr.PyTessBaseAPI(path=TESSDATA_PATH, lang=lang, psm=psm)
+        self._lock = threading.Lock()
+
+    def _set_image(self, img):
+        img = np.ascontiguousarray(img)
+        height, width = img.shape[:2]
+        channels = 1 if img.ndim == 2 else img.shape[2]
+        self._api.SetImageBytes(img.tobytes(), width, height, channels, width * channels)
+
+    def image_to_data(self, img):
+        data = {key: [] for key in
+                ("text", "left", "top", "width", "height", "block_num", "par_num", "line_num", "conf")}
+        level = tesserocr.RIL.WORD
+        with self._lock:
+            self._set_image(img)
+            self._api.Recognize()
+            iterator = self._api.GetIterator()
+            block_num = par_num = line_num = 0
+            if iterator is not None:
+                while True:
+                    if iterator.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+                        block_num, par_num = block_num + 1, 0
+                    if iterator.IsAtBeginningOf(tesserocr.RIL.PARA):
+                        par_num, line_num = par_num + 1, 0
+                    if iterator.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                        line_num += 1
+                    text = iterator.GetUTF8Text(level)
+                    box = iterator.BoundingBox(level)
+                    if text is not None and box is not None:
+                        x1, y1, x2, y2 = box
+                        data["text"].append(text)
+                        data["left"].append(x1)
+                        data["top"].append(y1)
+                        data["width"].append(x2 - x1)
+                        data["height"].append(y2 - y1)
+                        data["block_num"].append(block_num)
+                        data["par_num"].append(par_num)
+                        data["line_num"].append(line_num)
+                        data["conf"].append(iterator.Confidence(level))
+                    if not iterator.Next(level):
+                        break
+        return data
+
+    def image_to_string(self, img):
+        with self._lock:
+            self._set_image(img)
+            return self._api.GetUTF8Text()
+
+    def close(self):
+        with self._lock:
+            self._api.End()
+
+
+_ocr_backend = None
+_ocr_backend_lock = threading.Lock()
+
+
+def create_ocr_backend(name=None):
+    """
+    Creates an OCR backend.
+    Args:
+        name (str, optional): "tesserocr" or "pytesseract". If None, prefers the
+            persistent tesserocr backend and falls back to pytesseract.
+    Returns:
+        OcrBackend: The backend.
+    """
+    if name == "pytesseract":
+        return PytesseractBackend()
+    try:
+        return TesserocrBackend()
+    except Exception as e:
+        if name == "tesserocr":
+            raise
+        logging.info(f"Persistent OCR backend unavailable ({e}); using pytesseract.")
+        return PytesseractBackend()
+
+
+def get_ocr_backend():
+    """
+    Returns the process-wide OCR backend, creating it on first use.
+    Returns:
+        OcrBackend: Shared backend.
+    """
+    global _ocr_backend
+    if _ocr_backend is None:
+        with _ocr_backend_lock:
+            if _ocr_backend is None:
+                _ocr_backend = create_ocr_backend()
+    return _ocr_backend
+
+
+def preprocess_for_ocr(img):
+    """
+    Converts a BGR frame to the binary image OCR runs on.
+    Args:
+        img (np.ndarray): BGR image.
+    Returns:
+        np.ndarray: Thresholded grayscale image.
+    """
+    img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    _, img_thresh = cv2.threshold(img_gray, 70, 255, cv2.THRESH_BINARY)
+    return img_thresh
 
 
 def extract_screen_text():
@@ -180,71 +527,264 @@ def extract_screen_text():
     Returns:
         str: Extracted text.
     """
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
     img = get_screenshot()
 
     # preprocessing
-    img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    _, img_thresh = cv2.threshold(img_gray, 70, 255, cv2.THRESH_BINARY)
-    pil_img = Image.fromarray(img_thresh)
+    img_thresh = preprocess_for_ocr(img)
     cv2.imwrite("preprocessed_image.jpg", img_thresh) 
 
-    text = pytesseract.image_to_string(pil_img, config='--psm 11')
+    text = get_ocr_backend().image_to_string(img_thresh)
     logging.info(text)
     return text
 
 
-def extract_text_with_locations():
+def extract_text_with_locations(region=None, img=None, origin=(0, 0)):
     """
     Extracts text and their bounding boxes from the screen using Tesseract OCR.
+    Args:
+        region (str or tuple, optional): Only OCR this game window region (see resolve_region).
+        img (np.ndarray, optional): BGR frame to OCR instead of capturing region.
+        origin (tuple): Absolute screen (x, y) of img's top-left corner.
     Returns:
-        dict: line_num -> list of {'text', 'box'}
+        dict: (block_num, par_num, line_num) -> list of {'text', 'box'}; boxes are in absolute screen pixels.
     """
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
-    img = get_screenshot()
+    if img is None:
+        img, origin = capture_region(region)
 
     # preprocessing
-    img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    _, img_thresh = cv2.threshold(img_gray, 70, 255, cv2.THRESH_BINARY)
-    pil_img = Image.fromarray(img_thresh)
+    img_thresh = preprocess_for_ocr(img)
     # cv2.imwrite("preprocessed_image.jpg", img_thresh)
 
-    data = pytesseract.image_to_data(pil_img, config='--psm 11', output_type=pytesseract.Output.DICT)
+    data = get_ocr_backend().image_to_data(img_thresh)
+    return ocr_data_to_lines(data, origin)
+
 
-    text_locations = []
+def ocr_data_to_lines(data, origin=(0, 0)):
+    """
+    Groups image_to_data output into lines of words with absolute boxes.
+    line_num restarts in every paragraph and block (sparse PSM 11 output is
+    mostly one-line blocks), so lines are keyed by all three numbers.
+    Args:
+        data (dict): image_to_data output.
+        origin (tuple): Absolute screen (x, y) of the OCRed image's top-left corner.
+    Returns:
+        dict: (block_num, par_num, line_num) -> list of {'text', 'box'}
+    """
+    origin_x, origin_y = origin
+    lines = {}
     n_boxes = len(data['text'])
     for i in range(n_boxes):
         text = data['text'][i].strip()
         if text:
-            x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-            text_locations.append({'text': text, 'box': (x, y, w, h)})
+            x, y, w, h = data['left'][i] + origin_x, data['top'][i] + origin_y, data['width'][i], data['height'][i]
+            line_key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines.setdefault(line_key, []).append({'text': text, 'box': (x, y, w, h)})
 
-    lines = {}
-    for entry in text_locations:
-        line_num = data['line_num'][text_locations.index(entry)]
-        if line_num not in lines:
-            lines[line_num] = []
-        lines[line_num].append(entry)
+    return lines  # Dictionary: (block_num, par_num, line_num) -> list of {'text', 'box'}
 
-    return lines  # Dictionary: line_num -> list of {'text', 'box'}
 
+def build_word_index(lines, max_phrase_words=3):
+    """
+    Indexes OCR output by lowercased word for O(1) lookups. Runs of up to
+    max_phrase_words consecutive words on a line are indexed too, joined by
+    single spaces, with the box spanning all of them.
+    Args:
+        lines (dict): Output of extract_text_with_locations.
+        max_phrase_words (int): Longest phrase indexed.
+    Returns:
+        dict: lowercased text -> list of (x, y, w, h) boxes in reading order.
+    """
+    index = {}
+    for line_entries in lines.values():
+        for i, entry in enumerate(line_entries):
+            index.setdefault(entry['text'].lower(), []).append(entry['box'])
+            x, y, w, h = entry['box']
+            right, bottom = x + w, y + h
+            phrase = entry['text'].lower()
+            for next_entry in line_entries[i + 1:i + max_phrase_words]:
+                nx, ny, nw, nh = next_entry['box']
+                x, y = min(x, nx), min(y, ny)
+                right, bottom = max(right, nx + nw), max(bottom, ny + nh)
+                phrase = f"{phrase} {next_entry['text'].lower()}"
+                index.setdefault(phrase, []).append((x, y, right - x, bottom - y))
+    return index
+
+
+# ===========================
+# OCR Layout Memory
+# ===========================
 
-def find_text_location(target_text):
+# {"<width>x<height>": {"<TEXT>": [x, y, w, h]}}, boxes relative to the game window
+_ocr_layout = None
+_ocr_layout_lock = threading.Lock()
+_ocr_layout_stats = {"hits": 0, "misses": 0}
+_ocr_layout_stats_lock = threading.Lock()
+
+
+def _get_ocr_layout():
+    global _ocr_layout
+    if _ocr_layout is None:
+        try:
+            with open(OCR_LAYOUT_CACHE_PATH, "r") as f:
+                _ocr_layout = json.load(f)
+        except (OSError, ValueError):
+            _ocr_layout = {}
+    return _ocr_layout
+
+
+def record_ocr_layout_lookups(hits=0, misses=0):
+    """
+    Counts text lookups served by a cached crop (hits) or escalated to the full region (misses).
+    Lookups finish on OCR worker callback threads as well as the game loop.
+    """
+    with _ocr_layout_stats_lock:
+        _ocr_layout_stats["hits"] += hits
+        _ocr_layout_stats["misses"] += misses
+
+
+def _get_layout_window():
+    """
+    Returns:
+        tuple: (resolution key, (window left, window top)).
+    """
+    rect = get_window_rect(LEAGUE_GAME_WINDOW_TITLE)
+    if rect is None:
+        monitor = get_screen_capture().monitor
+        rect = (monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+    left, top, width, height = rect
+    return f"{width}x{height}", (left, top)
+
+
+def remember_text_location(target_text, box):
+    """
+    Stores where a text was found for the current resolution and persists it.
+    Args:
+        target_text (str): The text.
+        box (tuple): (x, y, w, h) in absolute screen pixels.
+    """
+    resolution, (win_left, win_top) = _get_layout_window()
+    x, y, w, h = box
+    entry = [x - win_left, y - win_top, w, h]
+    with _ocr_layout_lock:
+        layout = _get_ocr_layout().setdefault(resolution, {})
+        if layout.get(target_text.upper()) != entry:
+            layout[target_text.upper()] = entry
+            _write_json_atomic(OCR_LAYOUT_CACHE_PATH, _ocr_layout, indent=4)
+
+
+def get_ocr_layout_stats():
+    """
+    Returns:
+        dict: Cached-crop hits, misses and hit rate of text lookups.
+    """
+    with _ocr_layout_stats_lock:
+        hits, misses = _ocr_layout_stats["hits"], _ocr_layout_stats["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+
+
+def get_cached_text_crop(target_text, img=None, origin=(0, 0), margin=OCR_LAYOUT_MARGIN):
+    """
+    Cuts a tight crop around the text's remembered location for this resolution.
+    Args:
+        target_text (str): The text.
+        img (np.ndarray, optional): BGR frame to crop instead of capturing the screen.
+        origin (tuple): Absolute screen (x, y) of img's top-left corner.
+        margin (int): Minimum padding around the remembered box, in pixels.
+    Returns:
+        tuple or None: (crop, (x, y) absolute origin of the crop), or None if the
+            location is unknown or lies outside img.
+    """
+    resolution, (win_left, win_top) = _get_layout_window()
+    with _ocr_layout_lock:
+        cached = _get_ocr_layout().get(resolution, {}).get(target_text.upper())
+    if not cached:
+        return None
+    x, y, w, h = cached
+    pad_x, pad_y = max(margin, w // 2), max(margin, h)
+    left, top = max(win_left + x - pad_x, win_left), max(win_top + y - pad_y, win_top)
+    width, height = win_left + x + w + pad_x - left, win_top + y + h + pad_y - top
+
+    if img is None:
+        crop_rect = {"left": left, "top": top, "width": width, "height": height}
+        crop, crop_origin = capture_region(crop_rect)
+    else:
+        img_left, img_top = max(left - origin[0], 0), max(top - origin[1], 0)
+        crop = img[img_top:top - origin[1] + height, img_left:left - origin[0] + width]
+        crop_origin = (origin[0] + img_left, origin[1] + img_top)
+        if crop.size == 0:
+            return None
+    return crop, crop_origin
+
+
+def _find_text_in_cached_box(target_text, img=None, origin=(0, 0), margin=OCR_LAYOUT_MARGIN):
+    """
+    OCRs only a tight crop around the text's remembered location.
+    Returns:
+        tuple or None: (x, y, w, h) if found in the crop, else None.
+    """
+    cached_crop = get_cached_text_crop(target_text, img, origin, margin)
+    if cached_crop is None:
+        return None
+    crop, crop_origin = cached_crop
+    boxes = build_word_index(extract_text_with_locations(img=crop, origin=crop_origin)).get(target_text.lower())
+    return boxes[0] if boxes else None
+
+
+def find_text_locations(target_texts, region=None, img=None, origin=(0, 0), use_layout_cache=True):
+    """
+    Finds several texts with a single OCR pass over one frame.
+    Texts with a remembered location for this resolution are first looked for
+    in a small crop around it; only the rest escalate to the full region.
+    Args:
+        target_texts (iterable): Texts to search for (case-insensitive).
+        region (str or tuple, optional): Only OCR this game window region (see resolve_region).
+        img (np.ndarray, optional): BGR frame to OCR instead of capturing region.
+        origin (tuple): Absolute screen (x, y) of img's top-left corner.
+        use_layout_cache (bool): Try the remembered locations first and record new ones.
+    Returns:
+        dict: target_text -> (x, y, w, h) of its first match, or None if not found.
+    """
+    matches = {}
+    missing = []
+    for target_text in target_texts:
+        box = _find_text_in_cached_box(target_text, img, origin) if use_layout_cache else None
+        if box:
+            record_ocr_layout_lookups(hits=1)
+            matches[target_text] = box
+            logging.info(f"OCR: Found text '{target_text}' at cached location {box}")
+        else:
+            missing.append(target_text)
+
+    if missing:
+        if use_layout_cache:
+            record_ocr_layout_lookups(misses=len(missing))
+        index = build_word_index(extract_text_with_locations(region, img, origin))
+        for target_text in missing:
+            boxes = index.get(target_text.lower())
+            matches[target_text] = boxes[0] if boxes else None
+            if boxes:
+                logging.info(f"OCR: Found text '{target_text}' at location {boxes[0]}")
+                if use_layout_cache:
+                    remember_text_location(target_text, boxes[0])
+            else:
+                logging.info(f"OCR: Text '{target_text}' not found on screen.")
+
+    if use_layout_cache:
+        logging.debug(f"OCR layout cache: {get_ocr_layout_stats()}")
+    return matches
+
+
+def find_text_location(target_text, region=None):
     """
     Finds the location of the specified text on the screen using OCR.
     Args:
         target_text (str): Text to search for.
+        region (str or tuple, optional): Only OCR this game window region (see resolve_region).
     Returns:
         tuple or None: (x, y, w, h) if found, else None.
     """
-    lines = extract_text_with_locations()
-    for line_entries in lines.values():
-        for entry in line_entries:
-            if entry['text'].lower() == target_text.lower():
-                logging.info(f"OCR: Found text '{target_text}' at location {entry['box']}")
-                return entry['box']
-    logging.info(f"OCR: Text '{target_text}' not found on screen.")
-    return None
+    return find_text_locations((target_text,), region)[target_text]
 
 
 def enable_logging(log_file=None, level=logging.INFO):
@@ -283,10 +823,13 @@ def bring_window_to_front(window_title):
     else:
         logging.warning(f"Window with title '{window_title}' not found.")
 
+_window_handles = {}
+
+
 def wait_for_window(window_title, timeout=60):
     """
     Waits for a window with the given title to appear within the timeout period.
-    If found, brings it to the foreground.
+    If found, brings it to the foreground and remembers its handle for region lookups.
     Args:
         window_title (str): The title of the window to wait for.
         timeout (int): Maximum time to wait in seconds.
@@ -297,8 +840,73 @@ def wait_for_window(window_title, timeout=60):
     for _ in range(timeout):
         hwnd = win32gui.FindWindow(None, window_title)
         if hwnd:
+            _window_handles[window_title] = hwnd
             bring_window_to_front(window_title)
             return hwnd
         time.sleep(1)
     logging.warning(f"Window with title '{window_title}' not found after {timeout} seconds.")
     return
+
+
+async def wait_for_window_async(window_title, timeout=60, poll_interval=WINDOW_POLL_INTERVAL):
+    """
+    wait_for_window for asyncio handlers: polls between awaits instead of
+    sleeping, so the event loop keeps serving other events while it waits.
+    Args:
+        window_title (str): The title of the window to wait for.
+        timeout (float): Maximum time to wait in seconds.
+        poll_interval (float): Seconds between window lookups.
+    Returns:
+        int or None: Window handle if found, else None.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        hwnd = win32gui.FindWindow(None, window_title)
+        if hwnd:
+            _window_handles[window_title] = hwnd
+            bring_window_to_front(window_title)
+            return hwnd
+        if time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(poll_interval)
+    logging.warning(f"Window with title '{window_title}' not found after {timeout} seconds.")
+    return None
+
+
+def get_window_rect(window_title=LEAGUE_GAME_WINDOW_TITLE):
+    """
+    Returns the client-area rectangle of a window in absolute screen pixels.
+    Uses the handle found by wait_for_window when it is still valid.
+    Args:
+        window_title (str): The title of the window.
+    Returns:
+        tuple or None: (left, top, width, height), or None if the window is not found.
+    """
+    hwnd = _window_handles.get(window_title)
+    if not hwnd or not win32gui.IsWindow(hwnd):
+        hwnd = win32gui.FindWindow(None, window_title)
+        if not hwnd:
+            return None
+        _window_handles[window_title] = hwnd
+    _, _, width, height = win32gui.GetClientRect(hwnd)
+    left, top = win32gui.ClientToScreen(hwnd, (0, 0))
+    if width <= 0 or height <= 0:
+        return None
+    return left, top, width, height
+
+
+def get_window_center(window_title=LEAGUE_GAME_WINDOW_TITLE):
+    """
+    Returns the center of a window's client area in absolute screen pixels.
+    Falls back to the primary monitor center if the window is not found.
+    Args:
+        window_title (str): The title of the window.
+    Returns:
+        tuple: (x, y)
+    """
+    rect = get_window_rect(window_title)
+    if rect is None:
+        monitor = get_screen_capture().monitor
+        rect = (monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+    left, top, width, height = rect
+    return left + width // 2, top + height // 2
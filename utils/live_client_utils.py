@@ -0,0 +1,844 @@
+import asyncio
+import bisect
+import queue
+import threading
+import time
+import logging
+from collections import deque, namedtuple
+import json
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from core.constants import (
+    LIVE_CLIENT_URL, LIVE_CLIENT_TIMEOUT, LIVE_CLIENT_MAX_BACKOFF, LIVE_CLIENT_STOP_CHECK
+)
+
+
+# ===========================
+# Live Client Session
+# ===========================
+
+def decode_json(content):
+    """
+    Decodes a JSON response body, using orjson when it is installed.
+    Args:
+        content (bytes): Response body.
+    Returns:
+        Parsed JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def create_live_client_session(pool_maxsize=4):
+    """
+    Creates a keep-alive session for the local Live Client API.
+    One pooled connection per endpoint poll avoids a TLS handshake per request.
+    Args:
+        pool_maxsize (int): Max pooled connections to 127.0.0.1:2999.
+    Returns:
+        requests.Session: Session with certificate checks disabled (the API uses a self-signed cert).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = False
+    return session
+
+
+class LatencyStats:
+    """
+    Rolling request latency and outcome counters for one endpoint.
+    """
+
+    def __init__(self, window=200):
+        self.samples = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, latency, ok):
+        self.requests += 1
+        if ok:
+            self.samples.append(latency)
+        else:
+            self.errors += 1
+
+    def summary(self):
+        """
+        Returns:
+            dict: Request/error counts and mean, p50, p95 and max latency in ms over the window.
+        """
+        samples = sorted(self.samples)
+        summary = {"requests": self.requests, "errors": self.errors}
+        if samples:
+            summary.update({
+                "mean_ms": 1000 * sum(samples) / len(samples),
+                "p50_ms": 1000 * samples[len(samples) // 2],
+                "p95_ms": 1000 * samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+                "max_ms": 1000 * samples[-1],
+            })
+        return summary
+
+
+# ===========================
+# Live Client Poller
+# ===========================
+
+class BaseLiveClientPoller:
+    """
+    Subscription bookkeeping shared by the threaded and asyncio pollers.
+    Consumers subscribe to only the endpoints they need, each at its own
+    interval. While the game is loading (connection refused / 404), each
+    endpoint backs off exponentially up to LIVE_CLIENT_MAX_BACKOFF and resets
+    on success.
+    """
+
+    def __init__(self, base_url=LIVE_CLIENT_URL, timeout=LIVE_CLIENT_TIMEOUT):
+        """
+        Args:
+            base_url (str): Live Client API root.
+            timeout (tuple): (connect, read) timeout in seconds.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self._subscriptions = {}
+        self._latest = {}
+        self._stats = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, endpoint, interval=0.2, callback=None, path=None):
+        """
+        Polls an endpoint every interval seconds once started.
+        Args:
+            endpoint (str): Endpoint path without the leading slash, e.g. "activeplayer".
+            interval (float): Poll interval in seconds.
+            callback (callable, optional): Called with each successful response.
+            path (callable, optional): Returns the request path (with query) for each
+                poll, for endpoints whose query changes, e.g. eventdata?eventID=N.
+        """
+        with self._lock:
+            self._subscriptions[endpoint] = {
+                "interval": interval,
+                "callback": callback,
+                "path": path,
+                "next_due": 0.0,
+                "backoff": 0.0,
+            }
+
+    def unsubscribe(self, endpoint):
+        with self._lock:
+            self._subscriptions.pop(endpoint, None)
+
+    def add_listener(self, listener):
+        """
+        Registers a listener for every successful response, e.g. a session recorder.
+        Args:
+            listener (callable): Called with (endpoint, data) before the subscriber callback.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get(self, endpoint):
+        """
+        Returns:
+            The latest successful response for an endpoint, or None.
+        """
+        return self._latest.get(endpoint)
+
+    def clear(self):
+        """
+        Drops the latest responses, e.g. before a new game starts.
+        """
+        self._latest.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: endpoint -> LatencyStats.summary()
+        """
+        return {endpoint: stats.summary() for endpoint, stats in list(self._stats.items())}
+
+    def _due_subscriptions(self, now):
+        with self._lock:
+            return [
+                (endpoint, sub, sub["path"]() if sub["path"] else None)
+                for endpoint, sub in self._subscriptions.items() if sub["next_due"] <= now
+            ]
+
+    def _handle_result(self, endpoint, sub, data, now):
+        if data is None:
+            sub["backoff"] = min(max(sub["backoff"] * 2, sub["interval"]), LIVE_CLIENT_MAX_BACKOFF)
+            sub["next_due"] = now + sub["backoff"]
+            return
+        sub["backoff"] = 0.0
+        sub["next_due"] = now + sub["interval"]
+        self._dispatch(endpoint, data, sub["callback"])
+
+    def _dispatch(self, endpoint, data, callback):
+        self._latest[endpoint] = data
+        for listener in list(self._listeners):
+            try:
+                listener(endpoint, data)
+            except Exception as e:
+                logging.error(f"Live Client listener failed on '{endpoint}': {e}")
+        if callback is not None:
+            try:
+                callback(data)
+            except Exception as e:
+                logging.error(f"Live Client '{endpoint}' subscriber failed: {e}")
+
+    def _seconds_until_next(self):
+        with self._lock:
+            if not self._subscriptions:
+                return LIVE_CLIENT_MAX_BACKOFF
+            next_due = min(sub["next_due"] for sub in self._subscriptions.values())
+        return max(next_due - time.monotonic(), 0.0)
+
+
+class LiveClientPoller(BaseLiveClientPoller):
+    """
+    Polls the subscribed Live Client endpoints on a daemon thread over one
+    persistent requests session with short timeouts.
+    """
+
+    def __init__(self, base_url=LIVE_CLIENT_URL, timeout=LIVE_CLIENT_TIMEOUT, session=None):
+        """
+        Args:
+            base_url (str): Live Client API root.
+            timeout (tuple): (connect, read) timeout in seconds.
+            session (requests.Session, optional): Session to use; one is created if None.
+        """
+        super().__init__(base_url, timeout)
+        self.session = session or create_live_client_session()
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def fetch(self, endpoint, path=None):
+        """
+        Requests one endpoint and records its latency.
+        Args:
+            endpoint (str): Endpoint path without the leading slash.
+            path (str, optional): Request path incl. query; defaults to endpoint.
+        Returns:
+            dict, list or None: Parsed JSON if successful, else None.
+        """
+        stats = self._stats.setdefault(endpoint, LatencyStats())
+        start = time.perf_counter()
+        try:
+            res = self.session.get(f"{self.base_url}/{path or endpoint}", timeout=self.timeout)
+            if res.status_code != 200:
+                stats.record(time.perf_counter() - start, False)
+                logging.debug(f"Live Client '{endpoint}' returned status {res.status_code}.")
+                return None
+            data = decode_json(res.content)
+        except (requests.RequestException, ValueError) as e:
+            stats.record(time.perf_counter() - start, False)
+            logging.debug(f"Live Client '{endpoint}' request failed: {e}")
+            return None
+        stats.record(time.perf_counter() - start, True)
+        return data
+
+    def poll_once(self, now=None):
+        """
+        Polls every subscription that is due.
+        Args:
+            now (float, optional): time.monotonic() timestamp.
+        Returns:
+            float: Seconds until the next subscription is due.
+        """
+        now = now if now is not None else time.monotonic()
+        for endpoint, sub, path in self._due_subscriptions(now):
+            self._handle_result(endpoint, sub, self.fetch(endpoint, path), now)
+        return self._seconds_until_next()
+
+    def run(self, stop_event=None):
+        """
+        Polls until stop_event (or stop()) is set.
+        Args:
+            stop_event (threading.Event, optional): External stop signal. It cannot
+                interrupt a wait, so waits are capped at LIVE_CLIENT_STOP_CHECK seconds.
+        """
+        while not self._stop_event.is_set() and not (stop_event and stop_event.is_set()):
+            wait = self.poll_once()
+            if stop_event is not None:
+                wait = min(wait, LIVE_CLIENT_STOP_CHECK)
+            if wait > 0:
+                self._stop_event.wait(wait)
+
+    def start(self, stop_event=None):
+        """
+        Starts polling on a daemon thread.
+        Args:
+            stop_event (threading.Event, optional): External stop signal.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, args=(stop_event,), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        self.session.close()
+
+
+class AsyncLiveClientPoller(BaseLiveClientPoller):
+    """
+    asyncio version of LiveClientPoller that runs as a task on the lcu_driver
+    event loop with aiohttp (already an lcu_driver dependency) instead of a
+    separate thread and requests stack. Subscriber callbacks run on the loop;
+    SnapshotPublisher's reference swap and StateChangeBus's queues hand the
+    results to the game-loop thread safely.
+    """
+
+    def __init__(self, base_url=LIVE_CLIENT_URL, timeout=LIVE_CLIENT_TIMEOUT, pool_size=4):
+        """
+        Args:
+            base_url (str): Live Client API root.
+            timeout (tuple): (connect, read) timeout in seconds.
+            pool_size (int): Max pooled keep-alive connections.
+        """
+        super().__init__(base_url, timeout)
+        self.pool_size = pool_size
+        self._session = None
+        self._task = None
+        self._wakeup = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connect_timeout, read_timeout = self.timeout
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=False, limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout,
+                                              total=connect_timeout + read_timeout),
+            )
+        return self._session
+
+    async def fetch(self, endpoint, path=None):
+        """
+        Requests one endpoint and records its latency.
+        Args:
+            endpoint (str): Endpoint path without the leading slash.
+            path (str, optional): Request path incl. query; defaults to endpoint.
+        Returns:
+            dict, list or None: Parsed JSON if successful, else None.
+        """
+        stats = self._stats.setdefault(endpoint, LatencyStats())
+        start = time.perf_counter()
+        try:
+            async with self._get_session().get(f"{self.base_url}/{path or endpoint}") as res:
+                if res.status != 200:
+                    stats.record(time.perf_counter() - start, False)
+                    logging.debug(f"Live Client '{endpoint}' returned status {res.status}.")
+                    return None
+                data = decode_json(await res.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            stats.record(time.perf_counter() - start, False)
+            logging.debug(f"Live Client '{endpoint}' request failed: {e}")
+            return None
+        stats.record(time.perf_counter() - start, True)
+        return data
+
+    async def poll_once(self, now=None):
+        """
+        Polls every subscription that is due, concurrently.
+        Returns:
+            float: Seconds until the next subscription is due.
+        """
+        now = now if now is not None else time.monotonic()
+        due = self._due_subscriptions(now)
+        results = await asyncio.gather(*(self.fetch(endpoint, path) for endpoint, _, path in due))
+        for (endpoint, sub, _), data in zip(due, results):
+            self._handle_result(endpoint, sub, data, now)
+        return self._seconds_until_next()
+
+    async def run(self):
+        """
+        Polls until the task is cancelled or stop() is called.
+        """
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                wait = await self.poll_once()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+        finally:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+
+    def start(self, loop=None):
+        """
+        Schedules run() on the event loop. Must be called from the loop's thread.
+        Returns:
+            asyncio.Task: The polling task.
+        """
+        if self._task is None or self._task.done():
+            self._task = (loop or asyncio.get_running_loop()).create_task(self.run())
+        return self._task
+
+    def subscribe(self, endpoint, interval=0.2, callback=None, path=None):
+        super().subscribe(endpoint, interval, callback, path)
+        # New subscriptions may come from the game-loop thread; poll them promptly
+        if self._task is not None and self._wakeup is not None and not self._task.done():
+            self._task.get_loop().call_soon_threadsafe(self._wakeup.set)
+
+    async def stop(self):
+        """
+        Cancels the polling task and closes the session, also when the task
+        already ended on an error. main.py's stop_live_client() calls this from
+        end_game() and from the connector's close handler, so the session never
+        outlives the lcu_driver event loop.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logging.error(f"Live Client polling failed: {e}")
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+# ===========================
+# Event Ingestion
+# ===========================
+
+# One Live Client event; data holds the event-specific fields (KillerName, VictimName, ...)
+GameEvent = namedtuple("GameEvent", ["event_id", "name", "time", "data"])
+
+
+class EventLog:
+    """
+    In-memory, append-only log of Live Client events with per-type indexes.
+    Events arrive in EventID order, which is also game-time order.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._events = []
+            self._times = []
+            self._by_name = {}
+            self.last_event_id = -1
+
+    def ingest(self, raw_events):
+        """
+        Appends raw eventdata entries newer than the last seen EventID.
+        Args:
+            raw_events (list): Live Client event dicts.
+        Returns:
+            list[GameEvent]: The events that were new.
+        """
+        new_events = []
+        with self._lock:
+            for raw in raw_events:
+                event_id = raw.get("EventID", -1)
+                if event_id <= self.last_event_id:
+                    continue
+                data = {k: v for k, v in raw.items() if k not in ("EventID", "EventName", "EventTime")}
+                event = GameEvent(event_id, raw.get("EventName"), raw.get("EventTime", 0.0), data)
+                self._events.append(event)
+                self._times.append(event.time)
+                index = self._by_name.setdefault(event.name, ([], []))
+                index[0].append(event)
+                index[1].append(event.time)
+                self.last_event_id = event_id
+                new_events.append(event)
+        return new_events
+
+    def since(self, event_time=0.0, name=None):
+        """
+        Returns events at or after a game time, optionally of one type.
+        Args:
+            event_time (float): Game time in seconds.
+            name (str, optional): EventName filter, e.g. "ChampionKill".
+        Returns:
+            list[GameEvent]: Matching events in order.
+        """
+        with self._lock:
+            if name is None:
+                events, times = self._events, self._times
+            else:
+                events, times = self._by_name.get(name, ([], []))
+            return events[bisect.bisect_left(times, event_time):]
+
+    def latest(self, name=None):
+        """
+        Returns:
+            GameEvent or None: The newest event, optionally of one type.
+        """
+        with self._lock:
+            events = self._events if name is None else self._by_name.get(name, ([], []))[0]
+            return events[-1] if events else None
+
+    def __len__(self):
+        return len(self._events)
+
+
+class EventIngestor:
+    """
+    Pulls only new events from /eventdata?eventID=N so each poll costs the
+    same however long the game runs, and feeds them into an EventLog.
+    """
+
+    def __init__(self, poller, event_log=None, interval=0.5, callback=None):
+        """
+        Args:
+            poller (LiveClientPoller): Poller the eventdata subscription is added to.
+            event_log (EventLog, optional): Log to fill; a new one is created if None.
+            interval (float): Poll interval in seconds.
+            callback (callable, optional): Called with each list of new GameEvents.
+        """
+        self.poller = poller
+        self.event_log = event_log or EventLog()
+        self.callback = callback
+        poller.subscribe("eventdata", interval, self._on_events, path=self._path)
+
+    def _path(self):
+        return f"eventdata?eventID={self.event_log.last_event_id + 1}"
+
+    def _on_events(self, data):
+        raw_events = data.get("Events", []) if isinstance(data, dict) else []
+        # EventIDs restart at 0 in a new game
+        if raw_events and raw_events[0].get("EventID") == 0 and self.event_log.last_event_id > 0:
+            self.event_log.reset()
+        new_events = self.event_log.ingest(raw_events)
+        if new_events and self.callback is not None:
+            self.callback(new_events)
+
+
+# ===========================
+# Game Snapshots
+# ===========================
+
+# One champion from /playerlist
+PlayerInfo = namedtuple("PlayerInfo", ["riot_id", "champion", "team", "level", "is_dead", "position"])
+
+
+class GameSnapshot:
+    """
+    Compact view of the fields the bot uses, decoded once per poll and never
+    modified after publication.
+    seq increases with every published snapshot; captured_at is time.monotonic().
+    """
+    __slots__ = (
+        "seq", "captured_at", "level", "current_hp", "max_hp", "gold",
+        "ability_levels", "riot_id", "players",
+    )
+
+    def __init__(self, seq, captured_at, level, current_hp, max_hp, gold, ability_levels, riot_id, players):
+        self.seq = seq
+        self.captured_at = captured_at
+        self.level = level
+        self.current_hp = current_hp
+        self.max_hp = max_hp
+        self.gold = gold
+        self.ability_levels = ability_levels  # (Q, W, E, R)
+        self.riot_id = riot_id
+        self.players = players
+
+    @classmethod
+    def from_active_player(cls, active_player, players=(), seq=0, captured_at=None):
+        """
+        Builds a snapshot from an /activeplayer response and a decoded player list.
+        Args:
+            active_player (dict): /activeplayer response (or allgamedata["activePlayer"]).
+            players (tuple): PlayerInfo tuples.
+            seq (int): Sequence number.
+            captured_at (float, optional): time.monotonic() of the response.
+        Returns:
+            GameSnapshot: The snapshot.
+        """
+        stats = active_player.get("championStats") or {}
+        abilities = active_player.get("abilities") or {}
+        return cls(
+            seq,
+            captured_at if captured_at is not None else time.monotonic(),
+            active_player.get("level"),
+            stats.get("currentHealth"),
+            stats.get("maxHealth"),
+            active_player.get("currentGold"),
+            tuple((abilities.get(key) or {}).get("abilityLevel", 0) for key in ("Q", "W", "E", "R")),
+            active_player.get("riotId") or active_player.get("summonerName"),
+            tuple(players),
+        )
+
+    @classmethod
+    def from_allgamedata(cls, data, seq=0, captured_at=None):
+        """
+        Builds a snapshot from an /allgamedata response.
+        """
+        return cls.from_active_player(
+            data.get("activePlayer") or {}, decode_player_list(data.get("allPlayers") or []), seq, captured_at
+        )
+
+    @property
+    def hp_fraction(self):
+        """
+        Returns:
+            float or None: current_hp / max_hp, or None if unknown.
+        """
+        if self.current_hp is None or not self.max_hp:
+            return None
+        return self.current_hp / self.max_hp
+
+    @property
+    def age(self):
+        """
+        Returns:
+            float: Seconds since the snapshot was captured.
+        """
+        return time.monotonic() - self.captured_at
+
+    def __repr__(self):
+        return (f"GameSnapshot(seq={self.seq}, level={self.level}, hp={self.current_hp}/{self.max_hp}, "
+                f"gold={self.gold})")
+
+
+def decode_player_list(player_list):
+    """
+    Args:
+        player_list (list): /playerlist response.
+    Returns:
+        tuple: PlayerInfo tuples.
+    """
+    return tuple(
+        PlayerInfo(
+            player.get("riotId") or player.get("summonerName"),
+            player.get("championName"),
+            player.get("team"),
+            player.get("level"),
+            player.get("isDead", False),
+            player.get("position"),
+        )
+        for player in player_list
+    )
+
+
+class SnapshotPublisher:
+    """
+    Decodes poller responses into GameSnapshots and publishes them by swapping
+    a single reference, so readers on other threads always see either the
+    previous or the next complete snapshot, never a half-updated one.
+    """
+
+    def __init__(self, poller, interval=0.2, player_list_interval=1.0, callback=None):
+        """
+        Args:
+            poller (LiveClientPoller): Poller the subscriptions are added to.
+            interval (float): /activeplayer poll interval in seconds.
+            player_list_interval (float): /playerlist poll interval in seconds.
+            callback (callable, optional): Called with each new snapshot on the poller thread.
+        """
+        self.callback = callback
+        self._snapshot = None
+        self._players = ()
+        self._seq = 0
+        poller.subscribe("activeplayer", interval, self._on_active_player)
+        poller.subscribe("playerlist", player_list_interval, self._on_player_list)
+
+    def _on_player_list(self, data):
+        self._players = decode_player_list(data if isinstance(data, list) else [])
+
+    def _on_active_player(self, data):
+        self._seq += 1
+        self.publish(GameSnapshot.from_active_player(data, self._players, self._seq))
+
+    def publish(self, snapshot):
+        """
+        Makes snapshot the latest one (atomic reference swap).
+        """
+        self._snapshot = snapshot
+        if self.callback is not None:
+            self.callback(snapshot)
+
+    def latest(self, max_age=None):
+        """
+        Args:
+            max_age (float, optional): Treat older snapshots as missing.
+        Returns:
+            GameSnapshot or None: The latest snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or (max_age is not None and snapshot.age > max_age):
+            return None
+        return snapshot
+
+    def clear(self):
+        self._snapshot = None
+        self._players = ()
+
+
+# ===========================
+# State Change Events
+# ===========================
+
+LEVEL_GAINED = "level_gained"      # value: number of levels gained
+DIED = "died"
+RESPAWNED = "respawned"
+HP_CROSSED_BELOW = "hp_crossed_below"  # value: threshold fraction
+HP_CROSSED_ABOVE = "hp_crossed_above"  # value: threshold fraction
+GOLD_CHANGED = "gold_changed"      # value: gold delta
+GAME_ENDED = "game_ended"          # value: reason
+
+# A change between two consecutive snapshots
+StateChange = namedtuple("StateChange", ["kind", "value", "snapshot"])
+
+
+class StateChangeBus:
+    """
+    Diffs consecutive GameSnapshots and emits typed StateChanges to subscribers,
+    either as callbacks or through queues. Feed it from
+    SnapshotPublisher(callback=bus.process).
+    """
+
+    def __init__(self, hp_thresholds=(0.3,)):
+        """
+        Args:
+            hp_thresholds (tuple): HP fractions whose crossings are reported.
+        """
+        self.hp_thresholds = tuple(sorted(hp_thresholds))
+        self._previous = None
+        self._ended = False
+        self._callbacks = []  # (kinds or None, callback)
+        self._queues = []     # (kinds or None, queue)
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, kinds=None):
+        """
+        Calls callback(change) for every change of the given kinds (all if None).
+        """
+        with self._lock:
+            self._callbacks.append((frozenset(kinds) if kinds else None, callback))
+
+    def subscribe_queue(self, kinds=None):
+        """
+        Returns:
+            queue.SimpleQueue: Receives every change of the given kinds (all if None).
+        """
+        change_queue = queue.SimpleQueue()
+        with self._lock:
+            self._queues.append((frozenset(kinds) if kinds else None, change_queue))
+        return change_queue
+
+    def reset(self):
+        """
+        Forgets the previous snapshot, e.g. before a new game.
+        """
+        self._previous = None
+        self._ended = False
+
+    def _emit(self, changes):
+        with self._lock:
+            callbacks, queues = list(self._callbacks), list(self._queues)
+        for change in changes:
+            for kinds, change_queue in queues:
+                if kinds is None or change.kind in kinds:
+                    change_queue.put(change)
+            for kinds, callback in callbacks:
+                if kinds is None or change.kind in kinds:
+                    try:
+                        callback(change)
+                    except Exception as e:
+                        logging.error(f"State change subscriber failed on '{change.kind}': {e}")
+
+    def diff(self, previous, snapshot):
+        """
+        Args:
+            previous (GameSnapshot or None): Earlier snapshot.
+            snapshot (GameSnapshot): Newer snapshot.
+        Returns:
+            list[StateChange]: Changes from previous to snapshot.
+        """
+        changes = []
+        prev_level = previous.level if previous and previous.level is not None else 0
+        if snapshot.level is not None and snapshot.level > prev_level:
+            changes.append(StateChange(LEVEL_GAINED, snapshot.level - prev_level, snapshot))
+
+        prev_hp = previous.current_hp if previous else None
+        if snapshot.current_hp == 0 and prev_hp != 0:
+            changes.append(StateChange(DIED, None, snapshot))
+        elif prev_hp == 0 and snapshot.current_hp:
+            changes.append(StateChange(RESPAWNED, None, snapshot))
+
+        prev_fraction = previous.hp_fraction if previous else None
+        fraction = snapshot.hp_fraction
+        if prev_fraction is not None and fraction is not None:
+            for threshold in self.hp_thresholds:
+                if prev_fraction >= threshold > fraction:
+                    changes.append(StateChange(HP_CROSSED_BELOW, threshold, snapshot))
+                elif fraction >= threshold > prev_fraction:
+                    changes.append(StateChange(HP_CROSSED_ABOVE, threshold, snapshot))
+
+        if previous and previous.gold is not None and snapshot.gold is not None and snapshot.gold != previous.gold:
+            changes.append(StateChange(GOLD_CHANGED, snapshot.gold - previous.gold, snapshot))
+        return changes
+
+    def process(self, snapshot):
+        """
+        Diffs snapshot against the previous one and emits the changes.
+        Args:
+            snapshot (GameSnapshot): Newest snapshot.
+        Returns:
+            list[StateChange]: Emitted changes.
+        """
+        if self._previous is not None and snapshot.seq <= self._previous.seq:
+            return []
+        changes = self.diff(self._previous, snapshot)
+        self._previous = snapshot
+        if changes:
+            self._emit(changes)
+        return changes
+
+    def end_game(self, reason=None):
+        """
+        Emits GAME_ENDED once per game.
+        Args:
+            reason (str, optional): What ended the game, e.g. "GameEnd event".
+        """
+        if self._ended:
+            return
+        self._ended = True
+        self._emit([StateChange(GAME_ENDED, reason, self._previous)])
+
+
+def drain_queue(change_queue):
+    """
+    Returns:
+        list: Everything currently in the queue, without blocking.
+    """
+    items = []
+    while True:
+        try:
+            items.append(change_queue.get_nowait())
+        except queue.Empty:
+            return items
@@ -0,0 +1,195 @@
+import threading
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from core.constants import OCR_WORKERS
+from utils.general_utils import (
+    capture_region, create_ocr_backend, preprocess_for_ocr, ocr_data_to_lines,
+    build_word_index, remember_text_location, get_cached_text_crop, record_ocr_layout_lookups
+)
+
+
+# ===========================
+# OCR Worker Process
+# ===========================
+
+_worker_backend = None
+
+
+def _warm_up_worker():
+    """
+    Runs in a pool process; loads its OCR backend ahead of the first request.
+    """
+    global _worker_backend
+    if _worker_backend is None:
+        _worker_backend = create_ocr_backend()
+
+
+def _ocr_worker(img_thresh, target_texts=(), crops=()):
+    """
+    Runs in a pool process; each process keeps its own OCR backend alive.
+    Each crop is (target_text, crop_thresh, (x, y) offset of the crop in img_thresh);
+    the full image is only OCRed if some target text was not found in its crop.
+    Returns:
+        tuple: ({target_text: (x, y, w, h)} found in crops, relative to img_thresh,
+            image_to_data output for img_thresh or None if every text was found in a crop)
+    """
+    _warm_up_worker()
+    found = {}
+    for target_text, crop_thresh, offset in crops:
+        lines = ocr_data_to_lines(_worker_backend.image_to_data(crop_thresh), offset)
+        boxes = build_word_index(lines).get(target_text.lower())
+        if boxes:
+            found[target_text] = boxes[0]
+    if all(target_text in found for target_text in target_texts):
+        return found, None
+    return found, _worker_backend.image_to_data(img_thresh)
+
+
+# ===========================
+# Asynchronous OCR Service
+# ===========================
+
+class OcrService:
+    """
+    Runs OCR in a process pool so the game loop never blocks on Tesseract.
+    Frames are captured and preprocessed on the caller's thread (a few ms);
+    recognition happens in a worker. Each request has a query key, and a newer
+    request for the same key supersedes the older one: the old future is
+    cancelled, or its result is dropped if it was already running.
+    """
+
+    def __init__(self, max_workers=OCR_WORKERS):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._latest = {}  # query key -> the newest outer Future
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def warm_up(self):
+        """
+        Starts the worker processes and loads their OCR backends in the background,
+        so the first lookup of a game does not pay for spawning them (seconds on Windows).
+        Returns:
+            list: One Future per worker.
+        """
+        with self._lock:
+            executor = self._get_executor()
+            return [executor.submit(_warm_up_worker) for _ in range(self.max_workers)]
+
+    def submit(self, query_key, target_texts, region=None, img=None, origin=(0, 0), callback=None,
+               use_layout_cache=True):
+        """
+        Submits an OCR lookup and returns immediately.
+        Like find_text_locations, texts with a remembered location are first looked
+        for in a small crop around it; the full region is OCRed only on a miss.
+        Args:
+            query_key (str): Identifies the query; newer submissions supersede older ones.
+            target_texts (iterable): Texts to search for (case-insensitive).
+            region (str or tuple, optional): Game window region to capture (see resolve_region).
+            img (np.ndarray, optional): BGR frame to OCR instead of capturing region.
+            origin (tuple): Absolute screen (x, y) of img's top-left corner.
+            callback (callable, optional): Called with the matches dict when the lookup completes.
+            use_layout_cache (bool): Try the remembered locations first and record new ones.
+        Returns:
+            Future: Resolves to {target_text: (x, y, w, h) or None}; cancelled if superseded.
+        """
+        target_texts = tuple(target_texts)
+        if img is None:
+            img, origin = capture_region(region)
+        img_thresh = preprocess_for_ocr(img)
+        crops = []
+        for target_text in target_texts if use_layout_cache else ():
+            cached_crop = get_cached_text_crop(target_text, img, origin)
+            if cached_crop is not None:
+                crop, (crop_x, crop_y) = cached_crop
+                crops.append((target_text, preprocess_for_ocr(crop), (crop_x - origin[0], crop_y - origin[1])))
+
+        result = Future()
+        with self._lock:
+            previous = self._latest.get(query_key)
+            self._latest[query_key] = result
+            inner = self._get_executor().submit(_ocr_worker, img_thresh, target_texts, crops)
+        if previous is not None:
+            previous.cancel()
+        result.add_done_callback(lambda _: inner.cancel())
+
+        def on_done(inner_future):
+            with self._lock:
+                superseded = self._latest.get(query_key) is not result
+                if not superseded:
+                    del self._latest[query_key]
+            if superseded or inner_future.cancelled():
+                result.cancel()
+                return
+            if not result.set_running_or_notify_cancel():
+                return
+            error = inner_future.exception()
+            if error is not None:
+                logging.error(f"OCR request '{query_key}' failed: {error}")
+                result.set_exception(error)
+                return
+            found, data = inner_future.result()
+            index = build_word_index(ocr_data_to_lines(data, origin)) if data is not None else {}
+            matches = {}
+            for target_text in target_texts:
+                if target_text in found:
+                    x, y, w, h = found[target_text]
+                    matches[target_text] = (x + origin[0], y + origin[1], w, h)
+                    continue
+                boxes = index.get(target_text.lower())
+                matches[target_text] = boxes[0] if boxes else None
+                if boxes and use_layout_cache:
+                    remember_text_location(target_text, boxes[0])
+            if use_layout_cache:
+                record_ocr_layout_lookups(hits=len(found), misses=len(target_texts) - len(found))
+            result.set_result(matches)
+            if callback is not None:
+                try:
+                    callback(matches)
+                except Exception as e:
+                    logging.error(f"OCR callback for '{query_key}' failed: {e}")
+
+        inner.add_done_callback(on_done)
+        return result
+
+    def pending(self, query_key):
+        """
+        Returns:
+            Future or None: The newest unfinished request for query_key.
+        """
+        with self._lock:
+            return self._latest.get(query_key)
+
+    def shutdown(self, wait=False):
+        """
+        Cancels pending requests and stops the worker processes.
+        """
+        with self._lock:
+            futures, self._latest = list(self._latest.values()), {}
+            executor, self._executor = self._executor, None
+        for future in futures:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_ocr_service = None
+_ocr_service_lock = threading.Lock()
+
+
+def get_ocr_service():
+    """
+    Returns the process-wide OcrService, creating it on first use.
+    Returns:
+        OcrService: Shared service.
+    """
+    global _ocr_service
+    if _ocr_service is None:
+        with _ocr_service_lock:
+            if _ocr_service is None:
+                _ocr_service = OcrService()
+    return _ocr_service
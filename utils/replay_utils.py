@@ -0,0 +1,293 @@
+import bisect
+import json
+import os
+import struct
+import threading
+import time
+import logging
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+from utils.live_client_utils import BaseLiveClientPoller
+
+# File layout:
+#   header  MAGIC | codec (1 byte) | compression (1 byte) | wall-clock start (double)
+#   records [length (uint32) | payload] ...   payload = [t, endpoint, data], t relative to start
+# Index sidecar (<path>.idx): [(t, byte offset) ...] written every REPLAY_INDEX_INTERVAL seconds
+REPLAY_MAGIC = b"LCREC1"
+REPLAY_INDEX_INTERVAL = 1.0
+CODEC_JSON, CODEC_MSGPACK = 0, 1
+COMPRESSION_NONE, COMPRESSION_ZSTD = 0, 1
+
+_HEADER = struct.Struct("<6sBBd")
+_LENGTH = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<dQ")
+
+
+# ===========================
+# Record Encoding
+# ===========================
+
+def _encode(record, codec, compressor):
+    if codec == CODEC_MSGPACK:
+        payload = msgpack.packb(record, use_bin_type=True)
+    else:
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+    return compressor.compress(payload) if compressor is not None else payload
+
+
+def _decode(payload, codec, decompressor):
+    if decompressor is not None:
+        payload = decompressor.decompress(payload)
+    if codec == CODEC_MSGPACK:
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload)
+
+
+def _index_path(path):
+    return f"{path}.idx"
+
+
+# ===========================
+# Session Recorder
+# ===========================
+
+class SessionRecorder:
+    """
+    Appends every successful Live Client response to a compact replay file.
+    Records are length-prefixed msgpack (JSON if msgpack is not installed),
+    each zstd-compressed when zstandard is installed. The file is append-only,
+    so a recording cut short by a crash is still readable up to the last record.
+    """
+
+    def __init__(self, path, codec=None, compress=None):
+        """
+        Args:
+            path (str): Output file; parent folders are created.
+            codec (int, optional): CODEC_JSON or CODEC_MSGPACK; msgpack when installed.
+            compress (bool, optional): zstd-compress records; on when zstandard is installed.
+        """
+        if codec is None:
+            codec = CODEC_MSGPACK if msgpack is not None else CODEC_JSON
+        if compress is None:
+            compress = zstandard is not None
+        self.path = path
+        self.codec = codec
+        self.compression = COMPRESSION_ZSTD if compress else COMPRESSION_NONE
+        self._compressor = zstandard.ZstdCompressor(level=3) if compress else None
+        self._lock = threading.Lock()
+        self._pollers = []
+        self.records = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "wb")
+        self._index_file = open(_index_path(path), "wb")
+        self._started = time.monotonic()
+        self._file.write(_HEADER.pack(REPLAY_MAGIC, self.codec, self.compression, time.time()))
+        self._next_index_t = 0.0
+
+    def attach(self, poller):
+        """
+        Records every response the poller receives from now on.
+        Args:
+            poller (BaseLiveClientPoller): Poller to record.
+        """
+        poller.add_listener(self.record)
+        self._pollers.append(poller)
+
+    def record(self, endpoint, data, t=None):
+        """
+        Appends one response.
+        Args:
+            endpoint (str): Endpoint the response came from.
+            data: Parsed JSON response.
+            t (float, optional): Seconds since the recording started; defaults to now.
+        """
+        if t is None:
+            t = time.monotonic() - self._started
+        payload = _encode([t, endpoint, data], self.codec, self._compressor)
+        with self._lock:
+            if self._file.closed:
+                return
+            offset = self._file.tell()
+            if t >= self._next_index_t:
+                self._index_file.write(_INDEX_ENTRY.pack(t, offset))
+                self._next_index_t = t + REPLAY_INDEX_INTERVAL
+            self._file.write(_LENGTH.pack(len(payload)))
+            self._file.write(payload)
+            self.records += 1
+
+    def close(self):
+        for poller in self._pollers:
+            poller.remove_listener(self.record)
+        self._pollers = []
+        with self._lock:
+            self._file.close()
+            self._index_file.close()
+        logging.info(f"Recorded {self.records} Live Client responses to {self.path}")
+
+
+# ===========================
+# Replay Reader
+# ===========================
+
+class ReplayReader:
+    """
+    Reads a SessionRecorder file, with seeking by recording time through the index.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Recording written by SessionRecorder.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path} is not a Live Client recording.")
+        magic, self.codec, self.compression, self.started_at = _HEADER.unpack(header)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"{path} is not a Live Client recording.")
+        if self.codec == CODEC_MSGPACK and msgpack is None:
+            raise ImportError("msgpack is required to read this recording.")
+        if self.compression == COMPRESSION_ZSTD and zstandard is None:
+            raise ImportError("zstandard is required to read this recording.")
+        self._decompressor = zstandard.ZstdDecompressor() if self.compression == COMPRESSION_ZSTD else None
+        self._index_times, self._index_offsets = self._load_index()
+
+    def _load_index(self):
+        times, offsets = [], []
+        try:
+            with open(_index_path(self.path), "rb") as f:
+                for t, offset in _INDEX_ENTRY.iter_unpack(f.read()):
+                    times.append(t)
+                    offsets.append(offset)
+        except (OSError, struct.error):
+            logging.warning(f"No usable index for {self.path}; seeking scans from the start.")
+            return [], []
+        return times, offsets
+
+    def seek(self, t):
+        """
+        Positions the reader at the first indexed record at or before time t.
+        Args:
+            t (float): Seconds since the recording started.
+        """
+        i = bisect.bisect_right(self._index_times, t) - 1
+        self._file.seek(self._index_offsets[i] if i >= 0 else _HEADER.size)
+
+    def records(self, start=0.0, end=None):
+        """
+        Yields records in recording order.
+        Args:
+            start (float): Skip records before this time.
+            end (float, optional): Stop after this time.
+        Yields:
+            tuple: (t, endpoint, data)
+        """
+        self.seek(start)
+        while True:
+            prefix = self._file.read(_LENGTH.size)
+            if len(prefix) < _LENGTH.size:
+                return
+            (length,) = _LENGTH.unpack(prefix)
+            payload = self._file.read(length)
+            if len(payload) < length:
+                logging.warning(f"{self.path} ends with a truncated record.")
+                return
+            t, endpoint, data = _decode(payload, self.codec, self._decompressor)
+            if t < start:
+                continue
+            if end is not None and t > end:
+                return
+            yield t, endpoint, data
+
+    def duration(self):
+        """
+        Returns:
+            float: Time of the last record in seconds.
+        """
+        last = self._index_times[-1] if self._index_times else 0.0
+        for t, _, _ in self.records(last):
+            last = t
+        return last
+
+    def close(self):
+        self._file.close()
+
+
+class ReplayPoller(BaseLiveClientPoller):
+    """
+    Drop-in replacement for LiveClientPoller that serves a recording instead of
+    the live game. Subscribers receive the recorded responses for their
+    endpoints at the recorded times divided by speed; speed=0 replays as fast
+    as possible, for offline benchmarks and regression tests.
+    """
+
+    def __init__(self, path, speed=1.0, start=0.0, end=None):
+        """
+        Args:
+            path (str): Recording written by SessionRecorder.
+            speed (float): Playback speed; 0 for no delays.
+            start (float): Recording time to start from.
+            end (float, optional): Recording time to stop at.
+        """
+        super().__init__(base_url=f"replay://{path}")
+        self.reader = ReplayReader(path)
+        self.speed = speed
+        self.start_time = start
+        self.end_time = end
+        self.finished = threading.Event()
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def fetch(self, endpoint, path=None):
+        """
+        Returns:
+            The latest replayed response for an endpoint, or None.
+        """
+        return self._latest.get(endpoint)
+
+    def run(self, stop_event=None):
+        """
+        Replays the recording until it ends or stop_event (or stop()) is set.
+        Args:
+            stop_event (threading.Event, optional): External stop signal.
+        """
+        started = time.monotonic()
+        for t, endpoint, data in self.reader.records(self.start_time, self.end_time):
+            if self._stop_event.is_set() or (stop_event and stop_event.is_set()):
+                break
+            if self.speed > 0:
+                delay = (t - self.start_time) / self.speed - (time.monotonic() - started)
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
+            with self._lock:
+                sub = self._subscriptions.get(endpoint)
+            self._dispatch(endpoint, data, sub["callback"] if sub else None)
+        self.finished.set()
+
+    def start(self, stop_event=None):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.finished.clear()
+        self._thread = threading.Thread(target=self.run, args=(stop_event,), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        self.reader.close()
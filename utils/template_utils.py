@@ -0,0 +1,209 @@
+import glob
+import os
+import re
+import logging
+import cv2
+from core.constants import LEAGUE_GAME_WINDOW_TITLE, LABEL_TEMPLATE_THRESHOLD
+from utils.general_utils import capture_region, find_text_locations, get_window_rect
+from utils.ocr_utils import get_ocr_service
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "templates")
+
+# label -> [(grayscale template, window height it was captured at), ...]
+_templates = {}
+# (label, window height) -> [scaled grayscale templates]
+_scaled_templates = {}
+
+
+# ===========================
+# Template Storage
+# ===========================
+
+def _template_path(label, window_height):
+    return os.path.join(TEMPLATES_DIR, f"{label.upper()}_{window_height}.png")
+
+
+def load_label_templates(label):
+    """
+    Loads every stored template for a label from assets/templates.
+    Files are named <LABEL>_<window height>.png.
+    Args:
+        label (str): UI label, e.g. "SELL".
+    Returns:
+        list: [(grayscale template, window height), ...]
+    """
+    key = label.upper()
+    if key not in _templates:
+        templates = []
+        for path in sorted(glob.glob(os.path.join(TEMPLATES_DIR, f"{key}_*.png"))):
+            match = re.fullmatch(rf"{re.escape(key)}_(\d+)\.png", os.path.basename(path))
+            template = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if match and template is not None:
+                templates.append((template, int(match.group(1))))
+        _templates[key] = templates
+    return _templates[key]
+
+
+def _get_scaled_templates(label, window_height):
+    key = (label.upper(), window_height)
+    if key not in _scaled_templates:
+        scaled = []
+        for template, source_height in load_label_templates(label):
+            factor = window_height / source_height
+            if factor != 1:
+                size = (max(int(template.shape[1] * factor), 1), max(int(template.shape[0] * factor), 1))
+                template = cv2.resize(template, size, interpolation=cv2.INTER_AREA)
+            scaled.append(template)
+        _scaled_templates[key] = scaled
+    return _scaled_templates[key]
+
+
+def save_label_template(label, img, box, origin=(0, 0), window_height=None, padding=2):
+    """
+    Crops a label from a frame and stores it as a template for the current resolution.
+    Args:
+        label (str): UI label, e.g. "SELL".
+        img (np.ndarray): BGR frame the label was found in.
+        box (tuple): (x, y, w, h) of the label in absolute screen pixels.
+        origin (tuple): Absolute screen (x, y) of img's top-left corner.
+        window_height (int, optional): Game window height; defaults to the current game window.
+        padding (int): Extra pixels kept around the box.
+    Returns:
+        str: Path of the saved template.
+    """
+    if window_height is None:
+        rect = get_window_rect(LEAGUE_GAME_WINDOW_TITLE)
+        window_height = rect[3] if rect else img.shape[0]
+    x, y, w, h = box
+    x, y = x - origin[0], y - origin[1]
+    top, left = max(y - padding, 0), max(x - padding, 0)
+    crop = cv2.cvtColor(img[top:y + h + padding, left:x + w + padding], cv2.COLOR_BGR2GRAY)
+
+    os.makedirs(TEMPLATES_DIR, exist_ok=True)
+    path = _template_path(label, window_height)
+    cv2.imwrite(path, crop)
+    _templates.pop(label.upper(), None)
+    _scaled_templates.clear()
+    logging.info(f"Saved '{label}' template ({crop.shape[1]}x{crop.shape[0]}) to {path}")
+    return path
+
+
+def bootstrap_label_templates(matches, img, origin=(0, 0), window_height=None):
+    """
+    Saves a template for every label OCR found that has none for this window
+    height yet, so later lookups are served by template matching.
+    Args:
+        matches (dict): label -> (x, y, w, h) in absolute screen pixels, or None.
+        img (np.ndarray): BGR frame the labels were found in.
+        origin (tuple): Absolute screen (x, y) of img's top-left corner.
+        window_height (int, optional): Game window height; defaults to the current game window.
+    Returns:
+        list: Paths of the saved templates.
+    """
+    if window_height is None:
+        rect = get_window_rect(LEAGUE_GAME_WINDOW_TITLE)
+        window_height = rect[3] if rect else img.shape[0]
+    paths = []
+    for label, box in matches.items():
+        if box and all(height != window_height for _, height in load_label_templates(label)):
+            paths.append(save_label_template(label, img, box, origin, window_height))
+    return paths
+
+
+# ===========================
+# Label Recognition
+# ===========================
+
+def match_label(gray, label, window_height, threshold=LABEL_TEMPLATE_THRESHOLD):
+    """
+    Finds the best match of a label's templates in a grayscale frame.
+    Args:
+        gray (np.ndarray): Grayscale frame.
+        label (str): UI label.
+        window_height (int): Game window height, used to scale the templates.
+        threshold (float): Minimum normalized correlation to accept a match.
+    Returns:
+        tuple or None: ((x, y, w, h) relative to gray, score), or None below threshold.
+    """
+    best = None
+    for template in _get_scaled_templates(label, window_height):
+        th, tw = template.shape
+        if th > gray.shape[0] or tw > gray.shape[1]:
+            continue
+        result = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        if best is None or score > best[1]:
+            best = ((x, y, tw, th), score)
+    if best is None or best[1] < threshold:
+        return None
+    return best
+
+
+def find_label_locations(labels, region=None, threshold=LABEL_TEMPLATE_THRESHOLD, fallback_ocr=True):
+    """
+    Finds fixed UI labels by template matching inside a region, falling back to
+    one OCR pass for the labels without a confident template match. Labels OCR
+    finds are saved as templates (see bootstrap_label_templates).
+    Args:
+        labels (iterable): UI labels, e.g. ("EXITNOW", "EXIT").
+        region (str or tuple, optional): Game window region to search (see resolve_region).
+        threshold (float): Minimum template correlation to skip OCR.
+        fallback_ocr (bool): Run OCR for labels the templates did not find.
+    Returns:
+        dict: label -> (x, y, w, h) in absolute screen pixels, or None if not found.
+    """
+    img, (origin_x, origin_y) = capture_region(region)
+    rect = get_window_rect(LEAGUE_GAME_WINDOW_TITLE)
+    window_height = rect[3] if rect else img.shape[0]
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+    matches = {}
+    missing = []
+    for label in labels:
+        match = match_label(gray, label, window_height, threshold)
+        if match:
+            (x, y, w, h), score = match
+            matches[label] = (x + origin_x, y + origin_y, w, h)
+            logging.info(f"Template: Found '{label}' at {matches[label]} (score {score:.2f})")
+        else:
+            matches[label] = None
+            missing.append(label)
+
+    if missing and fallback_ocr:
+        ocr_matches = find_text_locations(missing, img=img, origin=(origin_x, origin_y))
+        bootstrap_label_templates(ocr_matches, img, (origin_x, origin_y), window_height)
+        matches.update(ocr_matches)
+    return matches
+
+
+def find_label_location(label, region=None, threshold=LABEL_TEMPLATE_THRESHOLD, fallback_ocr=True):
+    """
+    Finds a fixed UI label, template matching first and OCR as fallback.
+    Args:
+        label (str): UI label, e.g. "SELL".
+        region (str or tuple, optional): Game window region to search (see resolve_region).
+        threshold (float): Minimum template correlation to skip OCR.
+        fallback_ocr (bool): Run OCR if the templates did not find the label.
+    Returns:
+        tuple or None: (x, y, w, h) if found, else None.
+    """
+    return find_label_locations((label,), region, threshold, fallback_ocr)[label]
+
+
+def submit_label_ocr(query_key, labels, region=None):
+    """
+    Submits the OCR fallback for labels to the worker pool without blocking.
+    Labels it finds are saved as templates once the result arrives.
+    Args:
+        query_key (str): Identifies the query; newer submissions supersede older ones.
+        labels (iterable): UI labels, e.g. ("EXITNOW", "EXIT").
+        region (str or tuple, optional): Game window region to search (see resolve_region).
+    Returns:
+        Future: Resolves to {label: (x, y, w, h) or None}; cancelled if superseded.
+    """
+    img, origin = capture_region(region)
+    img = img.copy()  # Pooled capture buffer; must outlive the OCR request
+    return get_ocr_service().submit(
+        query_key, labels, img=img, origin=origin,
+        callback=lambda matches: bootstrap_label_templates(matches, img, origin)
+    )